@@ -0,0 +1,302 @@
+# ==========================================
+# ⏱️ REBEL AI Adaptive Timeouts - Öğrenilen Zaman Aşımları
+# ==========================================
+# Komut başına çalışma süresi dağılımını (log ölçekli histogram) tutar ve
+# zaman aşımını p99 × çarpan olarak, alt/üst sınırlar içinde hesaplar.
+# Histogramlar küçük bir SQLite dosyasında saklanır, yeniden başlatmada korunur.
+# Aynı dosyayı kullanan worker'lar örneklerini birleştirir: her flush son
+# flush'tan beri eklenen kova farklarını kayıtlı histograma ekler (tek
+# IMMEDIATE işlem) ve birleşik histogramı belleğe geri okur.
+
+import json
+import math
+import time
+import sqlite3
+import datetime
+import threading
+from typing import Dict, Any, List, Optional
+import yaml
+
+
+# Kova sınırları: 1 ms'den başlayıp %20 artarak ~1 saate kadar
+BUCKET_START = 0.001
+BUCKET_RATIO = 1.2
+BUCKET_COUNT = int(math.ceil(math.log(3600 / BUCKET_START) / math.log(BUCKET_RATIO))) + 1
+
+
+def bucket_index(seconds: float) -> int:
+    """Süreyi içeren kovanın indeksi"""
+    if seconds <= BUCKET_START:
+        return 0
+    index = int(math.ceil(math.log(seconds / BUCKET_START) / math.log(BUCKET_RATIO)))
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Kovanın üst sınırı (saniye)"""
+    return BUCKET_START * (BUCKET_RATIO ** index)
+
+
+class REBELAdaptiveTimeouts:
+    """Gözlenen süre dağılımlarından komut başına zaman aşımı"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Adaptive timeouts başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.timeout_config = self.config.get('execution', {}).get('adaptive_timeouts', {})
+        self.enabled = self.timeout_config.get('enabled', True)
+        self.percentile = self.timeout_config.get('percentile', 0.99)
+        self.factor = self.timeout_config.get('factor', 3.0)
+        self.floor = self.timeout_config.get('floor', 0.2)
+        self.ceiling = self.timeout_config.get('ceiling', 120)
+        self.min_samples = self.timeout_config.get('min_samples', 20)
+        # Bu sayıya ulaşınca tüm kovalar yarıya indirilir: eski ölçümler yavaşça unutulur
+        self.max_samples = self.timeout_config.get('max_samples', 2000)
+        self.flush_interval = self.timeout_config.get('flush_interval_seconds', 30)
+        self.overrides: Dict[str, Dict[str, float]] = self.timeout_config.get('overrides', {}) or {}
+        self.database_path = self.timeout_config.get('database', 'rebel_stats.db')
+
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        # Son okunan birleşik histogram + bu süreçte o zamandan beri eklenenler
+        self._histograms: Dict[str, List[int]] = {}
+        self._timeouts: Dict[str, int] = {}
+        # Diske henüz eklenmemiş kova ve zaman aşımı farkları
+        self._pending: Dict[str, List[int]] = {}
+        self._pending_timeouts: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._flushing = False
+
+        self._db: Optional[sqlite3.Connection] = None
+        try:
+            self._db = sqlite3.connect(self.database_path, check_same_thread=False, isolation_level=None)
+            self._init_schema()
+            self._load()
+        except sqlite3.Error as e:
+            print(f"⚠️ Zaman aşımı istatistikleri yüklenemedi, yalnızca bellekte tutulacak: {e}")
+            self._db = None
+
+        print(f"⏱️ REBEL Adaptive Timeouts initialized ({len(self._histograms)} commands learned)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _init_schema(self) -> None:
+        """İstatistik tablosunu oluştur"""
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS timing_stats (
+                key TEXT PRIMARY KEY,
+                buckets TEXT NOT NULL,
+                timeouts INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+        """)
+
+    def _read_rows(self) -> Dict[str, tuple]:
+        """Kayıtlı histogramlar: anahtar -> (kovalar, zaman aşımı sayısı)"""
+        rows = {}
+        for key, buckets, timeouts in self._db.execute("SELECT key, buckets, timeouts FROM timing_stats"):
+            histogram = json.loads(buckets)
+            if len(histogram) != BUCKET_COUNT:
+                continue  # Kova düzeni değişmiş, eski kaydı yok say
+            rows[key] = (histogram, timeouts)
+        return rows
+
+    def _load(self) -> None:
+        """Kayıtlı histogramları belleğe al"""
+        for key, (histogram, timeouts) in self._read_rows().items():
+            self._histograms[key] = histogram
+            self._timeouts[key] = timeouts
+
+    def _decay(self, histogram: List[int]) -> List[int]:
+        """max_samples'a ulaşan histogramı yarıya indir: eski ölçümler yavaşça unutulur"""
+        while sum(histogram) >= self.max_samples:
+            histogram = [count // 2 for count in histogram]
+        return histogram
+
+    def _limit(self, key: str, name: str) -> float:
+        return self.overrides.get(key, {}).get(name, getattr(self, name))
+
+    def record(self, key: str, seconds: float, timed_out: bool = False) -> None:
+        """
+        Bir çalıştırmanın süresini ekle
+
+        Zaman aşımında gerçek süre bilinmez; uygulanan zaman aşımı kaydedilir
+        (alt sınır). Bu örnek, yüzdeliği tek başına kendi kovasına taşıyacak
+        ağırlıkla eklenir: meşru uzun bir komut her zaman aşımında sınırı
+        factor kat büyütür, küçük sınırda takılı kalmaz.
+        Çalıştırma başına bir kez çağrılmalı (birleştirilen çağıranlar için değil).
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histogram = self._histograms.setdefault(key, [0] * BUCKET_COUNT)
+            weight = 1
+            if timed_out:
+                weight = int(math.ceil(sum(histogram) * (1 - self.percentile))) + 1
+            index = bucket_index(seconds)
+            histogram[index] += weight
+            self._histograms[key] = self._decay(histogram)
+            self._pending.setdefault(key, [0] * BUCKET_COUNT)[index] += weight
+            if timed_out:
+                self._timeouts[key] = self._timeouts.get(key, 0) + 1
+                self._pending_timeouts[key] = self._pending_timeouts.get(key, 0) + 1
+            should_flush = not self._flushing and time.monotonic() - self._last_flush >= self.flush_interval
+            if should_flush:
+                self._flushing = True
+
+        if should_flush:
+            # Kayıt event loop thread'inden de gelir: disk yazımı (ve kilit beklemesi) onu durdurmasın
+            threading.Thread(target=self._background_flush, name="rebel-timeouts-flush", daemon=True).start()
+
+    def _background_flush(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._flushing = False
+
+    def _percentile(self, histogram: List[int]) -> Optional[float]:
+        """Histogramdan yüzdelik (kova üst sınırı)"""
+        total = sum(histogram)
+        if total < self.min_samples:
+            return None
+        target = math.ceil(self.percentile * total)
+        cumulative = 0
+        for index, count in enumerate(histogram):
+            cumulative += count
+            if cumulative >= target:
+                return bucket_upper_bound(index)
+        return bucket_upper_bound(BUCKET_COUNT - 1)
+
+    def get_timeout(self, key: str, default: float) -> float:
+        """
+        Anahtar için zaman aşımı (saniye)
+
+        Yeterli ölçüm yoksa default kullanılır; her iki durumda da sonuç
+        floor/ceiling (ve anahtara özel override) aralığına sıkıştırılır.
+        """
+        floor = self._limit(key, 'floor')
+        ceiling = self._limit(key, 'ceiling')
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+            observed = self._percentile(histogram) if histogram else None
+
+        timeout = observed * self.factor if observed is not None else default
+        return max(floor, min(ceiling, timeout))
+
+    def flush(self) -> None:
+        """
+        Son flush'tan beri eklenen örnekleri kayıtlı histogramlara ekle, birleşik sonucu geri oku
+
+        Diğer worker'ların örnekleri korunur: satırlar üzerine yazılmaz, farklar
+        eklenir. Yazılamazsa farklar bir sonraki flush'a kalır.
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._db is None:
+                return
+            pending, self._pending = self._pending, {}
+            pending_timeouts, self._pending_timeouts = self._pending_timeouts, {}
+
+        now = datetime.datetime.now().isoformat()
+        try:
+            with self._db_lock:
+                # IMMEDIATE: oku-ekle-yaz diğer worker'ların flush'larıyla yarışmasın
+                self._db.execute("BEGIN IMMEDIATE" if pending else "BEGIN")
+                try:
+                    stored = self._read_rows()
+                    for key, delta in pending.items():
+                        histogram, timeouts = stored.get(key, ([0] * BUCKET_COUNT, 0))
+                        histogram = self._decay([count + added for count, added in zip(histogram, delta)])
+                        self._db.execute(
+                            "INSERT OR REPLACE INTO timing_stats (key, buckets, timeouts, updated_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (key, json.dumps(histogram), timeouts + pending_timeouts.get(key, 0), now)
+                        )
+                        stored[key] = (histogram, timeouts + pending_timeouts.get(key, 0))
+                    self._db.execute("COMMIT")
+                except BaseException:
+                    self._db.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            print(f"⚠️ Zaman aşımı istatistikleri yazılamadı: {e}")
+            with self._lock:
+                for key, delta in pending.items():
+                    merged = self._pending.setdefault(key, [0] * BUCKET_COUNT)
+                    self._pending[key] = [count + added for count, added in zip(merged, delta)]
+                for key, count in pending_timeouts.items():
+                    self._pending_timeouts[key] = self._pending_timeouts.get(key, 0) + count
+            return
+
+        with self._lock:
+            # Birleşik görünüm + yazım sırasında bu süreçte eklenenler
+            for key, (histogram, timeouts) in stored.items():
+                delta = self._pending.get(key)
+                if delta is not None:
+                    histogram = self._decay([count + added for count, added in zip(histogram, delta)])
+                self._histograms[key] = histogram
+                self._timeouts[key] = timeouts + self._pending_timeouts.get(key, 0)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Anahtar başına örnek sayısı, p99 ve uygulanan zaman aşımı"""
+        with self._lock:
+            snapshot = {key: list(histogram) for key, histogram in self._histograms.items()}
+            timeouts = dict(self._timeouts)
+
+        commands = {}
+        for key, histogram in sorted(snapshot.items()):
+            observed = self._percentile(histogram)
+            commands[key] = {
+                'samples': sum(histogram),
+                'timeouts': timeouts.get(key, 0),
+                'observed_percentile': observed,
+                'timeout': self.get_timeout(key, self.ceiling) if observed is not None else None
+            }
+        return {
+            'enabled': self.enabled,
+            'percentile': self.percentile,
+            'factor': self.factor,
+            'floor': self.floor,
+            'ceiling': self.ceiling,
+            'commands': commands
+        }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import random
+
+    timeouts = REBELAdaptiveTimeouts()
+
+    print("⏱️ REBEL Adaptive Timeouts Test")
+    print("=" * 40)
+
+    print(f"pwd (ölçüm yok): {timeouts.get_timeout('test:pwd', 15):.3f}s")
+    for _ in range(200):
+        timeouts.record('test:pwd', random.uniform(0.001, 0.004))
+        timeouts.record('test:find', random.uniform(5, 25))
+    print(f"pwd: {timeouts.get_timeout('test:pwd', 15):.3f}s")
+    print(f"find: {timeouts.get_timeout('test:find', 15):.3f}s")
+
+    # İkinci worker gibi davranan örnek: flush sonrası iki sürecin örnekleri birleşir
+    other = REBELAdaptiveTimeouts()
+    for _ in range(200):
+        other.record('test:find', random.uniform(5, 25))
+    timeouts.flush()
+    other.flush()
+    timeouts.flush()
+    print(f"find örnekleri (birleşik): {sum(timeouts._histograms['test:find'])} / {sum(other._histograms['test:find'])}")
+    print(f"\n📊 Durum: {timeouts.get_status()['commands']}")
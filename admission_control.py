@@ -0,0 +1,207 @@
+# ==========================================
+# 🚥 REBEL AI Admission Control - Uyarlanır Eşzamanlılık Sınırı
+# ==========================================
+# Çalıştırma isteklerini sınırlı sayıda slotla kabul eder. Slotlar doluysa
+# istek sınırlı bir bekleme kuyruğuna girer; kuyruk da doluysa (ya da
+# beklerken süre dolarsa) hemen reddedilir (503 + Retry-After).
+# Sınır AIMD ile ayarlanır: kısa vadeli gecikme uzun vadeli ortalamanın
+# tolerance katını aşarsa çarpımsal azalır, aksi halde slotlar doluyken
+# toplamsal artar.
+
+import math
+import time
+import threading
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
+import yaml
+
+
+class AdmissionTicket:
+    """Kabul edilen isteğin slotu; release() bir kez etkilidir"""
+
+    def __init__(self, controller: "REBELAdmissionController"):
+        self._controller = controller
+        self._start = time.monotonic()
+        self._released = False
+
+    def release(self, record_latency: bool = True) -> None:
+        """
+        Slotu bırak
+
+        record_latency=False: uzun ömürlü akışlar gibi süresi yük göstergesi
+        olmayan istekler sınır hesabına katılmaz.
+        """
+        if self._released:
+            return
+        self._released = True
+        latency = time.monotonic() - self._start if record_latency else None
+        self._controller._release(latency)
+
+    def __enter__(self) -> "AdmissionTicket":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+class REBELAdmissionController:
+    """Uyarlanır eşzamanlılık sınırı + sınırlı bekleme kuyruğu"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Admission controller başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.admission_config = self.config.get('admission', {})
+        self.enabled = self.admission_config.get('enabled', True)
+        self.min_limit = self.admission_config.get('min_limit', 2)
+        self.max_limit = self.admission_config.get('max_limit', 64)
+        self.max_queue = self.admission_config.get('max_queue', 32)
+        self.queue_timeout = self.admission_config.get('queue_timeout_seconds', 5.0)
+        # Kısa vadeli gecikme uzun vadelinin bu katını aşarsa aşırı yük sayılır
+        self.tolerance = self.admission_config.get('latency_tolerance', 2.0)
+        self.backoff = self.admission_config.get('backoff_ratio', 0.9)
+        self.warmup_samples = self.admission_config.get('warmup_samples', 20)
+
+        self._lock = threading.Lock()
+        self._limit = float(self.admission_config.get('initial_limit', 16))
+        self._limit = max(self.min_limit, min(self.max_limit, self._limit))
+        self._in_flight = 0
+        self._waiters: Deque[threading.Event] = deque()
+        self._short_latency: Optional[float] = None  # EWMA, alpha=0.2
+        self._long_latency: Optional[float] = None   # EWMA, alpha=0.02
+        self._samples = 0
+        self._last_decrease = 0.0
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+        print(f"🚥 REBEL Admission Control {'active' if self.enabled else 'disabled'} "
+              f"(limit={int(self._limit)}, queue={self.max_queue})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _retry_after(self) -> int:
+        """Kuyruğun boşalması için kaba tahmin (saniye, kilit tutulurken çağrılır)"""
+        latency = self._long_latency or 1.0
+        waves = (len(self._waiters) + 1) / max(1, int(self._limit))
+        return max(1, int(math.ceil(waves * latency)))
+
+    def acquire(self) -> Tuple[Optional[AdmissionTicket], int]:
+        """
+        Slot iste; gerekirse kuyrukta queue_timeout kadar bekle
+
+        Returns:
+            Tuple[bilet (reddedildiyse None), Retry-After saniyesi]
+        """
+        if not self.enabled:
+            return AdmissionTicket(self), 0
+
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._waiters:
+                self._in_flight += 1
+                self.admitted += 1
+                return AdmissionTicket(self), 0
+            if len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                return None, self._retry_after()
+            event = threading.Event()
+            self._waiters.append(event)
+            self.queued += 1
+
+        if not event.wait(self.queue_timeout):
+            with self._lock:
+                # Süre dolarken slot verilmiş olabilir
+                if not event.is_set():
+                    self._waiters.remove(event)
+                    self.rejected += 1
+                    return None, self._retry_after()
+
+        with self._lock:
+            self.admitted += 1
+        return AdmissionTicket(self), 0
+
+    def _dispatch(self) -> None:
+        """Boş slotları sıradaki bekleyenlere ver (kilit tutulurken çağrılır)"""
+        while self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            self._waiters.popleft().set()
+
+    def _release(self, latency: Optional[float]) -> None:
+        with self._lock:
+            utilized = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            if latency is not None:
+                self._update_limit(latency, utilized)
+            self._dispatch()
+
+    def _update_limit(self, latency: float, utilized: bool) -> None:
+        """AIMD: gecikme artıyorsa çarpımsal azalt, slotlar doluyken toplamsal artır"""
+        self._samples += 1
+        if self._short_latency is None:
+            self._short_latency = self._long_latency = latency
+            return
+        self._short_latency += 0.2 * (latency - self._short_latency)
+        self._long_latency += 0.02 * (latency - self._long_latency)
+        if self._samples < self.warmup_samples:
+            return
+
+        now = time.monotonic()
+        if self._short_latency > self._long_latency * self.tolerance:
+            # En fazla bir kısa vadeli gecikme süresinde bir azalt (her tamamlanmada değil)
+            if now - self._last_decrease >= self._short_latency:
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                self._last_decrease = now
+        elif utilized:
+            # Sınır başına bir slot: her "tur"da +1
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Anlık sınır, kuyruk derinliği ve sayaçlar"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'queue_depth': len(self._waiters),
+                'max_queue': self.max_queue,
+                'latency_short': self._short_latency,
+                'latency_long': self._long_latency,
+                'admitted': self.admitted,
+                'queued': self.queued,
+                'rejected': self.rejected
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    controller = REBELAdmissionController()
+    controller.queue_timeout = 0.5
+
+    print("🚥 REBEL Admission Control Test")
+    print("=" * 40)
+
+    def request(seconds: float) -> str:
+        ticket, retry_after = controller.acquire()
+        if ticket is None:
+            return f"503 (Retry-After {retry_after}s)"
+        with ticket:
+            time.sleep(seconds)
+        return "200"
+
+    with ThreadPoolExecutor(max_workers=80) as pool:
+        results = list(pool.map(request, [0.2] * 80))
+    print(f"200: {results.count('200')}, 503: {len(results) - results.count('200')}")
+    print(f"\n📊 Durum: {controller.get_status()}")
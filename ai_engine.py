@@ -5,6 +5,7 @@
 
 import os
 import json
+import time
 import yaml
 import subprocess
 import requests
@@ -12,14 +13,18 @@ import platform
 from typing import Optional, Tuple, Dict, Any
 from openai import OpenAI
 from gui_controller import REBELGUIController
+from adaptive_timeouts import REBELAdaptiveTimeouts
+from interpretation_cache import REBELInterpretationCache
 
 
 class REBELAIEngine:
-    def __init__(self, config_path: str = "rebel_config.yaml"):
-        """REBEL AI Engine başlatıcı"""
+    def __init__(self, config_path: str = "rebel_config.yaml",
+                 adaptive_timeouts: Optional[REBELAdaptiveTimeouts] = None):
+        """REBEL AI Engine başlatıcı (adaptive_timeouts: manager ile paylaşılan süre istatistikleri)"""
         self.config = self._load_config(config_path)
         self.ai_config = self.config.get('ai_engine', {})
         self.platform_name = platform.system().lower()
+        self.adaptive_timeouts = adaptive_timeouts or REBELAdaptiveTimeouts(config_path)
         
         # AI istemcilerini başlat
         self.openai_client = self._init_openai()
@@ -30,6 +35,9 @@ class REBELAIEngine:
         # GUI Controller'ı başlat
         self.gui_controller = REBELGUIController(config_path)
         
+        # Güvenilir yorumlar diskte saklanır; aynı girdi tekrar AI'ya gitmez
+        self.interpretation_cache = REBELInterpretationCache(config_path)
+        
         print(f"🤖 REBEL AI Engine initialized for {self.platform_name}")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -69,30 +77,39 @@ class REBELAIEngine:
             if gui_confident and gui_command:
                 return f"GUI:{gui_command}", gui_explanation, True
             
-            # Önce OpenAI dene
-            if self.openai_client:
-                return self._interpret_with_openai(user_input)
-            
-            # Ollama dene
-            elif self.ollama_enabled:
-                return self._interpret_with_ollama(user_input)
+            backend, model = self._active_backend()
             
-            # Oobabooga dene
-            elif self.oobabooga_enabled:
-                return self._interpret_with_oobabooga(user_input)
-            
-            # Yerel model dene
-            elif self.local_model_enabled:
-                return self._interpret_with_local_model(user_input)
-            
-            # AI yok, temel çeviri dene
-            else:
+            # AI yok, temel çeviri dene (yerel sözlük: önbelleğe gerek yok)
+            if backend == 'basic':
                 return self._interpret_basic(user_input)
+            
+            interpreters = {
+                'openai': self._interpret_with_openai,
+                'ollama': self._interpret_with_ollama,
+                'oobabooga': self._interpret_with_oobabooga,
+                'local_model': self._interpret_with_local_model
+            }
+            key = self.interpretation_cache.make_key(
+                user_input, self.platform_name, self._get_platform_shell(), backend, model
+            )
+            return self.interpretation_cache.get_or_interpret(key, lambda: interpreters[backend](user_input))
                 
         except Exception as e:
             print(f"⚠️ Komut yorumlama hatası: {e}")
             return user_input, f"❌ Hata: {str(e)}", False
     
+    def _active_backend(self) -> Tuple[str, str]:
+        """Kullanılacak yorumlayıcı ve modeli (öncelik: OpenAI, Ollama, Oobabooga, yerel model)"""
+        if self.openai_client:
+            return 'openai', self.ai_config.get('openai', {}).get('model', 'gpt-4o-mini')
+        if self.ollama_enabled:
+            return 'ollama', self.ai_config.get('ollama', {}).get('model', 'llama2')
+        if self.oobabooga_enabled:
+            return 'oobabooga', self.ai_config.get('oobabooga', {}).get('model', 'default')
+        if self.local_model_enabled:
+            return 'local_model', self.ai_config.get('local_model', {}).get('model_path', './models/ggml-model.bin')
+        return 'basic', ''
+    
     def _interpret_with_openai(self, user_input: str) -> Tuple[str, str, bool]:
         """OpenAI ile komut yorumlama"""
         try:
@@ -152,14 +169,13 @@ Platform: {self.platform_name}
 Bu komutu {self.platform_name} shell komutuna çevir. Sadece güvenli komutlar öner.
 JSON formatında yanıt ver: {{"command": "shell_komutu", "explanation": "açıklama", "confident": true/false}}"""
 
-            response = requests.post(
+            response = self._timed_post('ai:ollama', 30,
                 f"{endpoint}/api/generate",
                 json={
                     "model": model,
                     "prompt": prompt,
                     "stream": False
-                },
-                timeout=30
+                }
             )
             
             if response.status_code == 200:
@@ -190,15 +206,14 @@ Platform: {self.platform_name}
 Bu komutu güvenli shell komutuna çevir.
 JSON: {{"command": "shell_komutu", "explanation": "açıklama", "confident": true/false}}"""
 
-            response = requests.post(
+            response = self._timed_post('ai:oobabooga', 30,
                 f"{endpoint}/api/v1/generate",
                 json={
                     "prompt": prompt,
                     "max_new_tokens": 200,
                     "temperature": 0.3,
                     "stop": ["\n\n"]
-                },
-                timeout=30
+                }
             )
             
             if response.status_code == 200:
@@ -235,14 +250,21 @@ Güvenli shell komutuna çevir.
 JSON: {{"command": "shell_komutu", "explanation": "açıklama", "confident": true/false}}"""
 
             # llama.cpp çalıştır
-            process = subprocess.run([
-                executable_path,
-                "-m", model_path,
-                "-c", str(context_size),
-                "-p", prompt,
-                "--temp", "0.3",
-                "-n", "200"
-            ], capture_output=True, text=True, timeout=60)
+            timeout = self.adaptive_timeouts.get_timeout('ai:local_model', 60)
+            start_time = time.monotonic()
+            try:
+                process = subprocess.run([
+                    executable_path,
+                    "-m", model_path,
+                    "-c", str(context_size),
+                    "-p", prompt,
+                    "--temp", "0.3",
+                    "-n", "200"
+                ], capture_output=True, text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.adaptive_timeouts.record('ai:local_model', timeout, timed_out=True)
+                raise
+            self.adaptive_timeouts.record('ai:local_model', time.monotonic() - start_time)
             
             if process.returncode == 0:
                 output = process.stdout.strip()
@@ -268,6 +290,18 @@ JSON: {{"command": "shell_komutu", "explanation": "açıklama", "confident": tru
             print(f"⚠️ Yerel model hatası: {e}")
             return user_input, f"❌ Yerel model hatası: {str(e)}", False
     
+    def _timed_post(self, key: str, default_timeout: float, url: str, **kwargs) -> requests.Response:
+        """Öğrenilen zaman aşımıyla POST at, süreyi istatistiklere ekle"""
+        timeout = self.adaptive_timeouts.get_timeout(key, default_timeout)
+        start_time = time.monotonic()
+        try:
+            response = requests.post(url, timeout=timeout, **kwargs)
+        except requests.Timeout:
+            self.adaptive_timeouts.record(key, timeout, timed_out=True)
+            raise
+        self.adaptive_timeouts.record(key, time.monotonic() - start_time)
+        return response
+    
     def _interpret_basic(self, user_input: str) -> Tuple[str, str, bool]:
         """Temel yorumlama (AI olmadan)"""
         # Basit çeviriler
@@ -361,7 +395,8 @@ Türkçe olarak:
             "oobabooga_enabled": self.oobabooga_enabled,
             "local_model_enabled": self.local_model_enabled,
             "platform": self.platform_name,
-            "shell": self._get_platform_shell()
+            "shell": self._get_platform_shell(),
+            "interpretation_cache": self.interpretation_cache.get_status()
         }
 
 
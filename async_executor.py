@@ -0,0 +1,592 @@
+# ==========================================
+# ⚙️ REBEL AI Async Executor - Asenkron Komut Motoru
+# ==========================================
+# asyncio tabanlı, eşzamanlılık sınırlı alt süreç çalıştırıcı
+
+import os
+import signal
+import asyncio
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, CancelledError
+from typing import Callable, Dict, Any, List, Optional, Iterator, Tuple
+import yaml
+
+from output_capture import REBELOutputStore, OutputCapture
+from spawn_server import REBELSpawnServer
+from single_flight import SingleFlight, StreamBroadcast
+from spawn_launcher import rusage_to_dict
+from cancellation import CancellationToken
+
+
+class LaunchedProcess:
+    """Spawn launcher'da çalışan sürece asyncio.subprocess.Process benzeri arayüz"""
+
+    def __init__(self, spawn_server: REBELSpawnServer, spawned: Dict[str, Any],
+                 stdout: asyncio.StreamReader, stderr: asyncio.StreamReader):
+        self._spawn_server = spawn_server
+        self._request_id = spawned['request_id']
+        self._exit_future = spawned['exit']
+        self.pid = spawned['pid']
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+        self.rusage: Dict[str, Any] = {}
+
+    async def wait(self) -> int:
+        # shield: wait() iptal edilse bile (timeout) çıkış bildirimi kaybolmamalı
+        exit_info = await asyncio.shield(asyncio.wrap_future(self._exit_future))
+        self.returncode = exit_info['returncode']
+        self.rusage = exit_info['rusage']
+        return self.returncode
+
+    def kill(self) -> None:
+        if self.returncode is None:
+            self._spawn_server.kill(self._request_id)
+
+
+class DirectProcess:
+    """
+    Web sürecinden başlatılan ve wait4 ile toplanan süreç (rusage için)
+
+    Süreç kendi oturumunda/süreç grubunda başlar (pgid == pid); kill() ve
+    çıkıştaki temizlik tüm grubu, yani torun süreçleri de sonlandırır.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, popen: subprocess.Popen):
+        self._loop = loop
+        self._popen = popen
+        self._reaped = False
+        self._exit_future = loop.create_future()
+        self.pid = popen.pid
+        self.stdout: Optional[asyncio.StreamReader] = None
+        self.stderr: Optional[asyncio.StreamReader] = None
+        self.returncode: Optional[int] = None
+        self.rusage: Dict[str, Any] = {}
+        self._start_reaper()
+
+    def _start_reaper(self) -> None:
+        """Linux'ta pidfd ile event loop'ta, diğer platformlarda thread'de bekle"""
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.pid)
+            except OSError:
+                pidfd = None
+
+        if pidfd is not None:
+            self._loop.add_reader(pidfd, self._on_pidfd_ready, pidfd)
+        else:
+            threading.Thread(target=self._wait_blocking, name="rebel-reaper", daemon=True).start()
+
+    def _on_pidfd_ready(self, pidfd: int) -> None:
+        # pidfd okunabilir = süreç bitti; wait4 bloklamaz
+        self._loop.remove_reader(pidfd)
+        os.close(pidfd)
+        self._set_exit(*self._wait4())
+
+    def _wait_blocking(self) -> None:
+        status, rusage = self._wait4()
+        self._loop.call_soon_threadsafe(self._set_exit, status, rusage)
+
+    def _wait4(self):
+        try:
+            _, status, rusage = os.wait4(self.pid, 0)
+        except ChildProcessError:
+            status, rusage = None, None
+        self._reaped = True
+        return status, rusage
+
+    def _kill_group(self) -> None:
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _set_exit(self, status: Optional[int], rusage) -> None:
+        # Lider çıktı: arkada kalan torunlar pipe'ları açık tutmasın, CPU harcamasın
+        self._kill_group()
+        self.returncode = os.waitstatus_to_exitcode(status) if status is not None else -1
+        self.rusage = rusage_to_dict(rusage) if rusage is not None else {}
+        # Popen artık waitpid yapmasın: pid yeniden kullanılmış olabilir
+        self._popen.returncode = self.returncode
+        if not self._exit_future.done():
+            self._exit_future.set_result(self.returncode)
+
+    async def wait(self) -> int:
+        # shield: wait() iptal edilse bile (timeout) çıkış bildirimi kaybolmamalı
+        await asyncio.shield(self._exit_future)
+        return self.returncode
+
+    def kill(self) -> None:
+        # Grup, üyesi kaldıkça yeniden kullanılamaz; lider toplanmış olsa da güvenli
+        self._kill_group()
+
+
+class REBELAsyncExecutor:
+    """Tek bir event loop üzerinde çok sayıda komutu eşzamanlı çalıştıran motor"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Async executor başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.execution_config = self.config.get('execution', {})
+        self.max_concurrency = self.execution_config.get('max_concurrency', 64)
+        self.default_timeout = self.execution_config.get('timeout', 15)
+        self.stream_timeout = self.execution_config.get('stream_timeout', 300)
+        self.encoding = self.execution_config.get('encoding', 'utf-8')
+        self.stream_line_limit = 64 * 1024  # Satır sonu gelmese bile bu boyutta parçayı gönder
+
+        # Büyük çıktılar için diske taşma deposu
+        self.output_store = REBELOutputStore(config_path)
+
+        # İsteğe bağlı: komutları web sürecinden değil, hafif launcher sürecinden başlat
+        self.spawn_server = REBELSpawnServer(config_path)
+
+        # Aynı argv/env/cwd ile süren çalıştırmaya yeni süreç açmadan bağlan
+        single_flight_config = self.execution_config.get('single_flight', {})
+        self.single_flight_enabled = single_flight_config.get('enabled', True)
+        self.stream_replay_lines = single_flight_config.get('replay_lines', 1000)
+        self.single_flight = SingleFlight()
+
+        # İstatistikler
+        self._stats_lock = threading.Lock()
+        self.active_count = 0
+        self.waiting_count = 0
+        self.completed_count = 0
+        self.timeout_count = 0
+
+        # Event loop arka plan thread'inde çalışır
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="rebel-async-executor",
+            daemon=True
+        )
+        self._thread.start()
+
+        print(f"⚙️ REBEL Async Executor initialized (max_concurrency={self.max_concurrency})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _run_loop(self) -> None:
+        """Event loop'u arka planda sonsuza kadar çalıştır"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _update_stats(self, **deltas: int) -> None:
+        """Sayaçları thread-safe şekilde güncelle"""
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def _decode(self, data: bytes) -> str:
+        """Çıktıyı subprocess.run(text=True) ile aynı şekilde metne çevir"""
+        text = data.decode(self.encoding, errors='replace')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    async def _open_reader(self, fd: int) -> asyncio.StreamReader:
+        """Launcher'dan gelen pipe ucunu asyncio StreamReader'a bağla"""
+        reader = asyncio.StreamReader(loop=self._loop)
+        protocol = asyncio.StreamReaderProtocol(reader, loop=self._loop)
+        await self._loop.connect_read_pipe(lambda: protocol, os.fdopen(fd, 'rb', 0))
+        return reader
+
+    async def _create_process(self, argv: List[str], env: Optional[Dict[str, str]],
+                              cwd: Optional[str], executable: Optional[str] = None):
+        """
+        Süreci launcher üzerinden (varsa) ya da doğrudan başlat
+
+        executable verilirse PATH araması yapılmadan bu dosya çalıştırılır,
+        argv[0] programa olduğu gibi iletilir.
+        """
+        if self.spawn_server.available:
+            try:
+                spawn_future = self.spawn_server.spawn(argv, env or {}, cwd, executable)
+            except RuntimeError:
+                spawn_future = None
+
+            if spawn_future is not None:
+                spawned = await asyncio.wrap_future(spawn_future)
+                return LaunchedProcess(
+                    self.spawn_server,
+                    spawned,
+                    await self._open_reader(spawned['stdout_fd']),
+                    await self._open_reader(spawned['stderr_fd'])
+                )
+
+        if hasattr(os, 'wait4'):
+            return await self._spawn_direct(argv, env, cwd, executable)
+
+        # wait4 olmayan platformlar (Windows): rusage ölçülemez
+        return await asyncio.create_subprocess_exec(
+            *argv,
+            executable=executable,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            cwd=cwd
+        )
+
+    async def _spawn_direct(self, argv: List[str], env: Optional[Dict[str, str]],
+                            cwd: Optional[str], executable: Optional[str]) -> DirectProcess:
+        """Süreci başlat; çocuğu asyncio değil DirectProcess toplar (wait4 + rusage)"""
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        try:
+            popen = subprocess.Popen(
+                argv,
+                executable=executable,
+                stdin=subprocess.DEVNULL,
+                stdout=out_write,
+                stderr=err_write,
+                env=env,
+                cwd=cwd,
+                close_fds=True,
+                start_new_session=True
+            )
+        except BaseException:
+            os.close(out_read)
+            os.close(err_read)
+            raise
+        finally:
+            os.close(out_write)
+            os.close(err_write)
+
+        process = DirectProcess(self._loop, popen)
+        process.stdout = await self._open_reader(out_read)
+        process.stderr = await self._open_reader(err_read)
+        return process
+
+    def _resources(self, process, *captures: OutputCapture) -> Dict[str, Any]:
+        """Çocuğun CPU/bellek kullanımı (wait4 rusage) ve üretilen çıktı miktarı"""
+        return {
+            **getattr(process, 'rusage', {}),
+            'output_bytes': sum(capture.total_bytes for capture in captures)
+        }
+
+    async def _pump_capture(self, reader: asyncio.StreamReader, capture: OutputCapture) -> None:
+        """Akışı parça parça sınırlı yakalayıcıya aktar"""
+        while True:
+            chunk = await reader.read(self.stream_line_limit)
+            if not chunk:
+                break
+            capture.write(chunk)
+
+    def _capture_result(self, name: str, capture: OutputCapture) -> Dict[str, Any]:
+        """Yakalayıcıdan sonuç sözlüğü alanlarını üret"""
+        data, truncated = capture.finish()
+        return {
+            name: self._decode(data),
+            f'{name}_bytes': capture.total_bytes,
+            f'{name}_handle': capture.handle,
+            f'{name}_truncated': truncated
+        }
+
+    async def _execute(self, argv: List[str], env: Optional[Dict[str, str]],
+                       cwd: Optional[str], timeout: float,
+                       executable: Optional[str] = None) -> Dict[str, Any]:
+        """Komutu semaphore altında çalıştır ve çıktısını topla"""
+        self._update_stats(waiting_count=1)
+        async with self._semaphore:
+            self._update_stats(waiting_count=-1, active_count=1)
+            start_time = time.monotonic()
+            try:
+                process = await self._create_process(argv, env, cwd, executable)
+
+                stdout_capture = self.output_store.new_capture()
+                stderr_capture = self.output_store.new_capture()
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            self._pump_capture(process.stdout, stdout_capture),
+                            self._pump_capture(process.stderr, stderr_capture),
+                            process.wait()
+                        ),
+                        timeout
+                    )
+                except asyncio.TimeoutError:
+                    self._kill_quietly(process)
+                    await process.wait()
+                    stdout_capture.abort()
+                    stderr_capture.abort()
+                    self._update_stats(timeout_count=1)
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                except BaseException:
+                    # İptal (kimse beklemiyor) ya da hata: süreç grubunu hemen durdur
+                    self._kill_quietly(process)
+                    stdout_capture.abort()
+                    stderr_capture.abort()
+                    raise
+
+                return {
+                    **self._capture_result('stdout', stdout_capture),
+                    **self._capture_result('stderr', stderr_capture),
+                    'returncode': process.returncode,
+                    'execution_time': time.monotonic() - start_time,
+                    'resources': self._resources(process, stdout_capture, stderr_capture)
+                }
+            finally:
+                self._update_stats(active_count=-1, completed_count=1)
+
+    def _kill_quietly(self, process) -> None:
+        """Süreci (grubunu) öldür; zaten bitmişse sessizce geç"""
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+    async def _pump_lines(self, reader: asyncio.StreamReader, name: str,
+                          sink: StreamBroadcast, capture: OutputCapture) -> None:
+        """Akıştan okunan veriyi satır satır kuyruğa aktar (ve sınırlı şekilde yakala)"""
+        buffer = b''
+        while True:
+            chunk = await reader.read(self.stream_line_limit)
+            if not chunk:
+                break
+            capture.write(chunk)
+            buffer += chunk
+            while True:
+                newline = buffer.find(b'\n')
+                if newline < 0:
+                    break
+                sink.put((name, self._decode(buffer[:newline + 1])))
+                buffer = buffer[newline + 1:]
+            if len(buffer) >= self.stream_line_limit:
+                sink.put((name, self._decode(buffer)))
+                buffer = b''
+        if buffer:
+            sink.put((name, self._decode(buffer)))
+
+    async def _stream(self, argv: List[str], env: Optional[Dict[str, str]],
+                      cwd: Optional[str], timeout: float, sink: StreamBroadcast,
+                      executable: Optional[str] = None) -> None:
+        """Komutu çalıştır, çıktıyı geldikçe kuyruğa yaz, en sonda 'exit' olayı gönder"""
+        self._update_stats(waiting_count=1)
+        async with self._semaphore:
+            self._update_stats(waiting_count=-1, active_count=1)
+            start_time = time.monotonic()
+            process = None
+            try:
+                process = await self._create_process(argv, env, cwd, executable)
+
+                stdout_capture = self.output_store.new_capture()
+                stderr_capture = self.output_store.new_capture()
+                timed_out = False
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            self._pump_lines(process.stdout, 'stdout', sink, stdout_capture),
+                            self._pump_lines(process.stderr, 'stderr', sink, stderr_capture),
+                            process.wait()
+                        ),
+                        timeout
+                    )
+                except asyncio.TimeoutError:
+                    self._kill_quietly(process)
+                    await process.wait()
+                    timed_out = True
+                    self._update_stats(timeout_count=1)
+                except BaseException:
+                    stdout_capture.abort()
+                    stderr_capture.abort()
+                    raise
+
+                sink.put(('exit', {
+                    **self._capture_result('stdout', stdout_capture),
+                    **self._capture_result('stderr', stderr_capture),
+                    'returncode': process.returncode,
+                    'timed_out': timed_out,
+                    'execution_time': time.monotonic() - start_time,
+                    'resources': self._resources(process, stdout_capture, stderr_capture)
+                }))
+            except asyncio.CancelledError:
+                # Okuyan taraf vazgeçti (ör. istemci bağlantıyı kapattı)
+                if process is not None:
+                    self._kill_quietly(process)
+                    await process.wait()
+                raise
+            except Exception as e:
+                sink.put(('error', f"Komut çalıştırma hatası: {e}"))
+            finally:
+                self._update_stats(active_count=-1, completed_count=1)
+
+    def _flight_key(self, argv: List[str], env: Optional[Dict[str, str]],
+                    cwd: Optional[str], executable: Optional[str]) -> Tuple:
+        """Aynı sonucu üretecek çalıştırmaları eşleyen anahtar"""
+        return (tuple(argv), executable, cwd, tuple(sorted((env or {}).items())))
+
+    def stream(self, argv: List[str], env: Optional[Dict[str, str]] = None,
+               cwd: Optional[str] = None, timeout: Optional[float] = None,
+               executable: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Komut çıktısını satır satır üreten generator
+
+        Olaylar: ('stdout', satır), ('stderr', satır), son olarak
+        ('exit', {'returncode', 'timed_out', 'execution_time', 'resources', sınırlı stdout/stderr})
+        ya da ('error', mesaj).
+        Aynı komut zaten akıyorsa ona abone olunur: son satırlar tekrar
+        gönderilir, ardından canlı çıktı ve aynı 'exit' olayı gelir.
+        Son abone de ayrılırsa süreç öldürülür.
+        """
+        if timeout is None:
+            timeout = self.stream_timeout
+
+        def start(broadcast: StreamBroadcast) -> Future:
+            return asyncio.run_coroutine_threadsafe(
+                self._stream(list(argv), env, cwd, timeout, broadcast, executable),
+                self._loop
+            )
+
+        if self.single_flight_enabled:
+            key = self._flight_key(argv, env, cwd, executable)
+            broadcast, subscriber, _ = self.single_flight.subscribe(key, start, self.stream_replay_lines)
+        else:
+            key = None
+            broadcast = StreamBroadcast(self.stream_replay_lines)
+            subscriber = broadcast.subscribe()
+            broadcast.future = start(broadcast)
+
+        try:
+            while True:
+                event, payload = subscriber.get()
+                yield event, payload
+                if event in ('exit', 'error'):
+                    break
+        finally:
+            if key is not None:
+                self.single_flight.unsubscribe(key, broadcast, subscriber)
+            elif not broadcast.future.done():
+                broadcast.future.cancel()
+
+    def submit(self, argv: List[str], env: Optional[Dict[str, str]] = None,
+               cwd: Optional[str] = None, timeout: Optional[float] = None,
+               executable: Optional[str] = None) -> Future:
+        """
+        Komutu event loop'a gönder, bloklamadan Future döndür
+
+        Future sonucu: {'stdout', 'stderr', 'returncode', 'execution_time', 'resources'} ve her akış için
+        '<akış>_bytes', '<akış>_handle', '<akış>_truncated' alanları. Sınırı aşan
+        çıktının yalnızca baş/son penceresi döner, tamamı output_store'dan okunur.
+        Zaman aşımında subprocess.TimeoutExpired fırlatır.
+        Aynı komut zaten çalışıyorsa yeni süreç açılmaz, onun Future'ı döner
+        (sonuç sözlüğü paylaşılır, çağıranlar değiştirmemeli).
+        """
+        return self._submit(argv, env, cwd, timeout, executable)[0]
+
+    def _submit(self, argv: List[str], env: Optional[Dict[str, str]], cwd: Optional[str],
+                timeout: Optional[float], executable: Optional[str],
+                on_complete: Optional[Callable[[Future], None]] = None) -> Tuple[Future, Optional[Tuple]]:
+        """
+        submit() gövdesi; iptal için single flight anahtarını da döndürür
+
+        on_complete yalnızca süreci bu çağrı başlattıysa Future'a eklenir: birleştirilen
+        çağıranlar için tekrar çalışmaz.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        def start() -> Future:
+            return asyncio.run_coroutine_threadsafe(
+                self._execute(list(argv), env, cwd, timeout, executable),
+                self._loop
+            )
+
+        if not self.single_flight_enabled:
+            future, key, shared = start(), None, False
+        else:
+            key = self._flight_key(argv, env, cwd, executable)
+            future, shared = self.single_flight.submit(key, start)
+        if on_complete is not None and not shared:
+            future.add_done_callback(on_complete)
+        return future, key
+
+    def run(self, argv: List[str], env: Optional[Dict[str, str]] = None,
+            cwd: Optional[str] = None, timeout: Optional[float] = None,
+            executable: Optional[str] = None,
+            cancel_token: Optional[CancellationToken] = None,
+            on_complete: Optional[Callable[[Future], None]] = None) -> Dict[str, Any]:
+        """
+        Komutu çalıştır ve sonucu bekle (senkron çağıranlar için)
+
+        cancel_token iptal edilirse beklemeyi bırakır ve CancelledError fırlatır;
+        aynı sonucu bekleyen başka çağıran yoksa süreç grubu öldürülür.
+        on_complete(future): süreç bittiğinde bir kez çağrılır (yalnızca süreci başlatan
+        çağıran için; aynı çalıştırmaya bağlananlar için çağrılmaz).
+        """
+        future, key = self._submit(argv, env, cwd, timeout, executable, on_complete)
+        if cancel_token is None:
+            return future.result()
+
+        finished = threading.Event()
+        future.add_done_callback(lambda _: finished.set())
+        unregister = cancel_token.add_callback(finished.set)
+        try:
+            finished.wait()
+        finally:
+            unregister()
+
+        if not future.done():
+            if key is not None:
+                self.single_flight.release(key, future)
+            else:
+                future.cancel()
+            raise CancelledError(cancel_token.reason or "İptal edildi")
+        return future.result()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Executor durumunu döndür"""
+        with self._stats_lock:
+            return {
+                'launcher': self.spawn_server.get_status(),
+                'max_concurrency': self.max_concurrency,
+                'active': self.active_count,
+                'waiting': self.waiting_count,
+                'completed': self.completed_count,
+                'timeouts': self.timeout_count,
+                'single_flight': self.single_flight.get_status()
+            }
+
+    def shutdown(self) -> None:
+        """Event loop'u ve launcher'ı durdur"""
+        self.spawn_server.shutdown()
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    executor = REBELAsyncExecutor()
+
+    print("⚙️ REBEL Async Executor Test")
+    print("=" * 40)
+
+    start = time.time()
+    futures = [executor.submit(["sleep", "1"]) for _ in range(10)]
+    for future in futures:
+        future.result()
+    print(f"10 x 'sleep 1' eşzamanlı: {time.time() - start:.2f} saniye")
+
+    result = executor.run(["uname", "-a"])
+    print(f"uname -a: {result['stdout'].strip()} (rc={result['returncode']})")
+
+    try:
+        executor.run(["sleep", "5"], timeout=0.5)
+    except subprocess.TimeoutExpired as e:
+        print(f"Timeout yakalandı: {e}")
+
+    for event, payload in executor.stream(["ls", "-la"]):
+        print(f"[{event}] {payload!r}")
+
+    print(f"\n📊 Durum: {executor.get_status()}")
+    executor.shutdown()
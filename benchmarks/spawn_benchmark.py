@@ -0,0 +1,114 @@
+# ==========================================
+# 📈 REBEL AI Spawn Benchmark
+# ==========================================
+# Ebeveyn RSS'i büyüdükçe komut başlatma gecikmesini ölçer:
+#   fork      - subprocess + preexec_fn (vfork devre dışı, klasik fork+exec)
+#   popen     - subprocess varsayılanı (CPython uygun olduğunda vfork kullanır)
+#   launcher  - REBELSpawnServer üzerinden posix_spawn (web süreci hiç fork etmez)
+#
+# Kullanım: python benchmarks/spawn_benchmark.py --ballast-mb 0 256 1024 --iterations 200
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spawn_server import REBELSpawnServer  # noqa: E402
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+SAFE_ENV = {'PATH': '/usr/bin:/bin:/usr/local/bin', 'LANG': 'C.UTF-8', 'HOME': '/tmp'}
+
+
+def current_rss_mb() -> float:
+    """Bu sürecin anlık RSS değeri (MB)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE / (1024 * 1024)
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_ballast(size_mb: int) -> bytearray:
+    """Her sayfasına dokunulmuş bellek ayır (sayfa tablosu gerçekten büyüsün)"""
+    ballast = bytearray(size_mb * 1024 * 1024)
+    for offset in range(0, len(ballast), PAGE_SIZE):
+        ballast[offset] = 1
+    return ballast
+
+
+def spawn_fork() -> None:
+    subprocess.run(['true'], env=SAFE_ENV, preexec_fn=lambda: None, check=True)
+
+
+def spawn_popen() -> None:
+    subprocess.run(['true'], env=SAFE_ENV, check=True)
+
+
+def make_spawn_launcher(spawn_server: REBELSpawnServer):
+    def spawn_launcher() -> None:
+        spawned = spawn_server.spawn(['true'], SAFE_ENV, None).result()
+        os.close(spawned['stdout_fd'])
+        os.close(spawned['stderr_fd'])
+        spawned['exit'].result()
+    return spawn_launcher
+
+
+def measure(spawn, iterations: int) -> dict:
+    """Tek bir yöntem için gecikme dağılımını ölç (ms)"""
+    for _ in range(min(10, iterations)):
+        spawn()  # ısınma
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        spawn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        'p50': statistics.median(samples),
+        'p95': samples[int(len(samples) * 0.95) - 1],
+        'mean': statistics.fmean(samples)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REBEL AI spawn gecikmesi / ebeveyn RSS karşılaştırması")
+    parser.add_argument('--ballast-mb', type=int, nargs='+', default=[0, 256, 1024])
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    spawn_server = REBELSpawnServer()
+    if not spawn_server.available:
+        if not spawn_server.supported:
+            print("⚠️ Bu platformda launcher desteklenmiyor")
+            return
+        spawn_server.start()
+
+    methods = {
+        'fork': spawn_fork,
+        'popen': spawn_popen,
+        'launcher': make_spawn_launcher(spawn_server)
+    }
+
+    print(f"{'ballast':>8} {'rss_mb':>8} {'method':>9} {'p50_ms':>8} {'p95_ms':>8} {'mean_ms':>8}")
+    ballast = None
+    for size_mb in args.ballast_mb:
+        ballast = None
+        ballast = make_ballast(size_mb)
+        rss = current_rss_mb()
+        for name, spawn in methods.items():
+            stats = measure(spawn, args.iterations)
+            print(f"{size_mb:>8} {rss:>8.0f} {name:>9} {stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['mean']:>8.3f}")
+
+    del ballast
+    spawn_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# ==========================================
+# 📈 REBEL AI Validator Benchmark
+# ==========================================
+# Komut doğrulama hızını (doğrulama/saniye) karşılaştırır:
+#   legacy    - eski yol: _validate_user_input + _build_safe_argv, ardından
+#               is_command_safe ile ikisi tekrar (liste üzerinde flag taraması)
+#   compiled  - REBELCommandValidator, önbellek atlanarak (tek geçiş)
+#   cached    - REBELCommandValidator.validate (LRU karar önbelleği)
+#
+# Kullanım: python benchmarks/validator_benchmark.py --iterations 200000
+
+import os
+import re
+import sys
+import time
+import shlex
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from command_validator import REBELCommandValidator  # noqa: E402
+
+# Arayüzden gelen tipik karışım: çoğu tekrar eden kısa komut, bir kısmı reddedilir
+COMMANDS = [
+    "ls -la", "ps aux", "df -h", "free -h", "whoami", "uname -a", "pwd",
+    "grep -i -n error rebel_log.txt", "tail -n 50 rebel_log.txt", "cat -n README.md",
+    "rm -rf /", "ls; whoami", "ls --color", "find / -name passwd", "echo 'merhaba dünya'"
+]
+
+
+class LegacyValidator:
+    """Önceki REBELAIManager doğrulama yolunun birebir kopyası (karşılaştırma için)"""
+
+    DISALLOWED_CHARS = re.compile(r"[;&|`$()<>\n\r\x00-\x1f]")
+    MAX_COMMAND_LENGTH = 256
+
+    def __init__(self, validator: REBELCommandValidator):
+        self.allowed_commands = set(validator.allowed_commands)
+        self.blocked_commands = set(validator.blocked_commands)
+        self.allowed_flags = {command: sorted(flags) for command, flags in validator.allowed_flags.items()}
+
+    def _validate_user_input(self, user_input):
+        if not user_input:
+            raise ValueError("Boş girdi")
+        if len(user_input) > self.MAX_COMMAND_LENGTH:
+            raise ValueError("Girdi çok uzun")
+        if any(ord(c) < 32 for c in user_input if c not in '\t\n\r'):
+            raise ValueError("Geçersiz kontrol karakterleri")
+
+    def _build_safe_argv(self, cmd_str):
+        if not cmd_str or len(cmd_str) > self.MAX_COMMAND_LENGTH:
+            raise ValueError("Geçersiz komut uzunluğu")
+        if self.DISALLOWED_CHARS.search(cmd_str):
+            raise ValueError("Yasaklı karakterler tespit edildi")
+        argv = shlex.split(cmd_str, posix=True)
+        if not argv:
+            raise ValueError("Boş komut")
+        base_command = Path(argv[0]).name
+        if base_command in self.blocked_commands:
+            raise ValueError(f"Yasaklı komut: {base_command}")
+        if self.allowed_commands and base_command not in self.allowed_commands:
+            raise ValueError(f"İzinli komutlar listesinde değil: {base_command}")
+        allowed_flags_for_cmd = self.allowed_flags.get(base_command, [])
+        for arg in argv[1:]:
+            if arg.startswith('-') and arg not in allowed_flags_for_cmd:
+                raise ValueError(f"İzinli flag listesinde değil: {arg}")
+        return [base_command] + argv[1:]
+
+    def is_command_safe(self, command):
+        try:
+            self._validate_user_input(command)
+            self._build_safe_argv(command)
+            return True, "Güvenli komut"
+        except ValueError as e:
+            return False, str(e)
+
+    def validate(self, command):
+        self._validate_user_input(command)
+        argv = self._build_safe_argv(command)
+        is_safe, message = self.is_command_safe(command)
+        if not is_safe:
+            raise ValueError(message)
+        return argv
+
+
+def measure(validate, iterations: int) -> float:
+    """Doğrulama/saniye (reddedilen komutlar da sayılır)"""
+    commands = COMMANDS
+    count = len(commands)
+    start = time.perf_counter()
+    for i in range(iterations):
+        try:
+            validate(commands[i % count])
+        except ValueError:
+            pass
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REBEL AI komut doğrulama hızı karşılaştırması")
+    parser.add_argument('--iterations', type=int, default=200000)
+    args = parser.parse_args()
+
+    validator = REBELCommandValidator('linux')
+    legacy = LegacyValidator(validator)
+
+    # Aynı kararları verdiklerini doğrula
+    for command in COMMANDS:
+        _, error = validator.verdict(command)
+        legacy_safe, _ = legacy.is_command_safe(command)
+        assert legacy_safe == (error is None), command
+
+    def compiled(command):
+        argv, error = validator._compute_verdict(command)
+        if error is not None:
+            raise ValueError(error)
+        return list(argv)
+
+    methods = {
+        'legacy': legacy.validate,
+        'compiled': compiled,
+        'cached': validator.validate
+    }
+
+    baseline = None
+    print(f"{'method':>9} {'validations/s':>14} {'speedup':>8}")
+    for name, validate in methods.items():
+        rate = measure(validate, args.iterations)
+        baseline = baseline or rate
+        print(f"{name:>9} {rate:>14,.0f} {rate / baseline:>7.1f}x")
+
+    print(f"\n📊 Önbellek: {validator.get_status()}")
+
+
+if __name__ == "__main__":
+    main()
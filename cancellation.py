@@ -0,0 +1,124 @@
+# ==========================================
+# 🛑 REBEL AI Cancellation - İptal Belirteci ve Bağlantı İzleyici
+# ==========================================
+# İstek zinciri boyunca taşınan iptal belirteci; istemci bağlantıyı
+# kapattığında belirteci iptal eden soket izleyicisi.
+
+import select
+import socket
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class CancellationToken:
+    """Thread-safe iptal belirteci (iptal edilince kayıtlı geri çağrılar çalışır)"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "İptal edildi") -> None:
+        """Belirteci iptal et (tekrar çağrılırsa etkisiz)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ İptal geri çağrısı hatası: {e}")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        İptalde çağrılacak fonksiyon ekle; kaydı silen fonksiyonu döndürür
+
+        Belirteç zaten iptal edildiyse callback hemen çağrılır.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def unregister() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+                return unregister
+
+        callback()
+        return lambda: None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout)
+
+
+class DisconnectWatcher:
+    """
+    İstek işlenirken istemci soketini izleyen context manager
+
+    Soket karşı taraftan kapanırsa (recv MSG_PEEK -> b'') belirteç iptal edilir.
+    Werkzeug ('werkzeug.socket') ve gunicorn ('gunicorn.socket') soketi
+    environ'da verir; soket bulunamazsa izleme yapılmaz.
+    """
+
+    SOCKET_KEYS = ('werkzeug.socket', 'gunicorn.socket')
+
+    def __init__(self, environ: Dict[str, Any], token: CancellationToken, interval: float = 0.5):
+        self.token = token
+        self.interval = interval
+        self._socket: Optional[socket.socket] = next(
+            (environ[key] for key in self.SOCKET_KEYS if isinstance(environ.get(key), socket.socket)),
+            None
+        )
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "DisconnectWatcher":
+        if self._socket is not None:
+            self._thread = threading.Thread(target=self._watch, name="rebel-disconnect-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                readable, _, _ = select.select([self._socket], [], [], self.interval)
+                if not readable:
+                    continue
+                if self._socket.recv(1, socket.MSG_PEEK) == b'':
+                    self.token.cancel("İstemci bağlantıyı kapattı")
+                    return
+            except ConnectionError:
+                self.token.cancel("İstemci bağlantıyı kapattı")
+                return
+            except (OSError, ValueError):
+                # Kapatılmış / TLS soketi vb.: izlemeyi bırak
+                return
+            # Okunabilir ama veri var (keep-alive ile sonraki istek): bekle, tekrar bak
+            self._stopped.wait(self.interval)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("🛑 REBEL Cancellation Test")
+    print("=" * 40)
+
+    token = CancellationToken()
+    token.add_callback(lambda: print(f"Geri çağrı: {token.reason}"))
+
+    server, client = socket.socketpair()
+    with DisconnectWatcher({'werkzeug.socket': server}, token, interval=0.1):
+        client.close()
+        token.wait(2)
+    print(f"İptal edildi mi: {token.cancelled}")
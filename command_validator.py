@@ -0,0 +1,133 @@
+# ==========================================
+# 🛡️ REBEL AI Command Validator - Derlenmiş Komut Doğrulayıcı
+# ==========================================
+# security_restrictions bir kez dondurulmuş kurallara derlenir (frozenset,
+# önceden derlenmiş regex); her komut tek geçişte doğrulanır. Önünde komut
+# metni anahtarlı bir LRU karar önbelleği durur.
+
+import re
+import shlex
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
+import yaml
+
+
+# Kabul edilen komut için argv, reddedilen için hata mesajı
+Verdict = Tuple[Optional[Tuple[str, ...]], Optional[str]]
+
+
+class REBELCommandValidator:
+    """security_restrictions kurallarını uygulayan tek geçişli doğrulayıcı"""
+
+    # Kabuk meta karakterleri ve tüm kontrol karakterleri (\t, \n, \r dahil)
+    DISALLOWED_CHARS = re.compile(r"[;&|`$()<>\n\r\x00-\x1f]")
+    # Girdi doğrulamasının reddettiği kontrol karakterleri (\t, \n, \r hariç)
+    CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+    def __init__(self, platform_name: str, config_path: str = "rebel_config.yaml"):
+        """Command validator başlatıcı"""
+        self.config = self._load_config(config_path)
+        restrictions = self.config.get('security_restrictions', {})
+        self.validator_config = restrictions.get('validator', {})
+        self.posix = platform_name != 'windows'
+        self.max_length: int = self.config.get('security', {}).get('max_command_length', 256)
+
+        self.allowed_commands: FrozenSet[str] = frozenset(restrictions.get('allowed_commands', []) or [])
+        self.blocked_commands: FrozenSet[str] = frozenset(restrictions.get('blocked_commands', []) or [])
+        self.allowed_flags: Mapping[str, FrozenSet[str]] = {
+            command: frozenset(flags or [])
+            for command, flags in (restrictions.get('allowed_flags', {}) or {}).items()
+        }
+
+        self.cache_size = self.validator_config.get('cache_size', 4096)
+        self._cached_verdict = lru_cache(maxsize=self.cache_size)(self._compute_verdict)
+
+        print(f"🛡️ REBEL Command Validator initialized ({len(self.allowed_commands)} commands, cache={self.cache_size})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def check_input(self, user_input: str) -> None:
+        """Serbest metin girdisi (doğal dil dahil) için uzunluk ve kontrol karakteri kontrolü"""
+        if not user_input:
+            raise ValueError("Boş girdi")
+        if len(user_input) > self.max_length:
+            raise ValueError(f"Girdi çok uzun (max {self.max_length} karakter)")
+        if self.CONTROL_CHARS.search(user_input):
+            raise ValueError("Geçersiz kontrol karakterleri")
+
+    def _compute_verdict(self, command: str) -> Verdict:
+        """Tüm kuralları tek geçişte uygula (istisna yerine karar döner: önbelleğe alınabilir)"""
+        if not command:
+            return None, "Boş girdi"
+        if len(command) > self.max_length:
+            return None, f"Girdi çok uzun (max {self.max_length} karakter)"
+        if self.DISALLOWED_CHARS.search(command):
+            if self.CONTROL_CHARS.search(command):
+                return None, "Geçersiz kontrol karakterleri"
+            return None, "Yasaklı karakterler tespit edildi"
+
+        try:
+            argv = shlex.split(command, posix=self.posix)
+        except ValueError as e:
+            return None, f"Komut ayrıştırma hatası: {e}"
+        if not argv:
+            return None, "Boş komut"
+
+        base_command = Path(argv[0]).name
+        if base_command in self.blocked_commands:
+            return None, f"Yasaklı komut: {base_command}"
+        if self.allowed_commands and base_command not in self.allowed_commands:
+            return None, f"İzinli komutlar listesinde değil: {base_command}"
+
+        allowed_flags = self.allowed_flags.get(base_command, frozenset())
+        for arg in argv[1:]:
+            if arg.startswith('-') and arg not in allowed_flags:
+                return None, f"İzinli flag listesinde değil: {arg}"
+
+        return (base_command, *argv[1:]), None
+
+    def verdict(self, command: str) -> Verdict:
+        """Önbellekli karar: (argv, None) ya da (None, hata mesajı)"""
+        return self._cached_verdict(command)
+
+    def validate(self, command: str) -> List[str]:
+        """Komutu doğrula ve güvenli argv döndür; reddedilirse ValueError"""
+        argv, error = self._cached_verdict(command)
+        if error is not None:
+            raise ValueError(error)
+        return list(argv)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Karar önbelleği istatistikleri"""
+        info = self._cached_verdict.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'cache_size': info.maxsize,
+            'cached': info.currsize,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / lookups if lookups else 0.0
+        }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    validator = REBELCommandValidator('linux')
+
+    print("🛡️ REBEL Command Validator Test")
+    print("=" * 40)
+
+    for command in ["ls -la", "ps aux", "rm -rf /", "ls; whoami", "ls --color", "cat 'a b'", ""]:
+        argv, error = validator.verdict(command)
+        print(f"{command!r:16} -> {argv if error is None else '❌ ' + error}")
+
+    validator.validate("ls -la")
+    print(f"\n📊 Durum: {validator.get_status()}")
@@ -0,0 +1,128 @@
+# ==========================================
+# 🕸️ REBEL AI DAG Executor - Paralel Plan Çalıştırıcı
+# ==========================================
+# Scheduler'ın bağımlılık grafiğindeki bağımsız komutları eşzamanlı çalıştırır
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Any, List, Set
+import yaml
+
+from dijkstra_scheduler import CommandNode
+
+
+class REBELDAGExecutor:
+    """Bağımlılıkları biten her düğümü sınırlı bir worker havuzunda hemen başlatır"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """DAG executor başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.parallel_config = self.config.get('scheduler', {}).get('parallel', {})
+        self.enabled = self.parallel_config.get('enabled', True)
+        self.max_workers = self.parallel_config.get('max_workers', 8)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="rebel-dag"
+        )
+
+        print(f"🕸️ REBEL DAG Executor initialized (max_workers={self.max_workers})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def execute(self, nodes: List[CommandNode],
+                run_node: Callable[[CommandNode], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Düğümleri bağımlılık sırasına uyarak çalıştır
+
+        Bir düğüm, tüm bağımlılıkları bittiği anda başlatılır (başarısız olsalar bile,
+        sıralı çalıştırmadaki davranışla aynı). Sonuçlar plan sırasında döner.
+        """
+        if not nodes:
+            return []
+
+        if not self.enabled or len(nodes) == 1:
+            return [run_node(node) for node in nodes]
+
+        known_ids = {node.id for node in nodes}
+        position = {node.id: index for index, node in enumerate(nodes)}
+
+        # Bekleyen bağımlılık sayıları ve ters kenarlar
+        pending_deps: Dict[str, Set[str]] = {}
+        dependents: Dict[str, List[str]] = {node.id: [] for node in nodes}
+        for node in nodes:
+            deps = {dep for dep in node.dependencies if dep in known_ids and dep != node.id}
+            pending_deps[node.id] = deps
+            for dep in deps:
+                dependents[dep].append(node.id)
+
+        node_by_id = {node.id: node for node in nodes}
+        results: List[Any] = [None] * len(nodes)
+        running: Dict[Future, str] = {}
+        started: Set[str] = set()
+
+        def start(node_id: str) -> None:
+            started.add(node_id)
+            running[self._pool.submit(run_node, node_by_id[node_id])] = node_id
+
+        # Plan sırasında, bağımlılığı olmayanları başlat
+        for node in nodes:
+            if not pending_deps[node.id]:
+                start(node.id)
+
+        while len(started) < len(nodes) or running:
+            if not running:
+                # Döngüsel bağımlılık: plan sırasındaki ilk bekleyen düğümü zorla başlat
+                next_id = next(node.id for node in nodes if node.id not in started)
+                start(next_id)
+                continue
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                node_id = running.pop(future)
+                results[position[node_id]] = future.result()
+
+                for dependent_id in dependents[node_id]:
+                    pending_deps[dependent_id].discard(node_id)
+                    if not pending_deps[dependent_id] and dependent_id not in started:
+                        start(dependent_id)
+
+        return results
+
+    def shutdown(self) -> None:
+        """Worker havuzunu kapat"""
+        self._pool.shutdown(wait=False)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+
+    dag_executor = REBELDAGExecutor()
+
+    print("🕸️ REBEL DAG Executor Test")
+    print("=" * 40)
+
+    test_nodes = [
+        CommandNode("cmd_0", "sleep 1", [], 1.0, 1, 1.0),
+        CommandNode("cmd_1", "sleep 1", [], 1.0, 1, 1.0),
+        CommandNode("cmd_2", "sleep 1", ["cmd_0"], 1.0, 1, 1.0),
+        CommandNode("cmd_3", "sleep 1", [], 1.0, 1, 1.0),
+    ]
+
+    def fake_run(node: CommandNode) -> Dict[str, Any]:
+        thread_name = threading.current_thread().name
+        time.sleep(1)
+        return {'command': node.command, 'node': node.id, 'thread': thread_name}
+
+    start_time = time.time()
+    for result in dag_executor.execute(test_nodes, fake_run):
+        print(result)
+    print(f"Toplam süre: {time.time() - start_time:.2f} saniye (sıralı: 4 saniye)")
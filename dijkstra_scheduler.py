@@ -5,6 +5,7 @@
 
 import heapq
 import re
+import threading
 import yaml
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
@@ -45,6 +46,11 @@ class REBELDijkstraScheduler:
             'log': r'(log|journal|kayıt)'
         }
         
+        # Gerçek çalıştırmalardan öğrenilen değerler (temel komut -> EWMA)
+        self.observed_alpha = 0.2
+        self.observed_stats: Dict[str, Dict[str, float]] = {}
+        self._observed_lock = threading.Lock()
+        
         print("🧠 REBEL Dijkstra Scheduler initialized")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -167,12 +173,42 @@ class REBELDijkstraScheduler:
         
         base_time = time_estimates.get(base_command, 2.0)
         
+        # Ölçülmüş süre varsa tablodaki tahmin yerine onu kullan
+        with self._observed_lock:
+            observed = self.observed_stats.get(base_command)
+        if observed:
+            base_time = observed['execution_time']
+        
         # Komut karmaşıklığına göre ek süre
         complexity_factor = len(command.split()) * 0.2
         pipe_factor = command.count('|') * 1.0
         
         return base_time + complexity_factor + pipe_factor
     
+    def record_execution(self, command: str, execution_time: float,
+                         resources: Optional[Dict[str, Any]] = None) -> None:
+        """Gerçek çalışma süresi ve kaynak kullanımını tahminlere kat (EWMA)"""
+        base_command = command.split()[0] if command.split() else command
+        sample = {'execution_time': execution_time}
+        if resources:
+            sample['cpu_time'] = resources.get('user_time', 0.0) + resources.get('system_time', 0.0)
+            sample['max_rss_kb'] = resources.get('max_rss_kb', 0)
+        
+        with self._observed_lock:
+            stats = self.observed_stats.get(base_command)
+            if stats is None:
+                self.observed_stats[base_command] = dict(sample, samples=1)
+                return
+            for name, value in sample.items():
+                previous = stats.get(name, value)
+                stats[name] = previous + self.observed_alpha * (value - previous)
+            stats['samples'] += 1
+    
+    def get_observed_stats(self) -> Dict[str, Dict[str, float]]:
+        """Komut başına ölçülmüş ortalama süre / CPU / bellek"""
+        with self._observed_lock:
+            return {command: dict(stats) for command, stats in self.observed_stats.items()}
+    
     def detect_dependencies(self, commands: List[str]) -> Dict[str, List[str]]:
         """Komutlar arası bağımlılıkları tespit et"""
         dependencies = {}
@@ -309,19 +345,22 @@ class REBELDijkstraScheduler:
         
         return optimal_order
     
-    def optimize_command_sequence(self, user_input: str) -> Tuple[List[str], Dict[str, Any]]:
+    def build_execution_plan(self, user_input: str) -> Tuple[List[CommandNode], Dict[str, Any]]:
         """
-        Komut dizisini optimize et
+        Komut dizisini optimize et ve bağımlılıklarıyla birlikte düğüm olarak döndür
         
         Returns:
-            Tuple[optimized_commands, optimization_info]
+            Tuple[optimized_nodes, optimization_info]
         """
         # Komut zincirini çıkar
         commands = self.parse_command_chain(user_input)
         
+        # Komut grafiğini oluştur
+        nodes = self.build_command_graph(commands)
+        
         if len(commands) <= 1:
             # Tek komut, optimizasyon gerekmiyor
-            return commands, {
+            return nodes, {
                 'original_count': len(commands),
                 'optimized_count': len(commands),
                 'optimization_applied': False,
@@ -329,9 +368,6 @@ class REBELDijkstraScheduler:
                 'total_risk_score': self.calculate_risk_level(commands[0]) if commands else 0
             }
         
-        # Komut grafiğini oluştur
-        nodes = self.build_command_graph(commands)
-        
         # Dijkstra optimizasyonu uygula
         optimized_nodes = self.dijkstra_optimize(nodes)
         
@@ -345,12 +381,39 @@ class REBELDijkstraScheduler:
             'original_sequence': commands,
             'optimized_sequence': optimized_commands,
             'total_estimated_time': sum(node.estimated_time for node in optimized_nodes),
+            'critical_path_time': self.calculate_critical_path_time(nodes),
             'total_cost': sum(self.calculate_total_cost(node) for node in optimized_nodes),
             'total_risk_score': sum(node.risk_level for node in optimized_nodes),
             'dependency_graph': {node.id: node.dependencies for node in nodes}
         }
         
-        return optimized_commands, optimization_info
+        return optimized_nodes, optimization_info
+    
+    def calculate_critical_path_time(self, nodes: List[CommandNode]) -> float:
+        """Bağımsız komutlar paralel çalıştığında tahmini toplam süre (en uzun yol)"""
+        finish_times: Dict[str, float] = {}
+        node_by_id = {node.id: node for node in nodes}
+        
+        def finish_time(node_id: str, visiting: frozenset) -> float:
+            if node_id in finish_times:
+                return finish_times[node_id]
+            node = node_by_id[node_id]
+            deps = [dep for dep in node.dependencies if dep in node_by_id and dep not in visiting]
+            start = max((finish_time(dep, visiting | {node_id}) for dep in deps), default=0.0)
+            finish_times[node_id] = start + node.estimated_time
+            return finish_times[node_id]
+        
+        return max((finish_time(node.id, frozenset()) for node in nodes), default=0.0)
+    
+    def optimize_command_sequence(self, user_input: str) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Komut dizisini optimize et
+        
+        Returns:
+            Tuple[optimized_commands, optimization_info]
+        """
+        optimized_nodes, optimization_info = self.build_execution_plan(user_input)
+        return [node.command for node in optimized_nodes], optimization_info
     
     def get_optimization_report(self, optimization_info: Dict[str, Any]) -> str:
         """Optimizasyon raporu oluştur"""
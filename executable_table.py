@@ -0,0 +1,140 @@
+# ==========================================
+# 📇 REBEL AI Executable Table - Çözülmüş Komut Yolları
+# ==========================================
+# İzinli komutları başlangıçta mutlak yollara çözer; her çalıştırmada
+# PATH taranmaz. Arama dizinlerinin mtime'ı değişince tablo yenilenir.
+
+import os
+import time
+import shutil
+import datetime
+import threading
+from typing import Dict, Any, Iterable, List, Optional
+import yaml
+
+
+class REBELExecutableTable:
+    """Komut adı -> mutlak dosya yolu tablosu"""
+
+    def __init__(self, commands: Iterable[str], search_path: str, config_path: str = "rebel_config.yaml"):
+        """
+        Executable table başlatıcı
+
+        commands: çözülecek komut adları (security_restrictions.allowed_commands)
+        search_path: çocuk süreçlere verilen PATH ile aynı dizin listesi
+        """
+        self.config = self._load_config(config_path)
+        self.table_config = self.config.get('execution', {}).get('executable_table', {})
+        self.check_interval = self.table_config.get('check_interval_seconds', 2.0)
+        self.search_path = search_path
+        self.directories: List[str] = [d for d in search_path.split(os.pathsep) if d]
+        self.commands = set(commands)
+
+        self._lock = threading.Lock()
+        self._paths: Dict[str, Optional[str]] = {}
+        self._dir_mtimes: Dict[str, Optional[int]] = {}
+        self._last_check = 0.0
+        self.refresh_count = 0
+        self.last_refresh: Optional[str] = None
+
+        self.refresh()
+
+        missing = self.get_missing()
+        print(f"📇 REBEL Executable Table initialized ({len(self.commands) - len(missing)}/{len(self.commands)} resolved)")
+        if missing:
+            print(f"⚠️ Bulunamayan komutlar: {', '.join(missing)}")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _snapshot_mtimes(self) -> Dict[str, Optional[int]]:
+        """Arama dizinlerinin değişiklik zamanları (olmayan dizin: None)"""
+        mtimes: Dict[str, Optional[int]] = {}
+        for directory in self.directories:
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+        return mtimes
+
+    def refresh(self) -> None:
+        """Tüm komutları yeniden çöz"""
+        # Önce mtime alınır: çözüm sırasında olan değişiklik bir sonraki kontrolde yakalanır
+        mtimes = self._snapshot_mtimes()
+        with self._lock:
+            commands = list(self.commands)
+        paths = {command: shutil.which(command, path=self.search_path) for command in commands}
+
+        with self._lock:
+            self._paths = paths
+            self._dir_mtimes = mtimes
+            self._last_check = time.monotonic()
+            self.refresh_count += 1
+            self.last_refresh = datetime.datetime.now().isoformat()
+
+    def _check_stale(self) -> None:
+        """En fazla check_interval'da bir dizin mtime'larını kontrol et"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_check < self.check_interval:
+                return
+            self._last_check = now
+            known_mtimes = self._dir_mtimes
+
+        if self._snapshot_mtimes() != known_mtimes:
+            self.refresh()
+
+    def resolve(self, command: str) -> Optional[str]:
+        """Komutun mutlak yolunu döndür; bulunamazsa None"""
+        self._check_stale()
+        with self._lock:
+            if command in self._paths:
+                return self._paths[command]
+
+        # Tabloda olmayan komut (allowed_commands boşsa): bir kez çöz ve sakla
+        path = shutil.which(command, path=self.search_path)
+        with self._lock:
+            self.commands.add(command)
+            self._paths[command] = path
+        return path
+
+    def get_missing(self) -> List[str]:
+        """Arama yolunda bulunamayan komutlar"""
+        with self._lock:
+            return sorted(command for command, path in self._paths.items() if path is None)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Tablo durumunu döndür"""
+        missing = self.get_missing()
+        with self._lock:
+            return {
+                'search_path': self.search_path,
+                'commands': len(self._paths),
+                'resolved': len(self._paths) - len(missing),
+                'missing': missing,
+                'refreshes': self.refresh_count,
+                'last_refresh': self.last_refresh
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    table = REBELExecutableTable(["ls", "whoami", "uname", "olmayan-komut"], "/usr/bin:/bin:/usr/local/bin")
+
+    print("📇 REBEL Executable Table Test")
+    print("=" * 40)
+
+    for name in ["ls", "whoami", "olmayan-komut"]:
+        print(f"{name}: {table.resolve(name)}")
+
+    start = time.perf_counter()
+    for _ in range(100000):
+        table.resolve("ls")
+    print(f"100000 çözümleme: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"\n📊 Durum: {table.get_status()}")
@@ -0,0 +1,339 @@
+# ==========================================
+# 🕘 REBEL AI History Store - Kalıcı Komut Geçmişi
+# ==========================================
+# Başarılı komutlar SQLite'ta (WAL) tutulur: yeniden başlatmada kaybolmaz,
+# aynı dosyayı kullanan tüm gunicorn worker'ları aynı geçmişi görür.
+# Eklemeler istek yolunda yalnızca kuyruğa bırakılır; arka plan thread'i
+# toplayıp tek işlemde yazar. Sayfalama id imleciyle yapılır
+# (WHERE id < ? ORDER BY id DESC LIMIT ?): sayfa derinliğinden bağımsız
+# olarak birincil anahtar üzerinde tek aralık taraması. Komut filtresi tam
+# eşleşmedir ve (command, id) indeksinde aynı şekilde sayfalanır; önek
+# araması /api/history/suggest üzerinden yapılır (önek aralığı id sırasında
+# gezilemez, her sayfada tüm eşleşmelerin sıralanması gerekirdi).
+
+import os
+import json
+import time
+import queue
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+import yaml
+
+
+_STOP = object()
+
+
+class REBELHistoryStore:
+    """SQLite (WAL) komut geçmişi, toplu ve engellemesiz ekleme"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml", database_path: Optional[str] = None):
+        """History store başlatıcı (database_path verilmezse config'teki yol)"""
+        self.config = self._load_config(config_path)
+        self.history_config = self.config.get('history', {})
+        self.database_path = database_path or self.history_config.get('database', 'rebel_history.db')
+        self.max_rows = self.history_config.get('max_rows', 5000000)
+        self.queue_size = self.history_config.get('queue_size', 10000)
+        self.batch_size = self.history_config.get('batch_size', 256)
+        self.flush_interval = self.history_config.get('flush_interval_seconds', 0.2)
+        self.default_limit = self.history_config.get('default_limit', 50)
+        self.max_limit = self.history_config.get('max_limit', 500)
+        # Bu kadar toplu yazımda bir max_rows fazlası en eski kayıtlar silinir
+        self.prune_every = self.history_config.get('prune_every', 100)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+
+        # Okuma bağlantısı (istek thread'leri) ve yazma bağlantısı (arka plan thread'i) ayrı:
+        # WAL'da okumalar yazmayı beklemez
+        self._reader = self._connect()
+        self._init_schema()
+        self._import_legacy(self.history_config.get('import_json', 'command_history.json'))
+
+        self._thread = threading.Thread(target=self._run, name="rebel-history-writer", daemon=True)
+        self._thread.start()
+
+        print(f"🕘 REBEL History Store initialized ({self.database_path}, {self.count()} kayıt)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.database_path, timeout=5, check_same_thread=False, isolation_level=None)
+
+    def _init_schema(self) -> None:
+        """Geçmiş tablosu ve zaman / komut indeksleri"""
+        with self._lock:
+            self._reader.execute("PRAGMA journal_mode=WAL")
+            self._reader.execute("PRAGMA synchronous=NORMAL")
+            self._reader.execute("""
+                CREATE TABLE IF NOT EXISTS command_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    command TEXT NOT NULL,
+                    platform TEXT,
+                    user_input TEXT
+                )
+            """)
+            # user_input sütunu olmadan oluşturulmuş veritabanları
+            columns = {row[1] for row in self._reader.execute("PRAGMA table_info(command_history)")}
+            if 'user_input' not in columns:
+                self._reader.execute("ALTER TABLE command_history ADD COLUMN user_input TEXT")
+            self._reader.execute("CREATE INDEX IF NOT EXISTS idx_history_timestamp ON command_history (timestamp)")
+            self._reader.execute("CREATE INDEX IF NOT EXISTS idx_history_command_id ON command_history (command, id)")
+            # Eski sürümün yalnızca command indeksi: (command, id) onu kapsar
+            self._reader.execute("DROP INDEX IF EXISTS idx_history_command")
+
+    def _import_legacy(self, json_path: Optional[str]) -> None:
+        """Boş veritabanına eski command_history.json kayıtlarını bir kez aktar"""
+        if not json_path or not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            rows = sorted(
+                (str(entry['timestamp']), str(entry['command']), entry.get('platform'), None)
+                for entry in entries if isinstance(entry, dict) and entry.get('command') and entry.get('timestamp')
+            )
+            with self._lock:
+                # Boşluk kontrolü ve ekleme tek işlemde: aynı anda açılan worker'lar iki kez aktarmasın
+                self._reader.execute("BEGIN IMMEDIATE")
+                try:
+                    imported = self._reader.execute("SELECT 1 FROM command_history LIMIT 1").fetchone() is None
+                    if imported:
+                        self._reader.executemany(
+                            "INSERT INTO command_history (timestamp, command, platform, user_input) VALUES (?, ?, ?, ?)",
+                            rows
+                        )
+                    self._reader.execute("COMMIT")
+                except BaseException:
+                    self._reader.execute("ROLLBACK")
+                    raise
+            if imported:
+                print(f"🕘 {len(rows)} geçmiş kaydı {json_path} dosyasından aktarıldı")
+        except (OSError, ValueError, TypeError, KeyError, sqlite3.Error) as e:
+            print(f"⚠️ Eski geçmiş dosyası aktarılamadı ({json_path}): {e}")
+
+    def _insert(self, db: sqlite3.Connection, rows: List[Tuple[str, str, Optional[str], Optional[str]]]) -> None:
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany(
+                "INSERT INTO command_history (timestamp, command, platform, user_input) VALUES (?, ?, ?, ?)", rows
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def append(self, command: str, timestamp: str, platform: Optional[str] = None,
+               user_input: Optional[str] = None) -> bool:
+        """
+        Komutu geçmişe eklemek üzere kuyruğa bırak (veritabanı işlemi istek yolunda yapılmaz)
+
+        user_input: komutu üreten doğal dil girdisi (komut doğrudan yazıldıysa None).
+        Kuyruk doluysa kayıt atılır ve False döner.
+        """
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait((timestamp, command, platform, user_input))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def _collect(self, first: Any) -> List[Any]:
+        """İlk kayıttan başlayarak batch_size ya da flush_interval dolana kadar kayıt topla"""
+        items = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(items) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            if item is _STOP or isinstance(item, threading.Event):
+                break
+        return items
+
+    def _prune(self, db: sqlite3.Connection) -> None:
+        """max_rows'u aşan en eski kayıtları sil (id'ler ardışık: tek aralık silme)"""
+        if not self.max_rows:
+            return
+        db.execute(
+            "DELETE FROM command_history WHERE id <= (SELECT MAX(id) FROM command_history) - ?",
+            (self.max_rows,)
+        )
+
+    def _run(self) -> None:
+        db = self._connect()
+        db.execute("PRAGMA synchronous=NORMAL")
+        stopping = False
+        while not stopping:
+            items = self._collect(self._queue.get())
+            stopping = any(item is _STOP for item in items)
+            markers = [item for item in items if isinstance(item, threading.Event)]
+            rows = [item for item in items if item is not _STOP and not isinstance(item, threading.Event)]
+            if rows:
+                try:
+                    self._insert(db, rows)
+                    with self._lock:
+                        self.written += len(rows)
+                        self.batches += 1
+                        should_prune = self.batches % self.prune_every == 0
+                    if should_prune:
+                        self._prune(db)
+                except sqlite3.Error as e:
+                    with self._lock:
+                        self.errors += 1
+                    print(f"⚠️ Geçmiş yazma hatası: {e}")
+            for marker in markers:
+                marker.set()
+        db.close()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Şu ana kadar kuyruğa bırakılan kayıtlar yazılana kadar bekle"""
+        if self._closed:
+            return False
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def page(self, before: Optional[int] = None, limit: Optional[int] = None,
+             command: Optional[str] = None) -> Dict[str, Any]:
+        """
+        En yeniden eskiye bir sayfa geçmiş
+
+        before: önceki sayfanın 'next_before' değeri (bu id'den küçükler);
+        command: yalnızca bu komutun kayıtları ((command, id) indeksinde geriye tarama).
+        """
+        limit = max(1, min(limit or self.default_limit, self.max_limit))
+        clauses, params = [], []
+        if before is not None:
+            clauses.append("id < ?")
+            params.append(before)
+        if command:
+            clauses.append("command = ?")
+            params.append(command)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._reader.execute(
+                f"SELECT id, timestamp, command, platform, user_input FROM command_history {where} "
+                f"ORDER BY id DESC LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+
+        items = [
+            {'id': row[0], 'timestamp': row[1], 'command': row[2], 'platform': row[3], 'user_input': row[4]}
+            for row in rows[:limit]
+        ]
+        return {
+            'items': items,
+            'limit': limit,
+            'next_before': items[-1]['id'] if len(rows) > limit else None
+        }
+
+    def rows_after(self, after_id: int, limit: int = 10000) -> List[Tuple[int, str, str, Optional[str]]]:
+        """id'si after_id'den büyük kayıtlar, eskiden yeniye: (id, timestamp, command, user_input)"""
+        with self._lock:
+            return self._reader.execute(
+                "SELECT id, timestamp, command, user_input FROM command_history WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, limit)
+            ).fetchall()
+
+    def last_id(self) -> int:
+        """En yeni kaydın id'si (boşsa 0)"""
+        with self._lock:
+            return self._reader.execute("SELECT MAX(id) FROM command_history").fetchone()[0] or 0
+
+    def count(self) -> int:
+        """Kayıt sayısı (yalnızca en eskiler silindiği için id aralığından, O(log n))"""
+        with self._lock:
+            low, high = self._reader.execute("SELECT MIN(id), MAX(id) FROM command_history").fetchone()
+        return 0 if low is None else high - low + 1
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Yeni kayıt kabul etme, kuyruğu boşalt ve bağlantıları kapat"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # Kuyruk dolu olsa bile durdurma işareti kaybolmasın
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Kayıt sayısı, kuyruk derinliği ve yazım sayaçları"""
+        count = self.count()
+        with self._lock:
+            return {
+                'database': self.database_path,
+                'records': count,
+                'max_rows': self.max_rows,
+                'queue_depth': self._queue.qsize(),
+                'written': self.written,
+                'dropped': self.dropped,
+                'batches': self.batches,
+                'errors': self.errors
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import datetime
+    import tempfile
+
+    store = REBELHistoryStore(database_path=os.path.join(tempfile.mkdtemp(), "rebel_test_history.db"))
+
+    print("🕘 REBEL History Store Test")
+    print("=" * 40)
+
+    base = datetime.datetime.now()
+    start = time.perf_counter()
+    for i in range(100000):
+        store.append(['ls -la', 'whoami', 'ps aux', 'df -h'][i % 4], (base + datetime.timedelta(seconds=i)).isoformat(), 'linux')
+        if i % 5000 == 4999:
+            store.flush()
+    store.flush()
+    print(f"100000 ekleme (flush dahil): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    cursor, pages = None, 0
+    start = time.perf_counter()
+    while pages < 200:
+        result = store.page(before=cursor, limit=50)
+        pages += 1
+        cursor = result['next_before']
+        if cursor is None:
+            break
+    print(f"{pages} sayfa: {(time.perf_counter() - start) * 1000:.1f} ms, son imleç {cursor}")
+
+    cursor, pages = None, 0
+    start = time.perf_counter()
+    while pages < 200:
+        result = store.page(before=cursor, limit=50, command='ps aux')
+        pages += 1
+        cursor = result['next_before']
+        if cursor is None:
+            break
+    print(f"'ps aux' filtreli {pages} sayfa: {(time.perf_counter() - start) * 1000:.1f} ms, son imleç {cursor}")
+    store.shutdown()
+    print(f"\n📊 Durum: {store.get_status()}")
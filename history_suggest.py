@@ -0,0 +1,249 @@
+# ==========================================
+# 🔮 REBEL AI History Suggest - Önek İndeksli Otomatik Tamamlama
+# ==========================================
+# Geçmişteki komutlar ve doğal dil girdileri için önek indeksi. Her girdinin
+# puanı yakınlık ağırlıklı sıklıktır: her kullanım 2^(-(şimdi - t) / yarı_ömür)
+# katkı verir. Puan log uzayında tutulur (log Σ e^(t/τ)): "şimdi" tüm
+# girdiler için ortak çarpan olduğundan sıralama zamanla değişmez ve yeni
+# kullanım puanı yalnızca artırır. Bu sayede trie düğümlerinde tutulan
+# en iyi k listeleri yalnızca değişen girdinin yolunda güncellenir;
+# sorgu önek uzunluğu kadar adımdır. index_depth'ten uzun önekler için
+# sıralı anahtar dizisinde bisect ile aralık bulunur.
+#
+# Kaynak: REBELHistoryStore. Yeni kayıtlar (başka worker'larınkiler dahil)
+# en fazla refresh_seconds'ta bir id imleciyle okunur.
+
+import math
+import time
+import bisect
+import heapq
+import datetime
+import threading
+from typing import Dict, Any, List, Optional
+import yaml
+
+from history_store import REBELHistoryStore
+
+
+class REBELHistorySuggester:
+    """Yakınlık ağırlıklı sıklıkla sıralanan önek önerileri"""
+
+    def __init__(self, history_store: REBELHistoryStore, config_path: str = "rebel_config.yaml"):
+        """History suggester başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.suggest_config = self.config.get('history', {}).get('suggest', {})
+        self.max_results = self.suggest_config.get('max_results', 10)
+        self.index_depth = self.suggest_config.get('index_depth', 8)
+        self.max_entries = self.suggest_config.get('max_entries', 50000)
+        self.load_rows = self.suggest_config.get('load_rows', 200000)
+        self.refresh_seconds = self.suggest_config.get('refresh_seconds', 1.0)
+        half_life_hours = self.suggest_config.get('half_life_hours', 72)
+        # e^(t/τ) her yarı ömürde ikiye katlanır
+        self.tau = half_life_hours * 3600 / math.log(2)
+        self.history_store = history_store
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._reset()
+        self._last_id = max(0, history_store.last_id() - self.load_rows)
+        self._last_refresh = 0.0
+        self.refresh()
+
+        print(f"🔮 REBEL History Suggest initialized ({len(self._texts)} girdi)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _reset(self) -> None:
+        """Boş indeks (kilit tutulurken ya da başlatıcıda çağrılır)"""
+        self._ids: Dict[str, int] = {}     # anahtar (casefold) -> girdi no
+        self._texts: List[str] = []        # en son kullanılan yazım
+        self._keys: List[str] = []
+        self._scores: List[float] = []     # log Σ e^(t/τ)
+        self._counts: List[int] = []
+        self._last_used: List[float] = []
+        self._sorted_keys: List[str] = []
+        self._root: list = [{}, []]        # [çocuklar, en iyi k girdi no]
+
+    # ------------------------------------------------------------------
+    # İndeks bakımı
+    # ------------------------------------------------------------------
+
+    def _promote(self, top: List[int], entry: int) -> None:
+        """Puanı artan girdiyi düğümün en iyi k listesine yerleştir"""
+        if entry in top:
+            top.remove(entry)
+        elif len(top) >= self.max_results and self._scores[entry] <= self._scores[top[-1]]:
+            return
+        score = self._scores[entry]
+        position = 0
+        while position < len(top) and self._scores[top[position]] >= score:
+            position += 1
+        top.insert(position, entry)
+        del top[self.max_results:]
+
+    def _entry(self, text: str, key: str) -> int:
+        """Anahtarın girdi numarası; yoksa puanı -inf yeni girdi (kilit tutulurken çağrılır)"""
+        entry = self._ids.get(key)
+        if entry is None:
+            entry = len(self._texts)
+            self._ids[key] = entry
+            self._texts.append(text)
+            self._keys.append(key)
+            self._scores.append(-math.inf)
+            self._counts.append(0)
+            self._last_used.append(0.0)
+            bisect.insort(self._sorted_keys, key)
+        return entry
+
+    def _index(self, entry: int) -> None:
+        """Puanı artan girdiyi kökten index_depth derinliğine kadar yolundaki düğümlere yerleştir"""
+        node = self._root
+        self._promote(node[1], entry)
+        for char in self._keys[entry][:self.index_depth]:
+            node = node[0].setdefault(char, [{}, []])
+            self._promote(node[1], entry)
+
+    def _add(self, text: str, timestamp: float) -> None:
+        """Tek kullanımı indekse ekle (kilit tutulurken çağrılır)"""
+        text = text.strip()
+        if not text:
+            return
+        entry = self._entry(text, text.casefold())
+        weight = timestamp / self.tau
+        score = self._scores[entry]
+        # log(e^a + e^b), taşmadan
+        self._scores[entry] = weight if score == -math.inf else \
+            max(score, weight) + math.log1p(math.exp(-abs(score - weight)))
+        self._counts[entry] += 1
+        if timestamp >= self._last_used[entry]:
+            self._last_used[entry] = timestamp
+            self._texts[entry] = text
+        self._index(entry)
+
+    def _compact(self) -> None:
+        """max_entries aşıldıysa en yüksek puanlı girdilerle indeksi yeniden kur (kilit tutulurken)"""
+        keep = heapq.nlargest(int(self.max_entries * 0.8), range(len(self._texts)), key=self._scores.__getitem__)
+        entries = [(self._texts[i], self._keys[i], self._scores[i], self._counts[i], self._last_used[i]) for i in keep]
+        self._reset()
+        for text, key, score, count, last_used in entries:
+            entry = self._entry(text, key)
+            self._scores[entry], self._counts[entry], self._last_used[entry] = score, count, last_used
+            self._index(entry)
+
+    def refresh(self) -> int:
+        """
+        Geçmişe son okumadan beri eklenen kayıtları indekse al; eklenen kayıt sayısı
+
+        Aynı anda tek okuma: başka thread okuyorsa hemen döner (kayıtlar iki kez sayılmaz).
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_refresh = time.monotonic()
+            added = 0
+            while True:
+                rows = self.history_store.rows_after(self._last_id)
+                if not rows:
+                    break
+                with self._lock:
+                    for _, timestamp, command, user_input in rows:
+                        try:
+                            moment = datetime.datetime.fromisoformat(timestamp).timestamp()
+                        except (TypeError, ValueError):
+                            continue
+                        self._add(command, moment)
+                        if user_input and user_input != command:
+                            self._add(user_input, moment)
+                    self._last_id = rows[-1][0]
+                    if len(self._texts) > self.max_entries:
+                        self._compact()
+                added += len(rows)
+            return added
+        finally:
+            self._refresh_lock.release()
+
+    # ------------------------------------------------------------------
+    # Sorgu
+    # ------------------------------------------------------------------
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Öneke uyan girdiler, yakınlık ağırlıklı sıklığa göre azalan"""
+        if time.monotonic() - self._last_refresh >= self.refresh_seconds:
+            self.refresh()
+        limit = max(1, min(limit or self.max_results, self.max_results))
+        key = prefix.strip().casefold()
+        now = time.time() / self.tau
+
+        with self._lock:
+            if len(key) <= self.index_depth:
+                node = self._root
+                for char in key:
+                    node = node[0].get(char)
+                    if node is None:
+                        return []
+                entries = node[1][:limit]
+            else:
+                low = bisect.bisect_left(self._sorted_keys, key)
+                high = bisect.bisect_left(self._sorted_keys, key + '\U0010ffff')
+                entries = heapq.nlargest(
+                    limit, (self._ids[k] for k in self._sorted_keys[low:high]), key=self._scores.__getitem__
+                )
+            return [{
+                'text': self._texts[entry],
+                # Şu anki ağırlık: Σ 2^(-(şimdi - t) / yarı_ömür)
+                'score': round(math.exp(self._scores[entry] - now), 4),
+                'count': self._counts[entry],
+                'last_used': datetime.datetime.fromtimestamp(self._last_used[entry]).isoformat()
+            } for entry in entries]
+
+    def get_status(self) -> Dict[str, Any]:
+        """İndeks boyutu ve son okunan geçmiş kaydı"""
+        with self._lock:
+            return {
+                'entries': len(self._texts),
+                'max_entries': self.max_entries,
+                'index_depth': self.index_depth,
+                'half_life_hours': self.tau * math.log(2) / 3600,
+                'last_history_id': self._last_id
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    store = REBELHistoryStore(database_path=os.path.join(tempfile.mkdtemp(), "rebel_test_history.db"))
+    base = datetime.datetime.now() - datetime.timedelta(days=30)
+    words = ['ls', 'ps', 'df', 'grep', 'find', 'cat', 'tail', 'du', 'whoami', 'uname']
+    for i in range(60000):
+        command = f"{random.choice(words)} -{random.choice('lahnr')} /var/log/app{random.randint(0, 4000)}"
+        store.append(command, (base + datetime.timedelta(seconds=i * 40)).isoformat(), 'linux',
+                     user_input=f"dosyaları listele {i % 50}" if i % 10 == 0 else None)
+        if i % 5000 == 4999:
+            store.flush()
+    store.flush()
+
+    start = time.perf_counter()
+    suggester = REBELHistorySuggester(store)
+    print(f"İndeks kurulumu: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print("🔮 REBEL History Suggest Test")
+    print("=" * 40)
+
+    for prefix in ['', 'g', 'ps -a', 'dosya', 'tail -n /var/log/app12']:
+        start = time.perf_counter()
+        for _ in range(1000):
+            results = suggester.suggest(prefix, 5)
+        elapsed_us = (time.perf_counter() - start) / 1000 * 1e6
+        print(f"{prefix!r:28} {elapsed_us:6.1f} µs -> {[r['text'] for r in results[:3]]}")
+    store.shutdown()
+    print(f"\n📊 Durum: {suggester.get_status()}")
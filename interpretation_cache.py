@@ -0,0 +1,316 @@
+# ==========================================
+# 🧠 REBEL AI Interpretation Cache - Kalıcı Yorumlama Önbelleği
+# ==========================================
+# Aynı doğal dil girdisinin (ör. "ben kimim") her seferinde AI'ya tekrar
+# gönderilmesini önler. Anahtar: normalleştirilmiş girdi + platform + shell
+# + backend + model. Yalnızca güvenilir (confident) yorumlar saklanır.
+# Bellekte LRU + TTL; arkada SQLite (WAL): yeniden başlatmada korunur ve
+# aynı dosyayı kullanan worker'lar birbirinin sonuçlarını görür. Aynı
+# anahtarla süren bir AI çağrısı varsa yeni istekler ona bağlanır (tek çağrı).
+
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Optional, Tuple
+import yaml
+
+from single_flight import SingleFlight
+
+
+Interpretation = Tuple[str, str, bool]
+
+# Normalleştirme değişince artırılır: eski anahtarlarla yazılmış kayıtlar bir daha eşleşmez
+KEY_VERSION = 2
+
+WHITESPACE = re.compile(r"\s+")
+# Tırnak içindeki metin ("a  b") olduğu gibi kalır
+QUOTED = re.compile(r"(\"[^\"]*\"|'[^']*')")
+# Yalnızca kelimeden sonra gelen soru/ünlem: "kimim?" -> "kimim"; "ls .", "ls .." dokunulmaz
+TRAILING_PUNCTUATION = re.compile(r"(?<=\w)[?!…]+$")
+
+
+def normalize_input(user_input: str) -> str:
+    """
+    Anlamı değiştirmeyen farkları kaldır: Unicode biçimi, tırnak dışı boşluk, sondaki soru/ünlem
+
+    Büyük/küçük harf korunur ('ls -R' / 'ls -r', 'README.md' / 'readme.md' farklı
+    komutlardır); nokta hiç silinmez ('ls .', 'ls ..').
+    """
+    text = unicodedata.normalize('NFKC', user_input).strip()
+    parts = QUOTED.split(text)
+    # split sonrası tek indeksler tırnaklı parçalardır
+    text = ''.join(part if i % 2 else WHITESPACE.sub(' ', part) for i, part in enumerate(parts))
+    return TRAILING_PUNCTUATION.sub('', text)
+
+
+class REBELInterpretationCache:
+    """Güvenilir AI yorumları için kalıcı LRU + TTL önbellek, eşzamanlı çağrı birleştirme"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml", database_path: Optional[str] = None):
+        """Interpretation cache başlatıcı (database_path verilmezse config'teki yol)"""
+        self.config = self._load_config(config_path)
+        self.cache_config = self.config.get('ai_engine', {}).get('interpretation_cache', {})
+        self.enabled = self.cache_config.get('enabled', True)
+        self.max_entries = self.cache_config.get('max_entries', 4096)
+        self.ttl_seconds = self.cache_config.get('ttl_seconds', 7 * 24 * 3600)
+        self.database_path = database_path or self.cache_config.get('database', 'rebel_ai_cache.db')
+        # Bu kadar kayıtta bir süresi dolmuş / sınır dışı satırlar silinir
+        self.prune_every = self.cache_config.get('prune_every', 100)
+
+        # anahtar -> (bitiş zamanı (time.time), komut, açıklama, AI çağrı süresi)
+        self._entries: "OrderedDict[str, Tuple[float, str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+        self.backend_seconds = 0.0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if self.enabled:
+            try:
+                self._db = sqlite3.connect(self.database_path, timeout=5, check_same_thread=False, isolation_level=None)
+                self._init_schema()
+                self._load_entries()
+            except sqlite3.Error as e:
+                print(f"⚠️ Yorumlama önbelleği veritabanı açılamadı, yalnızca bellekte tutulacak: {e}")
+                self._db = None
+
+        print(f"🧠 REBEL Interpretation Cache {'active' if self.enabled else 'disabled'} "
+              f"({len(self._entries)} kayıt, ttl={self.ttl_seconds}s)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _init_schema(self) -> None:
+        """Yorum tablosu"""
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS interpretations (
+                key TEXT PRIMARY KEY,
+                command TEXT NOT NULL,
+                explanation TEXT NOT NULL,
+                latency REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_interpretations_last_used ON interpretations (last_used)")
+
+    def _load_entries(self) -> None:
+        """Süresi dolmamış en son kullanılan max_entries kaydı belleğe al (eskiden yeniye: LRU sırası)"""
+        rows = self._db.execute(
+            "SELECT key, expires_at, command, explanation, latency FROM interpretations "
+            "WHERE expires_at > ? ORDER BY last_used DESC LIMIT ?",
+            (time.time(), self.max_entries)
+        ).fetchall()
+        for key, expires_at, command, explanation, latency in reversed(rows):
+            self._entries[key] = (expires_at, command, explanation, latency)
+
+    def make_key(self, user_input: str, platform_name: str, shell: str, backend: str, model: str) -> str:
+        """Önbellek anahtarı: normalleştirilmiş girdi + çalışma ortamı + model"""
+        parts = [KEY_VERSION, normalize_input(user_input), platform_name, shell, backend, model]
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def _get(self, key: str) -> Optional[Tuple[float, str, str, float]]:
+        """Önce bellek, sonra (başka worker'ın yazmış olabileceği) disk"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self.saved_seconds += entry[3]
+                    return entry
+                del self._entries[key]
+
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT expires_at, command, explanation, latency FROM interpretations WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[0] <= now:
+                    return None
+                self._db.execute("UPDATE interpretations SET last_used = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                print(f"⚠️ Yorumlama önbelleği okuma hatası: {e}")
+                return None
+            entry = tuple(row)
+            self._remember(key, entry)
+            self.hits += 1
+            self.disk_hits += 1
+            self.saved_seconds += entry[3]
+            return entry
+
+    def _remember(self, key: str, entry: Tuple[float, str, str, float]) -> None:
+        """Belleğe ekle, LRU sınırını uygula (kilit tutulurken çağrılır)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _put(self, key: str, command: str, explanation: str, latency: float) -> None:
+        now = time.time()
+        entry = (now + self.ttl_seconds, command, explanation, latency)
+        with self._lock:
+            self._remember(key, entry)
+            self.stores += 1
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO interpretations (key, command, explanation, latency, expires_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, command, explanation, latency, entry[0], now)
+                )
+                if self.stores % self.prune_every == 0:
+                    self._prune(now)
+            except sqlite3.Error as e:
+                print(f"⚠️ Yorumlama önbelleği yazma hatası: {e}")
+
+    def _prune(self, now: float) -> None:
+        """Diskte süresi dolmuş ve en son kullanılan max_entries dışında kalan kayıtları sil"""
+        self._db.execute("DELETE FROM interpretations WHERE expires_at <= ?", (now,))
+        self._db.execute(
+            "DELETE FROM interpretations WHERE key NOT IN "
+            "(SELECT key FROM interpretations ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+
+    def get_or_interpret(self, key: str, interpret: Callable[[], Interpretation]) -> Interpretation:
+        """
+        Önbellekteki yorumu döndür; yoksa interpret() ile üret
+
+        Aynı anahtar için süren bir çağrı varsa onun sonucu beklenir. Yalnızca
+        güvenilir sonuçlar saklanır; güvenilmeyen sonuç bir sonraki istekte
+        yeniden denenir.
+        """
+        if not self.enabled:
+            return interpret()
+
+        entry = self._get(key)
+        if entry is not None:
+            return entry[1], entry[2], True
+
+        future, shared = self._flight.submit(key, Future)
+        if shared:
+            with self._lock:
+                self.coalesced += 1
+            return future.result()
+
+        # Önceki lider, bu çağrı bağlanmadan hemen önce bitirmiş olabilir
+        entry = self._get(key)
+        if entry is not None:
+            future.set_result((entry[1], entry[2], True))
+            return entry[1], entry[2], True
+
+        with self._lock:
+            self.misses += 1
+        start_time = time.monotonic()
+        try:
+            command, explanation, confident = interpret()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        latency = time.monotonic() - start_time
+        with self._lock:
+            self.backend_seconds += latency
+        if confident:
+            self._put(key, command, explanation, latency)
+        future.set_result((command, explanation, confident))
+        return command, explanation, confident
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil (bellek ve disk)"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM interpretations")
+                except sqlite3.Error as e:
+                    print(f"⚠️ Yorumlama önbelleği temizleme hatası: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """İsabet oranı ve AI'ya gidilmeyerek kazanılan süre"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'enabled': self.enabled,
+                'persistent': self._db is not None,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                # Birleştirilen çağrılar da AI'ya gitmedi: isabet sayılır
+                'hit_rate': round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+                'saved_seconds': round(self.saved_seconds, 3),
+                'avg_backend_seconds': round(self.backend_seconds / self.misses, 3) if self.misses else None
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = os.path.join(tempfile.mkdtemp(), "rebel_test_ai_cache.db")
+    cache = REBELInterpretationCache(database_path=path)
+
+    print("🧠 REBEL Interpretation Cache Test")
+    print("=" * 40)
+
+    calls = []
+
+    def slow_backend() -> Interpretation:
+        calls.append(1)
+        time.sleep(0.3)
+        return "whoami", "Mevcut kullanıcıyı gösterir", True
+
+    inputs = ["ben kimim", "ben kimim?", "  ben   kimim  ", "ben kimim!"] * 5
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(
+            lambda text: cache.get_or_interpret(cache.make_key(text, 'linux', 'bash', 'openai', 'gpt-4o-mini'), slow_backend),
+            inputs
+        ))
+    print(f"{len(inputs)} eşzamanlı istek, AI çağrısı: {len(calls)}, sonuçlar aynı: {len(set(results)) == 1}")
+
+    restarted = REBELInterpretationCache(database_path=path)
+    start = time.perf_counter()
+    restarted.get_or_interpret(restarted.make_key("ben kimim", 'linux', 'bash', 'openai', 'gpt-4o-mini'), slow_backend)
+    print(f"Yeniden başlatma sonrası: {(time.perf_counter() - start) * 1000:.2f} ms, AI çağrısı: {len(calls)}")
+    print(f"Farklı model anahtarı farklı mı: "
+          f"{cache.make_key('ben kimim', 'linux', 'bash', 'openai', 'gpt-4o') != cache.make_key('ben kimim', 'linux', 'bash', 'openai', 'gpt-4o-mini')}")
+
+    # Anlamı farklı girdiler aynı anahtara düşmemeli
+    distinct = [("ls -R", "ls -r"), ("cat README.md", "cat readme.md"), ("ls ..", "ls ."), ("ls .", "ls"),
+                ("ls...", "ls"), ('echo "a  b"', 'echo "a b"'), ("ben kimim ?", "ben kimim")]
+    for left, right in distinct:
+        print(f"{left!r:18} != {right!r:16}: {normalize_input(left) != normalize_input(right)}")
+    print(f"\n📊 Durum: {cache.get_status()}")
+    print(f"📊 Yeniden başlatılan: {restarted.get_status()}")
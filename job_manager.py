@@ -0,0 +1,352 @@
+# ==========================================
+# 🗂️ REBEL AI Job Manager - Arka Plan İş Sistemi
+# ==========================================
+# İstekleri kalıcı bir iş tablosuna yazar, worker havuzunda çalıştırır.
+# Aynı tabloyu birden çok süreç (gunicorn worker'ları) paylaşabilir: çalışan
+# her işin sahibi (host:pid) ve sahibin yazdığı heartbeat zamanı tutulur.
+# Sahibi ölmüş (heartbeat'i eskimiş) çalışan işler 'interrupted' olur,
+# kuyruktakiler canlı bir süreç tarafından sahiplenilip yeniden planlanır;
+# iptal tablo üzerinden iletilir, isteğin hangi worker'a düştüğü önemsizdir.
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
+import yaml
+
+from cancellation import CancellationToken
+
+
+# İş durumları
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+JOB_INTERRUPTED = 'interrupted'
+
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED, JOB_INTERRUPTED)
+
+
+class REBELJobManager:
+    """submit/poll/cancel API'si olan, yeniden başlatmalara dayanıklı iş yöneticisi"""
+
+    def __init__(self, runner: Callable[..., Dict[str, Any]], config_path: str = "rebel_config.yaml"):
+        """
+        Job manager başlatıcı
+
+        runner(user_input, use_ai, use_scheduler, progress_callback, cancel_token) işi
+        çalıştırıp process_user_input ile aynı sonuç sözlüğünü döndürmelidir.
+        """
+        self.config = self._load_config(config_path)
+        self.jobs_config = self.config.get('jobs', {})
+        self.max_workers = self.jobs_config.get('max_workers', 4)
+        self.retention_hours = self.jobs_config.get('retention_hours', 24)
+        self.database_path = self.jobs_config.get('database', 'rebel_jobs.db')
+        self.heartbeat_seconds = self.jobs_config.get('heartbeat_seconds', 5.0)
+        # Heartbeat'i bu kadar eski çalışan işin sahibi ölmüş sayılır
+        self.stale_after_seconds = self.jobs_config.get('stale_after_seconds', 30.0)
+        # Başka worker'dan gelen iptalin fark edilme süresi
+        self.cancel_poll_seconds = self.jobs_config.get('cancel_poll_seconds', 0.5)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.runner = runner
+
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(self.database_path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._init_schema()
+
+        # Çalışan işlerin iptal belirteçleri (cancel() çalışan süreci durdurur)
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._tokens_lock = threading.Lock()
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="rebel-job")
+
+        recovered = self._recover()
+        self._stop = threading.Event()
+        self._monitor = threading.Thread(target=self._monitor_loop, name="rebel-job-monitor", daemon=True)
+        self._monitor.start()
+        print(f"🗂️ REBEL Job Manager initialized (workers={self.max_workers}, recovered={recovered})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _init_schema(self) -> None:
+        """İş tablosunu oluştur"""
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    user_input TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    partial_results TEXT NOT NULL DEFAULT '[]',
+                    result TEXT,
+                    error TEXT,
+                    owner TEXT,
+                    heartbeat_at REAL
+                )
+            """)
+            # owner / heartbeat_at sütunları olmadan oluşturulmuş veritabanları
+            columns = {row['name'] for row in self._db.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in (('owner', 'TEXT'), ('heartbeat_at', 'REAL')):
+                if column not in columns:
+                    self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._db_lock:
+            return self._db.execute(sql, params)
+
+    def _now(self) -> str:
+        return datetime.datetime.now().isoformat()
+
+    def _recover_stale(self) -> int:
+        """
+        Sahibi ölmüş işleri kurtar; yeniden planlanan kuyruk işi sayısı
+
+        Çalışanlar 'interrupted' işaretlenir (yarım kalan komut tekrar çalıştırılmaz);
+        kuyruktakiler tek tek bu sürece devredilir: koşullu UPDATE sayesinde aynı
+        işi iki canlı süreç birden sahiplenemez.
+        """
+        # Eski şemadan kalan / sahipsiz satırlarda heartbeat yoktur: ölü sayılır
+        stale = "(heartbeat_at IS NULL OR heartbeat_at < ?)"
+        cutoff = time.time() - self.stale_after_seconds
+        self._execute(
+            f"UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE status = ? AND {stale}",
+            (JOB_INTERRUPTED, self._now(), "İşi çalıştıran sunucu süreci durdu", JOB_RUNNING, cutoff)
+        )
+
+        queued = self._execute(
+            f"SELECT id FROM jobs WHERE status = ? AND {stale} ORDER BY created_at", (JOB_QUEUED, cutoff)
+        ).fetchall()
+        adopted = 0
+        for row in queued:
+            claimed = self._execute(
+                f"UPDATE jobs SET owner = ?, heartbeat_at = ? WHERE id = ? AND status = ? AND {stale}",
+                (self.owner, time.time(), row['id'], JOB_QUEUED, cutoff)
+            ).rowcount
+            if claimed:
+                self._pool.submit(self._run_job, row['id'])
+                adopted += 1
+        return adopted
+
+    def _recover(self) -> int:
+        """Başlangıçta: sahibi ölmüş işleri kurtar, eski bitmiş işleri sil"""
+        recovered = self._recover_stale()
+        self.cleanup()
+        return recovered
+
+    def submit(self, user_input: str, use_ai: bool = True, use_scheduler: bool = True) -> Dict[str, Any]:
+        """Yeni iş oluştur ve kuyruğa ekle"""
+        job_id = uuid.uuid4().hex
+        options = {'use_ai': use_ai, 'use_scheduler': use_scheduler}
+        self._execute(
+            "INSERT INTO jobs (id, status, user_input, options, created_at, owner, heartbeat_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, JOB_QUEUED, user_input, json.dumps(options), self._now(), self.owner, time.time())
+        )
+        self._pool.submit(self._run_job, job_id)
+        return self.get(job_id)
+
+    def _run_job(self, job_id: str) -> None:
+        """Worker: işi çalıştır, ara sonuçları ve final sonucu kaydet"""
+        # Yalnızca hâlâ kuyruktaysa ve bu sürece aitse başlat (iptal edilmiş ya da
+        # bu süreç takıldığı sırada başka worker'a devredilmiş olabilir)
+        claimed = self._execute(
+            "UPDATE jobs SET status = ?, started_at = ?, heartbeat_at = ? WHERE id = ? AND status = ? AND owner = ?",
+            (JOB_RUNNING, self._now(), time.time(), job_id, JOB_QUEUED, self.owner)
+        ).rowcount
+        if not claimed:
+            return
+
+        token = CancellationToken()
+        with self._tokens_lock:
+            self._tokens[job_id] = token
+
+        row = self._execute("SELECT user_input, options FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        options = json.loads(row['options'])
+        partial_results: List[Dict[str, Any]] = []
+        partial_lock = threading.Lock()
+
+        def on_progress(result: Dict[str, Any]) -> None:
+            with partial_lock:
+                partial_results.append(result)
+                snapshot = json.dumps(partial_results, ensure_ascii=False)
+            updated = self._execute(
+                "UPDATE jobs SET partial_results = ? WHERE id = ? AND status = ?",
+                (snapshot, job_id, JOB_RUNNING)
+            ).rowcount
+            # Artık çalışmıyor: başka bir worker'dan iptal edilmiş
+            if not updated:
+                token.cancel("İş iptal edildi")
+
+        try:
+            result = self.runner(
+                row['user_input'],
+                use_ai=options.get('use_ai', True),
+                use_scheduler=options.get('use_scheduler', True),
+                progress_callback=on_progress,
+                cancel_token=token
+            )
+            status = JOB_SUCCEEDED if result.get('success') else JOB_FAILED
+            self._execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ? AND status = ?",
+                (status, self._now(), json.dumps(result, ensure_ascii=False),
+                 result.get('error'), job_id, JOB_RUNNING)
+            )
+        except Exception as e:
+            self._execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ? AND status = ?",
+                (JOB_FAILED, self._now(), f"İş çalıştırma hatası: {e}", job_id, JOB_RUNNING)
+            )
+        finally:
+            with self._tokens_lock:
+                self._tokens.pop(job_id, None)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """İş durumunu ve (ara) sonuçlarını döndür"""
+        row = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        return {
+            'job_id': row['id'],
+            'status': row['status'],
+            'user_input': row['user_input'],
+            'options': json.loads(row['options']),
+            'created_at': row['created_at'],
+            'started_at': row['started_at'],
+            'finished_at': row['finished_at'],
+            'partial_results': json.loads(row['partial_results']),
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error']
+        }
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        İşi iptal et
+
+        Kuyruktaki iş hiç başlamaz; çalışan işin süreç grubu öldürülür ve
+        sonucu kaydedilmez. Bitmiş işler değişmez. Bilinmeyen iş için None döner.
+        İş başka bir worker'da çalışıyorsa iptali o worker'ın izleyicisi tablodan
+        okur (en geç cancel_poll_seconds içinde).
+        """
+        self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status IN (?, ?)",
+            (JOB_CANCELLED, self._now(), job_id, JOB_QUEUED, JOB_RUNNING)
+        )
+        with self._tokens_lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel("İş iptal edildi")
+        return self.get(job_id)
+
+    def _monitor_loop(self) -> None:
+        """Sahip olunan (kuyruktaki ve çalışan) işlerin heartbeat'i, tablodan gelen iptaller ve ölü sahiplerin işleri"""
+        last_heartbeat = time.monotonic()
+        while not self._stop.wait(self.cancel_poll_seconds):
+            try:
+                with self._tokens_lock:
+                    local = dict(self._tokens)
+                if local:
+                    placeholders = ', '.join('?' for _ in local)
+                    rows = self._execute(
+                        f"SELECT id FROM jobs WHERE id IN ({placeholders}) AND status != ?",
+                        (*local, JOB_RUNNING)
+                    ).fetchall()
+                    for row in rows:
+                        local[row['id']].cancel("İş iptal edildi")
+
+                if time.monotonic() - last_heartbeat >= self.heartbeat_seconds:
+                    last_heartbeat = time.monotonic()
+                    self._execute(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status IN (?, ?)",
+                        (time.time(), self.owner, JOB_QUEUED, JOB_RUNNING)
+                    )
+                    self._recover_stale()
+            except sqlite3.Error as e:
+                print(f"⚠️ İş izleyici hatası: {e}")
+
+    def cleanup(self) -> None:
+        """Saklama süresi dolan bitmiş işleri sil"""
+        cutoff = (datetime.datetime.now() - datetime.timedelta(hours=self.retention_hours)).isoformat()
+        placeholders = ', '.join('?' for _ in FINISHED_STATES)
+        self._execute(
+            f"DELETE FROM jobs WHERE status IN ({placeholders}) AND finished_at < ?",
+            (*FINISHED_STATES, cutoff)
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Durum başına iş sayıları"""
+        rows = self._execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        with self._tokens_lock:
+            running_here = len(self._tokens)
+        return {
+            'max_workers': self.max_workers,
+            'owner': self.owner,
+            'running_here': running_here,
+            'counts': {row['status']: row['count'] for row in rows}
+        }
+
+    def shutdown(self) -> None:
+        """İzleyiciyi durdur, worker havuzunu kapat"""
+        self._stop.set()
+        self._pool.shutdown(wait=False)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+
+    def fake_runner(user_input, use_ai=True, use_scheduler=True, progress_callback=None, cancel_token=None):
+        for i in range(3):
+            if cancel_token.wait(0.2):
+                return {'user_input': user_input, 'success': False, 'results': []}
+            if progress_callback:
+                progress_callback({'command': f"{user_input} #{i}", 'success': True})
+        return {'user_input': user_input, 'success': True, 'results': []}
+
+    manager = REBELJobManager(fake_runner)
+
+    print("🗂️ REBEL Job Manager Test")
+    print("=" * 40)
+
+    job = manager.submit("ben kimim")
+    print(f"Gönderildi: {job['job_id']} ({job['status']})")
+    time.sleep(0.3)
+    print(f"Ara durum: {manager.get(job['job_id'])['status']}, {len(manager.get(job['job_id'])['partial_results'])} ara sonuç")
+    time.sleep(0.6)
+    print(f"Son durum: {manager.get(job['job_id'])['status']}")
+
+    cancelled = manager.submit("iptal edilecek")
+    print(f"İptal: {manager.cancel(cancelled['job_id'])['status']}")
+
+    # İkinci süreç gibi davranan yönetici: birincinin çalışan işine dokunmamalı,
+    # iptal isteği ona düşse bile iş birincide durmalı
+    running = manager.submit("uzun iş")
+    time.sleep(0.1)
+    other = REBELJobManager(fake_runner)
+    print(f"İkinci yönetici sonrası durum: {other.get(running['job_id'])['status']}")
+    other.cancel(running['job_id'])
+    time.sleep(manager.cancel_poll_seconds + 0.3)
+    print(f"Başka yöneticiden iptal: {manager.get(running['job_id'])['status']}, "
+          f"birincide çalışan: {manager.get_status()['running_here']}")
+    other.shutdown()
+    print(f"\n📊 Durum: {manager.get_status()}")
@@ -0,0 +1,235 @@
+# ==========================================
+# 🔎 REBEL AI Log Store - Zaman İndeksli Log Sorgulama
+# ==========================================
+# REBELLogWriter'ın yazdığı NDJSON log'u ve sıkıştırılmış segmentlerini
+# indeks dosyaları (.idx) üzerinden sorgular. Önce manifestteki zaman
+# aralıklarıyla segmentler elenir, sonra indeks satırları (dakika, komut,
+# başarı) filtrelenir ve yalnızca eşleşen bayt aralıkları okunur:
+# etkin dosyada mmap dilimleri, segmentlerde ileri doğru açılan akış.
+
+import os
+import re
+import mmap
+import json
+import datetime
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import yaml
+
+from json_log_writer import index_path, load_manifest, open_segment
+
+
+DURATION_PATTERN = re.compile(r"^(\d+)([smhd])$")
+DURATION_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+def parse_time(value: Optional[str]) -> Optional[str]:
+    """
+    Zaman filtresini log zaman damgalarıyla karşılaştırılabilir ISO metne çevir
+
+    Kabul edilen: ISO 8601 ('2026-01-01T10:00', '2026-01-01 10:00:00') ya da
+    şimdiden geriye süre ('10m', '2h', '30s', '1d'). Geçersizse ValueError.
+    """
+    if value is None or value == '':
+        return None
+    value = value.strip()
+    match = DURATION_PATTERN.match(value)
+    if match:
+        delta = datetime.timedelta(**{DURATION_UNITS[match.group(2)]: int(match.group(1))})
+        return (datetime.datetime.now() - delta).isoformat()
+    try:
+        return datetime.datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"Geçersiz zaman: {value} (ISO 8601 ya da 10m / 2h / 1d)")
+
+
+class REBELLogStore:
+    """Log, segmentler ve indeksler üzerinde filtreli sorgu"""
+
+    def __init__(self, log_path: str, config_path: str = "rebel_config.yaml"):
+        """Log store başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.query_config = self.config.get('logging', {}).get('query', {})
+        self.default_limit = self.query_config.get('default_limit', 100)
+        self.max_limit = self.query_config.get('max_limit', 1000)
+        self.log_path = log_path
+        self.directory = os.path.dirname(log_path)
+
+        print(f"🔎 REBEL Log Store initialized ({log_path})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _read_index(self, path: str) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # Yarım kalmış son satır
+        except FileNotFoundError:
+            return
+
+    def _candidates(self, index_file: str, since: Optional[str], until: Optional[str],
+                    command: Optional[str], success: Optional[bool]) -> List[Tuple[int, int]]:
+        """İndeksten eşleşen (offset, uzunluk) aralıkları, artan offset sırasıyla"""
+        since_bucket = since[:16] if since else None
+        until_bucket = until[:16] if until else None
+        ranges: List[Tuple[int, int]] = []
+        for entry in self._read_index(index_file):
+            bucket = entry.get('b', '')
+            if since_bucket and bucket < since_bucket:
+                continue
+            if until_bucket and bucket > until_bucket:
+                continue
+            if success is not None and entry.get('s') is not success:
+                continue
+            if command and command not in (entry.get('c') or ''):
+                continue
+            ranges.extend((offset, length) for offset, length in entry.get('r', []))
+        ranges.sort()
+        return ranges
+
+    def _matches_time(self, record: Dict[str, Any], since: Optional[str], until: Optional[str]) -> bool:
+        """Dakika kovası kaba filtre: kesin zaman karşılaştırması kayıt üzerinde"""
+        timestamp = record.get('timestamp')
+        if not isinstance(timestamp, str):
+            return since is None and until is None
+        return (since is None or timestamp >= since) and (until is None or timestamp <= until)
+
+    def _read_active(self, ranges: List[Tuple[int, int]], since: Optional[str], until: Optional[str],
+                     limit: int) -> List[Dict[str, Any]]:
+        """Etkin dosyadan aralıkları mmap ile sondan başa oku (en fazla limit kayıt)"""
+        results: List[Dict[str, Any]] = []
+        if not ranges:
+            return results
+        try:
+            with open(self.log_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return results
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    for offset, length in reversed(ranges):
+                        if offset + length > size:
+                            continue  # Döndürme yarışı: aralık artık başka dosyada
+                        try:
+                            record = json.loads(view[offset:offset + length])
+                        except ValueError:
+                            continue
+                        if self._matches_time(record, since, until):
+                            results.append(record)
+                            if len(results) >= limit:
+                                break
+        except FileNotFoundError:
+            pass
+        return results
+
+    def _read_segment(self, segment: Dict[str, Any], ranges: List[Tuple[int, int]],
+                      since: Optional[str], until: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Sıkıştırılmış segmentten aralıkları ileri doğru oku; en yeni limit kaydı döndür"""
+        newest: deque = deque(maxlen=limit)
+        if not ranges:
+            return []
+        with open_segment(os.path.join(self.directory, segment['file']), segment['compression']) as f:
+            for offset, length in ranges:
+                f.seek(offset)
+                try:
+                    record = json.loads(f.read(length))
+                except ValueError:
+                    continue
+                if self._matches_time(record, since, until):
+                    newest.append(record)
+        return list(reversed(newest))
+
+    def query(self, since: Optional[str] = None, until: Optional[str] = None,
+              command: Optional[str] = None, success: Optional[bool] = None,
+              limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Filtreli log sorgusu, en yeni kayıt önce
+
+        since/until: parse_time ile çevrilmiş ISO metin; command: alt metin;
+        success: True/False/None.
+        """
+        limit = max(1, min(limit or self.default_limit, self.max_limit))
+        records: List[Dict[str, Any]] = []
+        scanned: List[str] = []
+
+        # Etkin dosya en yeni kayıtları içerir
+        ranges = self._candidates(index_path(self.log_path), since, until, command, success)
+        scanned.append(os.path.basename(self.log_path))
+        records.extend(self._read_active(ranges, since, until, limit))
+
+        # Segmentler yeniden eskiye; zaman aralığı dışındakiler hiç açılmaz
+        for segment in reversed(load_manifest(self.log_path)['segments']):
+            if len(records) >= limit:
+                break
+            if since and segment.get('last_timestamp') and segment['last_timestamp'] < since:
+                break  # Daha eski segmentler de aralık dışında
+            if until and segment.get('first_timestamp') and segment['first_timestamp'] > until:
+                continue
+            if not segment.get('index'):
+                continue
+            ranges = self._candidates(os.path.join(self.directory, segment['index']), since, until, command, success)
+            scanned.append(segment['file'])
+            try:
+                records.extend(self._read_segment(segment, ranges, since, until, limit - len(records)))
+            except (OSError, EOFError) as e:
+                print(f"⚠️ Log segmenti okunamadı ({segment['file']}): {e}")
+
+        return {
+            'records': records,
+            'count': len(records),
+            'limit': limit,
+            'truncated': len(records) >= limit,
+            'sources': scanned
+        }
+
+    def list_segments(self) -> List[Dict[str, Any]]:
+        """İndirilebilir segmentler (eskiden yeniye)"""
+        return load_manifest(self.log_path)['segments']
+
+    def segment_path(self, name: str) -> Optional[str]:
+        """Manifestteki segment dosyasının yolu; bilinmeyen ad için None (yol gezinmesine karşı)"""
+        for segment in self.list_segments():
+            if segment['file'] == name:
+                return os.path.join(self.directory, name)
+        return None
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+    import tempfile
+    from json_log_writer import REBELLogWriter
+
+    path = os.path.join(tempfile.mkdtemp(), "rebel_test_log.jsonl")
+    writer = REBELLogWriter(path)
+    writer.max_bytes = 256 * 1024
+
+    print("🔎 REBEL Log Store Test")
+    print("=" * 40)
+
+    base = datetime.datetime.now() - datetime.timedelta(hours=2)
+    for i in range(12000):
+        writer.write({
+            'command': ['ls -la', 'whoami', 'find /'][i % 3],
+            'success': i % 7 != 0,
+            'timestamp': (base + datetime.timedelta(seconds=i * 0.6)).isoformat(),
+            'output': 'x' * 200
+        })
+    writer.shutdown()
+
+    store = REBELLogStore(path)
+    for filters in [{'since': '10m'}, {'success': False, 'command': 'find'}, {'since': '40m', 'until': '20m'}]:
+        params = {key: parse_time(value) if key in ('since', 'until') else value for key, value in filters.items()}
+        start = time.perf_counter()
+        result = store.query(limit=50, **params)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{filters}: {result['count']} kayıt, {len(result['sources'])} kaynak, {elapsed:.1f} ms")
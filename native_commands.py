@@ -0,0 +1,294 @@
+# ==========================================
+# ⚡ REBEL AI Native Commands - Süreç Açmadan Sistem Bilgisi
+# ==========================================
+# Sık kullanılan bilgi komutlarının çıktısını fork+exec yapmadan, web süreci
+# içinde üretir. Çıktı coreutils / procps-ng 4 ile bayt bayt aynı biçimdedir;
+# yapılandırılmış veri ayrıca 'structured' alanında döner.
+# Desteklenmeyen argv (ör. 'df -h', 'ps aux') normal yoldan çalıştırılır.
+
+import os
+import sys
+import time
+import struct
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import yaml
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import pwd
+except ImportError:
+    pwd = None  # Windows: işleyiciler zaten yalnızca Linux'ta etkin
+
+
+NativeHandler = Callable[[str], Tuple[str, Dict[str, Any]]]
+
+
+def _float32(value: float) -> float:
+    """C'deki (float) dönüşümü: procps yuvarlamasıyla aynı sonuç için"""
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def scale_size_human(kib: int) -> str:
+    """procps-ng free -h birim biçimi (ör. 505Mi, 5.9Gi, 0B)"""
+    size_bytes = kib * 1024
+    if len(f"{size_bytes}B") <= 4:
+        return f"{size_bytes}B"
+    for power, unit in enumerate("KMGTP", start=1):
+        value = size_bytes / (1024.0 ** power)
+        text = f"{_float32(value):.1f}{unit}"
+        if len(text) <= 4:
+            return f"{text}i"
+        text = f"{int(value)}{unit}"
+        if len(text) <= 4:
+            return f"{text}i"
+    return f"{size_bytes}B"
+
+
+class REBELNativeCommands:
+    """argv -> süreç içi işleyici kayıt defteri"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Native command registry başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.native_config = self.config.get('execution', {}).get('native_commands', {})
+        # Biçimler GNU/Linux araçlarını taklit eder; diğer platformlarda kapalı
+        self.enabled = self.native_config.get('enabled', True) and sys.platform.startswith('linux')
+
+        self.handlers: Dict[Tuple[str, ...], NativeHandler] = {
+            ('whoami',): self._whoami,
+            ('pwd',): self._pwd,
+            ('date',): self._date,
+            ('uname',): self._uname,
+            ('uname', '-a'): self._uname_all,
+            ('uptime',): self._uptime,
+            ('free',): self._free,
+            ('free', '-h'): self._free_human,
+        }
+        disabled = set(self.native_config.get('disabled', []) or [])
+        self.handlers = {
+            argv: handler for argv, handler in self.handlers.items() if argv[0] not in disabled
+        }
+
+        self.hits = 0
+        self.fallbacks = 0
+
+        print(f"⚡ REBEL Native Commands {'active' if self.enabled else 'disabled'} ({len(self.handlers)} handlers)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def supports(self, argv: List[str]) -> bool:
+        """Bu argv süreç içinde üretilebilir mi?"""
+        return self.enabled and tuple(argv) in self.handlers
+
+    def verify(self, run_real: Callable[[List[str]], str]) -> List[str]:
+        """
+        Zamana bağlı olmayan işleyicileri gerçek komutla karşılaştır
+
+        Çıktısı farklı olan (ör. dağıtıma özel uname yaması) işleyici kapatılır.
+        Kapatılan argv listesini döndürür.
+        """
+        disabled = []
+        for argv in [('whoami',), ('uname',), ('uname', '-a')]:
+            if not self.supports(list(argv)):
+                continue
+            try:
+                matches = run_real(list(argv)) == self.handlers[argv]('/')[0]
+            except Exception:
+                matches = False
+            if not matches:
+                del self.handlers[argv]
+                disabled.append(' '.join(argv))
+        if disabled:
+            print(f"⚠️ Native çıktı uyuşmadı, alt süreç kullanılacak: {', '.join(disabled)}")
+        return disabled
+
+    def run(self, argv: List[str], cwd: str) -> Optional[Dict[str, Any]]:
+        """
+        Komutu süreç içinde çalıştır
+
+        Sonuç executor.run ile aynı alanları taşır (+ 'structured', 'native').
+        İşleyici yoksa ya da hata verirse None döner; çağıran alt sürece düşer.
+        """
+        handler = self.handlers.get(tuple(argv)) if self.enabled else None
+        if handler is None:
+            return None
+
+        try:
+            stdout, structured = handler(cwd)
+        except Exception:
+            self.fallbacks += 1
+            return None
+
+        self.hits += 1
+        output_bytes = len(stdout.encode('utf-8'))
+        return {
+            'stdout': stdout,
+            'stdout_bytes': output_bytes,
+            'stdout_handle': None,
+            'stdout_truncated': False,
+            'stderr': '',
+            'stderr_bytes': 0,
+            'stderr_handle': None,
+            'stderr_truncated': False,
+            'returncode': 0,
+            'resources': {'output_bytes': output_bytes},
+            'structured': structured,
+            'native': True
+        }
+
+    # --- İşleyiciler -------------------------------------------------------
+
+    def _whoami(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        user = pwd.getpwuid(os.geteuid())
+        return f"{user.pw_name}\n", {'user': user.pw_name, 'uid': user.pw_uid}
+
+    def _pwd(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        # /usr/bin/pwd varsayılan olarak fiziksel yolu (-P) yazar
+        path = os.path.realpath(cwd)
+        return f"{path}\n", {'path': path}
+
+    def _date(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        # Çocuk süreç TZ almaz (/etc/localtime); süreçte TZ tanımlıysa sonuç farklı olur
+        if 'TZ' in os.environ:
+            raise RuntimeError("TZ tanımlı, alt süreç kullanılacak")
+        now = time.time()
+        local = time.localtime(now)
+        return time.strftime("%a %b %e %H:%M:%S %Z %Y\n", local), {
+            'timestamp': now,
+            'iso': time.strftime("%Y-%m-%dT%H:%M:%S%z", local),
+            'timezone': time.strftime("%Z", local)
+        }
+
+    def _uname(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        info = os.uname()
+        return f"{info.sysname}\n", {'sysname': info.sysname}
+
+    def _uname_all(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        # coreutils: işlemci/donanım platformu 'unknown' ise -a çıktısında yer almaz
+        info = os.uname()
+        fields = [info.sysname, info.nodename, info.release, info.version, info.machine, 'GNU/Linux']
+        return ' '.join(fields) + "\n", {
+            'sysname': info.sysname,
+            'nodename': info.nodename,
+            'release': info.release,
+            'version': info.version,
+            'machine': info.machine
+        }
+
+    def _uptime(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        with open('/proc/uptime', 'r') as f:
+            uptime_seconds = float(f.read().split()[0])
+        users = len(psutil.users()) if PSUTIL_AVAILABLE else 0
+        load = os.getloadavg()
+        now = time.localtime()
+
+        # procps-ng sprint_uptime biçimi
+        text = f" {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d} up "
+        days = int(uptime_seconds) // 86400
+        hours = int(uptime_seconds) // 3600 % 24
+        minutes = int(uptime_seconds) // 60 % 60
+        if days:
+            text += f"{days} {'days' if days > 1 else 'day'}, "
+        if hours:
+            text += f"{hours:2d}:{minutes:02d}, "
+        else:
+            text += f"{minutes} min, "
+        text += f"{users:2d} {'users' if users > 1 else 'user'},  "
+        text += f"load average: {load[0]:.2f}, {load[1]:.2f}, {load[2]:.2f}\n"
+
+        return text, {
+            'uptime_seconds': uptime_seconds,
+            'users': users,
+            'load_average': list(load)
+        }
+
+    def _read_meminfo(self) -> Dict[str, int]:
+        """free'nin kullandığı alanlar (KiB), /proc/meminfo'dan tek okumada"""
+        meminfo: Dict[str, int] = {}
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                name, _, rest = line.partition(':')
+                meminfo[name] = int(rest.split()[0])
+
+        total = meminfo['MemTotal']
+        free = meminfo['MemFree']
+        available = meminfo.get('MemAvailable', free)
+        used = total - available
+        if used < 0:
+            used = total - free
+        return {
+            'total': total,
+            'used': used,
+            'free': free,
+            'shared': meminfo.get('Shmem', 0),
+            'buff_cache': meminfo.get('Buffers', 0) + meminfo.get('Cached', 0) + meminfo.get('SReclaimable', 0),
+            'available': available,
+            'swap_total': meminfo.get('SwapTotal', 0),
+            'swap_used': meminfo.get('SwapTotal', 0) - meminfo.get('SwapFree', 0),
+            'swap_free': meminfo.get('SwapFree', 0)
+        }
+
+    def _format_free(self, memory: Dict[str, int], scale: Callable[[int], str]) -> str:
+        """procps-ng 4 free tablo düzeni"""
+        header = "               total        used        free      shared  buff/cache   available\n"
+        mem_values = ['total', 'used', 'free', 'shared', 'buff_cache', 'available']
+        swap_values = ['swap_total', 'swap_used', 'swap_free']
+        mem_line = f"{'Mem:':<8}" + ''.join(f" {scale(memory[name]):>11}" for name in mem_values)
+        swap_line = f"{'Swap:':<8}" + ''.join(f" {scale(memory[name]):>11}" for name in swap_values)
+        return header + mem_line + "\n" + swap_line + "\n"
+
+    def _free(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        memory = self._read_meminfo()
+        return self._format_free(memory, str), {'unit': 'KiB', **memory}
+
+    def _free_human(self, cwd: str) -> Tuple[str, Dict[str, Any]]:
+        memory = self._read_meminfo()
+        return self._format_free(memory, scale_size_human), {'unit': 'KiB', **memory}
+
+    def get_status(self) -> Dict[str, Any]:
+        """Kayıt defteri durumu"""
+        return {
+            'enabled': self.enabled,
+            'commands': sorted(' '.join(argv) for argv in self.handlers),
+            'hits': self.hits,
+            'fallbacks': self.fallbacks
+        }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import subprocess
+
+    native = REBELNativeCommands()
+
+    print("⚡ REBEL Native Commands Test")
+    print("=" * 40)
+
+    env = {'PATH': '/usr/bin:/bin:/usr/local/bin', 'LANG': 'C.UTF-8', 'HOME': '/tmp'}
+    native.verify(lambda argv: subprocess.run(argv, capture_output=True, text=True, env=env).stdout)
+
+    for argv in [['whoami'], ['pwd'], ['date'], ['uname', '-a'], ['uptime'], ['free', '-h']]:
+        start = time.perf_counter()
+        result = native.run(argv, os.getcwd())
+        native_us = (time.perf_counter() - start) * 1e6
+
+        start = time.perf_counter()
+        real = subprocess.run(argv, capture_output=True, text=True, env=env).stdout
+        real_us = (time.perf_counter() - start) * 1e6
+
+        same = result is not None and result['stdout'] == real
+        print(f"{' '.join(argv):10} native={native_us:8.1f}µs  subprocess={real_us:8.1f}µs  aynı={same}")
+
+    print(f"\n📊 Durum: {native.get_status()}")
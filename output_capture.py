@@ -0,0 +1,256 @@
+# ==========================================
+# 📦 REBEL AI Output Capture - Sınırlı Çıktı Yakalama
+# ==========================================
+# Büyük komut çıktılarını diske taşır, bellekte yalnızca baş/son penceresini tutar
+
+import os
+import re
+import time
+import uuid
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+import yaml
+
+
+class OutputCapture:
+    """Tek bir çıktı akışı için sınırlı bellekli yakalayıcı"""
+
+    def __init__(self, store: "REBELOutputStore"):
+        self.store = store
+        self.total_bytes = 0
+        self.handle: Optional[str] = None
+        self._buffer = bytearray()  # Taşma olana kadar tüm çıktı
+        self._head = b''
+        self._tail = bytearray()
+        self._spill_file = None
+
+    def write(self, data: bytes) -> None:
+        """Yeni veri parçası ekle"""
+        if not data:
+            return
+        self.total_bytes += len(data)
+
+        if self._spill_file is None:
+            self._buffer += data
+            if len(self._buffer) <= self.store.inline_limit:
+                return
+            # Sınır aşıldı: şimdiye kadarki veriyi diske taşı
+            self.handle, self._spill_file = self.store.create_spill()
+            self._head = bytes(self._buffer[:self.store.head_bytes])
+            self._spill_file.write(self._buffer)
+            self._tail = bytearray(self._buffer[-self.store.tail_bytes:])
+            self._buffer = bytearray()
+            return
+
+        self._spill_file.write(data)
+        self._tail += data
+        if len(self._tail) > self.store.tail_bytes:
+            del self._tail[:-self.store.tail_bytes]
+
+    def finish(self) -> Tuple[bytes, bool]:
+        """
+        Yakalamayı bitir
+
+        Returns:
+            Tuple[bellekte tutulan çıktı, kesildi_mi]
+        """
+        if self._spill_file is None:
+            return bytes(self._buffer), False
+
+        self._spill_file.close()
+        self._spill_file = None
+        omitted = self.total_bytes - len(self._head) - len(self._tail)
+        marker = (
+            f"\n... [{omitted} bayt gösterilmedi, tam çıktı: /api/output/{self.handle}] ...\n"
+        ).encode('utf-8')
+        return self._head + marker + bytes(self._tail), True
+
+    def abort(self) -> None:
+        """Yarım kalan yakalamayı kapat"""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class REBELOutputStore:
+    """Diske taşan çıktıların deposu (handle ile bayt/satır bazlı okuma)"""
+
+    HANDLE_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Output store başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.capture_config = self.config.get('execution', {}).get('output_capture', {})
+        self.inline_limit = int(self.capture_config.get('inline_limit_kb', 256) * 1024)
+        self.head_bytes = int(self.capture_config.get('head_kb', 32) * 1024)
+        self.tail_bytes = int(self.capture_config.get('tail_kb', 32) * 1024)
+        self.retention_seconds = self.capture_config.get('retention_seconds', 3600)
+        self.max_spill_bytes = int(self.capture_config.get('max_spill_mb', 1024) * 1024 * 1024)
+        self.index_block_bytes = 1024 * 1024
+
+        spill_dir = self.capture_config.get('spill_dir') or os.path.join(tempfile.gettempdir(), 'rebel_output')
+        self.spill_dir = spill_dir
+        os.makedirs(self.spill_dir, mode=0o700, exist_ok=True)
+
+        # handle -> [(satır_no, bayt_offset), ...] seyrek satır indeksi
+        self._line_indexes: Dict[str, List[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        self._last_cleanup = 0.0
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def new_capture(self) -> OutputCapture:
+        """Yeni bir akış yakalayıcı oluştur"""
+        return OutputCapture(self)
+
+    def create_spill(self):
+        """Yeni bir taşma dosyası aç"""
+        self.cleanup()
+        handle = uuid.uuid4().hex
+        return handle, open(self._path(handle), 'wb')
+
+    def _path(self, handle: str) -> str:
+        return os.path.join(self.spill_dir, f"{handle}.out")
+
+    def _resolve(self, handle: str) -> str:
+        """Handle'ı doğrula ve dosya yolunu döndür"""
+        if not self.HANDLE_PATTERN.match(handle or ''):
+            raise ValueError("Geçersiz çıktı handle'ı")
+        path = self._path(handle)
+        if not os.path.exists(path):
+            raise FileNotFoundError("Çıktı bulunamadı veya süresi doldu")
+        return path
+
+    def get_size(self, handle: str) -> int:
+        """Saklanan çıktının toplam boyutu (bayt)"""
+        return os.path.getsize(self._resolve(handle))
+
+    def read_range(self, handle: str, offset: int = 0, length: int = 65536) -> Tuple[bytes, int]:
+        """
+        Bayt aralığı oku
+
+        Returns:
+            Tuple[veri, toplam_boyut]
+        """
+        path = self._resolve(handle)
+        length = max(0, min(length, 1024 * 1024))
+        with open(path, 'rb') as f:
+            total = os.fstat(f.fileno()).st_size
+            f.seek(max(0, offset))
+            return f.read(length), total
+
+    def _build_line_index(self, handle: str, path: str) -> List[Tuple[int, int]]:
+        """Her blok başında (önceki satır sayısı, bayt offset'i) kaydeden seyrek indeks"""
+        with self._lock:
+            if handle in self._line_indexes:
+                return self._line_indexes[handle]
+
+        index = [(0, 0)]
+        line_no = 0
+        offset = 0
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.index_block_bytes)
+                if not chunk:
+                    break
+                line_no += chunk.count(b'\n')
+                offset += len(chunk)
+                index.append((line_no, offset))
+
+        with self._lock:
+            self._line_indexes[handle] = index
+        return index
+
+    def read_lines(self, handle: str, start: int = 0, count: int = 500) -> Dict[str, Any]:
+        """Satır sayfası oku (start: 0 tabanlı satır numarası)"""
+        path = self._resolve(handle)
+        start = max(0, start)
+        count = max(1, min(count, 5000))
+
+        # Hedef satırdan önce başlayan en yakın bloğa atla (blok sınırı satır ortasında olabilir)
+        index = self._build_line_index(handle, path)
+        line_no, offset = index[0]
+        for mark_line, mark_offset in index[1:]:
+            if mark_line >= start:
+                break
+            line_no, offset = mark_line, mark_offset
+
+        lines: List[str] = []
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for _ in range(start - line_no):
+                if not f.readline():
+                    break
+            for raw_line in f:
+                lines.append(raw_line.decode('utf-8', errors='replace'))
+                if len(lines) >= count:
+                    break
+            eof = f.readline() == b''
+
+        return {
+            'handle': handle,
+            'start': start,
+            'lines': lines,
+            'next_start': start + len(lines),
+            'eof': eof
+        }
+
+    def cleanup(self) -> None:
+        """Süresi dolan ve toplam sınırı aşan taşma dosyalarını sil (en fazla dakikada bir)"""
+        now = time.time()
+        if now - self._last_cleanup < 60:
+            return
+        self._last_cleanup = now
+
+        try:
+            entries = []
+            for name in os.listdir(self.spill_dir):
+                if not name.endswith('.out'):
+                    continue
+                path = os.path.join(self.spill_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path, name[:-4]))
+        except OSError as e:
+            print(f"⚠️ Çıktı deposu temizleme hatası: {e}")
+            return
+
+        entries.sort()
+        total = sum(size for _, size, _, _ in entries)
+        for mtime, size, path, handle in entries:
+            if now - mtime < self.retention_seconds and total <= self.max_spill_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+            with self._lock:
+                self._line_indexes.pop(handle, None)
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    store = REBELOutputStore()
+
+    print("📦 REBEL Output Capture Test")
+    print("=" * 40)
+
+    capture = store.new_capture()
+    for i in range(200000):
+        capture.write(f"satır {i}\n".encode('utf-8'))
+    data, truncated = capture.finish()
+
+    print(f"Toplam: {capture.total_bytes} bayt, bellekte: {len(data)} bayt, kesildi: {truncated}")
+    print(f"Handle: {capture.handle}")
+    chunk, total = store.read_range(capture.handle, 0, 40)
+    print(f"İlk 40 bayt: {chunk!r} / {total}")
+    page = store.read_lines(capture.handle, 150000, 3)
+    print(f"150000. satırdan sayfa: {page}")
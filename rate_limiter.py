@@ -0,0 +1,242 @@
+# ==========================================
+# 🚦 REBEL AI Rate Limiter - Token Bucket Hız Sınırı
+# ==========================================
+# Geçerli auth token + istemci IP başına token bucket; bilinmeyen token'lar
+# IP başına tek, daha küçük bir kovayı paylaşır (tahmin edilen her token yeni
+# bir dolu kova almaz, tablo tahmin sayısıyla büyümez). Kovalar SQLite'ta
+# tutulur: aynı dosyayı kullanan tüm gunicorn worker'ları aynı sınırı
+# paylaşır. Her kontrol birincil anahtar üzerinden tek satır okuma/yazmadır (O(1)).
+
+import math
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Tuple
+import yaml
+
+
+class REBELRateLimiter:
+    """security.rate_limit ayarlarını uygulayan token bucket sınırlayıcı"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Rate limiter başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.limit_config = self.config.get('security', {}).get('rate_limit', {})
+        self.enabled = self.limit_config.get('enabled', True)
+        self.requests_per_minute = self.limit_config.get('requests_per_minute', 60)
+        self.burst_size = self.limit_config.get('burst_size', 10)
+        # Kimliği doğrulanmamış istekler (bilinmeyen / eksik token): IP başına
+        self.unauthenticated_requests_per_minute = self.limit_config.get('unauthenticated_requests_per_minute', 10)
+        self.unauthenticated_burst_size = self.limit_config.get('unauthenticated_burst_size', 5)
+        self.backend = self.limit_config.get('backend', 'sqlite')
+        self.database_path = self.limit_config.get('database', 'rebel_ratelimit.db')
+        # Bu kadar kontrolde bir, dolmuş (varsayılan duruma dönmüş) kovalar silinir
+        self.cleanup_every = self.limit_config.get('cleanup_every', 1000)
+
+        self._lock = threading.Lock()
+        # memory backend: key -> (tokens, updated_at, full_at)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._checks = 0
+        self.allowed = 0
+        self.limited = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if self.enabled and self.backend == 'sqlite':
+            try:
+                self._db = sqlite3.connect(
+                    self.database_path, timeout=5, check_same_thread=False, isolation_level=None
+                )
+                self._init_schema()
+            except sqlite3.Error as e:
+                print(f"⚠️ Rate limit veritabanı açılamadı, yalnızca bu süreçte uygulanacak: {e}")
+                self._db = None
+                self.backend = 'memory'
+
+        status = f"{self.requests_per_minute}/min, burst={self.burst_size}, backend={self.backend}"
+        print(f"🚦 REBEL Rate Limiter {'active' if self.enabled else 'disabled'} ({status})")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _init_schema(self) -> None:
+        """Kova tablosunu oluştur"""
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                full_at REAL NOT NULL DEFAULT 0
+            )
+        """)
+        # full_at sütunu olmadan oluşturulmuş veritabanları (eski satırlar ilk temizlikte silinir)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(rate_buckets)")}
+        if 'full_at' not in columns:
+            self._db.execute("ALTER TABLE rate_buckets ADD COLUMN full_at REAL NOT NULL DEFAULT 0")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_rate_buckets_full_at ON rate_buckets (full_at)")
+
+    def bucket_key(self, token: str, client_ip: Optional[str]) -> str:
+        """Geçerli token kovası; token'ın kendisi saklanmaz: özetin kısa öneki + IP"""
+        digest = hashlib.sha256((token or '').encode('utf-8')).hexdigest()[:16]
+        return f"{digest}|{client_ip or '-'}"
+
+    def unauthenticated_key(self, client_ip: Optional[str]) -> str:
+        """Bilinmeyen token'ların IP başına ortak kovası"""
+        return f"unauth|{client_ip or '-'}"
+
+    def _take(self, tokens: float, updated_at: float, now: float,
+              rate: float, capacity: float) -> Tuple[float, bool]:
+        """Kovayı geçen süre kadar doldur, bir token almayı dene"""
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+        if tokens >= 1:
+            return tokens - 1, True
+        return tokens, False
+
+    def _check_sqlite(self, key: str, now: float, rate: float, capacity: float) -> Tuple[float, bool]:
+        with self._lock:
+            # IMMEDIATE: okuma-değiştirme-yazma diğer worker'larla yarışmasın
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT tokens, updated_at FROM rate_buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated_at = row if row is not None else (capacity, now)
+                tokens, taken = self._take(tokens, updated_at, now, rate, capacity)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO rate_buckets (key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?)",
+                    (key, tokens, now, now + (capacity - tokens) / rate)
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return tokens, taken
+
+    def _check_memory(self, key: str, now: float, rate: float, capacity: float) -> Tuple[float, bool]:
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+            tokens, taken = self._take(tokens, updated_at, now, rate, capacity)
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+        return tokens, taken
+
+    def check(self, token: str, client_ip: Optional[str],
+              requests_per_minute: Optional[float] = None,
+              burst_size: Optional[float] = None) -> Tuple[bool, int]:
+        """
+        Geçerli token'lı istek için bir token harca
+
+        requests_per_minute / burst_size verilmezse config değerleri kullanılır.
+
+        Returns:
+            Tuple[izin_verildi_mi, Retry-After saniyesi (izin verildiyse 0)]
+        """
+        return self._check(
+            self.bucket_key(token, client_ip),
+            requests_per_minute or self.requests_per_minute,
+            burst_size or self.burst_size
+        )
+
+    def check_unauthenticated(self, client_ip: Optional[str]) -> Tuple[bool, int]:
+        """Bilinmeyen / eksik token'lı istek: token ne olursa olsun IP'nin ortak kovasından harca"""
+        return self._check(
+            self.unauthenticated_key(client_ip),
+            self.unauthenticated_requests_per_minute,
+            self.unauthenticated_burst_size
+        )
+
+    def _check(self, key: str, requests_per_minute: float, burst_size: float) -> Tuple[bool, int]:
+        if not self.enabled:
+            return True, 0
+
+        rate = requests_per_minute / 60.0
+        capacity = max(1.0, float(burst_size))
+        now = time.time()
+
+        try:
+            if self._db is not None:
+                tokens, taken = self._check_sqlite(key, now, rate, capacity)
+            else:
+                tokens, taken = self._check_memory(key, now, rate, capacity)
+        except sqlite3.Error as e:
+            # Sınırlayıcı arızası isteği engellemesin
+            print(f"⚠️ Rate limit kontrol hatası: {e}")
+            return True, 0
+
+        with self._lock:
+            self._checks += 1
+            if taken:
+                self.allowed += 1
+            else:
+                self.limited += 1
+            should_cleanup = self._checks % self.cleanup_every == 0
+
+        if should_cleanup:
+            self.cleanup()
+
+        if taken:
+            return True, 0
+        return False, max(1, int(math.ceil((1 - tokens) / rate)))
+
+    def cleanup(self) -> int:
+        """
+        Boşta kalıp tamamen dolmuş kovaları sil; silinen sayısı
+
+        Dolmuş kova yeni kovayla aynıdır: silmek sınırı gevşetmez. full_at her
+        kovanın kendi hız / kapasitesiyle hesaplandığından politikadan bağımsızdır.
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                if self._db is not None:
+                    return self._db.execute("DELETE FROM rate_buckets WHERE full_at <= ?", (now,)).rowcount
+                before = len(self._buckets)
+                self._buckets = {
+                    key: bucket for key, bucket in self._buckets.items() if bucket[2] > now
+                }
+                return before - len(self._buckets)
+        except sqlite3.Error as e:
+            print(f"⚠️ Rate limit temizleme hatası: {e}")
+            return 0
+
+    def get_status(self) -> Dict[str, Any]:
+        """Sınırlayıcı ayarları ve sayaçları"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'backend': self.backend,
+                'requests_per_minute': self.requests_per_minute,
+                'burst_size': self.burst_size,
+                'unauthenticated_requests_per_minute': self.unauthenticated_requests_per_minute,
+                'unauthenticated_burst_size': self.unauthenticated_burst_size,
+                'allowed': self.allowed,
+                'limited': self.limited
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    limiter = REBELRateLimiter()
+
+    print("🚦 REBEL Rate Limiter Test")
+    print("=" * 40)
+
+    verdicts = [limiter.check("test-token", "127.0.0.1") for _ in range(limiter.burst_size + 3)]
+    print(f"İzin verilen: {sum(1 for allowed, _ in verdicts if allowed)}/{len(verdicts)}")
+    print(f"Son istek Retry-After: {verdicts[-1][1]}s")
+
+    guesses = [limiter.check_unauthenticated("10.9.9.9") for _ in range(50)]
+    print(f"50 farklı token tahmini, izin verilen: {sum(1 for allowed, _ in guesses if allowed)}")
+
+    start = time.perf_counter()
+    for i in range(2000):
+        limiter.check("bench-token", f"10.0.{i % 250}.1")
+    print(f"2000 kontrol: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"\n📊 Durum: {limiter.get_status()}")
@@ -10,25 +10,35 @@ import yaml
 import platform
 import subprocess
 import datetime
-import shlex
 import signal
 import logging
-import hmac
+import atexit
+import zlib
 import hashlib
-import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-from flask import Flask, render_template, request, jsonify, send_file
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Callable
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context, make_response
 from functools import wraps
-try:
-    import fcntl
-except ImportError:
-    # Windows doesn't have fcntl, we'll handle this gracefully
-    fcntl = None
-
 # REBEL AI modülleri
 from ai_engine import REBELAIEngine
-from dijkstra_scheduler import REBELDijkstraScheduler
+from dijkstra_scheduler import REBELDijkstraScheduler, CommandNode
+from async_executor import REBELAsyncExecutor
+from dag_executor import REBELDAGExecutor
+from job_manager import REBELJobManager
+from result_cache import REBELResultCache
+from executable_table import REBELExecutableTable
+from native_commands import REBELNativeCommands
+from adaptive_timeouts import REBELAdaptiveTimeouts
+from cancellation import CancellationToken, DisconnectWatcher
+from command_validator import REBELCommandValidator
+from rate_limiter import REBELRateLimiter
+from token_registry import REBELTokenRegistry
+from admission_control import REBELAdmissionController
+from json_log_writer import REBELLogWriter
+from log_store import REBELLogStore, parse_time
+from history_store import REBELHistoryStore
+from history_suggest import REBELHistorySuggester
 
 app = Flask(__name__)
 
@@ -44,10 +54,27 @@ class REBELAIManager:
         
         # Güvenlik kontrolü
         self._validate_auth_tokens()
+        self.token_registry = REBELTokenRegistry(self.auth_token, self.admin_token, config_path)
+        self.rate_limiter = REBELRateLimiter(config_path)
         
         # Modülleri başlat
-        self.ai_engine = REBELAIEngine(config_path)
+        self.adaptive_timeouts = REBELAdaptiveTimeouts(config_path)
+        self.ai_engine = REBELAIEngine(config_path, self.adaptive_timeouts)
         self.scheduler = REBELDijkstraScheduler(config_path)
+        self.executor = REBELAsyncExecutor(config_path)
+        self.dag_executor = REBELDAGExecutor(config_path)
+        self.result_cache = REBELResultCache(config_path)
+        self.job_manager = REBELJobManager(self.process_user_input, config_path)
+        # Çalıştırma istekleri için uyarlanır eşzamanlılık sınırı (aşırı yükte 503)
+        self.admission = REBELAdmissionController(config_path)
+        
+        # Toplu istekler: paylaşılan, sınırlı worker havuzu (/api/execute/batch)
+        self.batch_config = self.config.get('batch', {})
+        self.batch_max_items = self.batch_config.get('max_items', 100)
+        self.batch_pool = ThreadPoolExecutor(
+            max_workers=self.batch_config.get('max_concurrency', 8),
+            thread_name_prefix="rebel-batch"
+        )
         
         # Log sistemi
         self._setup_logging()
@@ -55,20 +82,29 @@ class REBELAIManager:
         # Platform ayarları
         self.platform_config = self._setup_platform()
         
-        # Güvenlik kısıtlamaları
-        self.allowed_commands = set(self.config.get('security_restrictions', {}).get('allowed_commands', []))
-        self.blocked_commands = set(self.config.get('security_restrictions', {}).get('blocked_commands', []))
-        self.allowed_flags = self.config.get('security_restrictions', {}).get('allowed_flags', {})
+        # Güvenlik kısıtlamaları: bir kez derlenir, kararlar LRU önbellekte
+        self.validator = REBELCommandValidator(self.platform_name, config_path)
         
-        # Güvenlik regex'leri
-        self.DISALLOWED_CHARS = re.compile(r"[;&|`$()<>\n\r\x00-\x1f]")
-        self.MAX_COMMAND_LENGTH = 256
+        # İzinli komutların mutlak yolları (her çalıştırmada PATH taranmaz)
+        self.executable_table = REBELExecutableTable(
+            self.validator.allowed_commands,
+            self._build_safe_env()['PATH'],
+            config_path
+        )
         
         # Güvenli çalışma dizini
         self.execution_root = self.config.get('execution_root', os.getcwd())
         
-        # Cache
-        self.command_history = []
+        # Süreç açmadan yanıtlanan bilgi komutları; sabit çıktılılar gerçek komutla doğrulanır
+        self.native_commands = REBELNativeCommands(config_path)
+        if self.native_commands.enabled:
+            self.native_commands.verify(lambda argv: self._run_safe_command(argv)['stdout'])
+        
+        # Kalıcı komut geçmişi (SQLite/WAL, tüm worker'lar arasında ortak)
+        self.history_store = REBELHistoryStore(config_path)
+        atexit.register(self.history_store.shutdown)
+        # Geçmiş komut ve doğal dil girdileri için önek indeksi (/api/history/suggest)
+        self.history_suggest = REBELHistorySuggester(self.history_store, config_path)
         self.favorites = self.config.get('ui', {}).get('favorite_commands', [])
         
         self._log_startup()
@@ -129,15 +165,15 @@ class REBELAIManager:
         # Log dosya yolunu ayarla
         self.log_file = log_path
         
-        # Logger konfigürasyonu
-        logging.basicConfig(
-            filename=self.log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # JSON kayıtları (NDJSON) arka plan thread'inde toplu yazılır; kapanışta kuyruk boşaltılır
+        self.log_writer = REBELLogWriter(self.log_file, self.config_path)
+        atexit.register(self.log_writer.shutdown)
+        # Zaman indeksli sorgu (/api/logs/query)
+        self.log_store = REBELLogStore(self.log_file, self.config_path)
         
+        # Metin logları yalnızca konsola: log dosyası satır başına bir JSON kayıt kalır
         self.logger = logging.getLogger('REBEL_AI')
+        self.logger.setLevel(logging.INFO)
         
         # Console handler
         console_handler = logging.StreamHandler()
@@ -197,127 +233,96 @@ class REBELAIManager:
         self.logger.info(f"REBEL AI started on {self.platform_name}")
     
     def _write_json_log(self, log_data: Dict[str, Any]) -> None:
-        """JSON formatında log yaz"""
-        if not hasattr(self, 'log_file'):
+        """JSON formatında log yaz (kuyruğa bırakır, dosya işlemi istek yolunda yapılmaz)"""
+        if not hasattr(self, 'log_writer'):
             return
         
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                # File locking (Unix/Linux only)
-                if fcntl:
-                    try:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                    except (OSError, AttributeError):
-                        pass  # Windows or unsupported platform
-                
-                try:
-                    json.dump(log_data, f, ensure_ascii=False)
-                    f.write('\\n')
-                finally:
-                    if fcntl:
-                        try:
-                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                        except (OSError, AttributeError):
-                            pass
-        except Exception as e:
-            print(f"⚠️ Log yazma hatası: {e}")
+        self.log_writer.write(log_data)
     
     def validate_token(self, token: str, is_admin: bool = False) -> bool:
-        """Güvenli token doğrulama (constant-time comparison)"""
-        if not token:
-            return False
-        
-        expected_token = self.admin_token if is_admin else self.auth_token
-        if not expected_token:
-            return False
-        
-        # Constant-time comparison to prevent timing attacks
-        return hmac.compare_digest(str(token), str(expected_token))
+        """Güvenli token doğrulama (özet ile O(1) arama + constant-time comparison)"""
+        policy = self.token_registry.lookup(token)
+        return policy is not None and policy.allows(is_admin)
     
     def _validate_user_input(self, user_input: str) -> None:
         """Kullanıcı girdisini güvenlik açısından doğrula"""
-        if not user_input:
-            raise ValueError("Boş girdi")
-        
-        if len(user_input) > self.MAX_COMMAND_LENGTH:
-            raise ValueError(f"Girdi çok uzun (max {self.MAX_COMMAND_LENGTH} karakter)")
-        
-        # Kontrol karakterlerini kontrol et
-        if any(ord(c) < 32 for c in user_input if c not in '\t\n\r'):
-            raise ValueError("Geçersiz kontrol karakterleri")
+        self.validator.check_input(user_input)
     
     def _build_safe_argv(self, cmd_str: str) -> List[str]:
-        """Güvenli komut argümanları oluştur"""
-        if not cmd_str or len(cmd_str) > self.MAX_COMMAND_LENGTH:
-            raise ValueError("Geçersiz komut uzunluğu")
-        
-        if self.DISALLOWED_CHARS.search(cmd_str):
-            raise ValueError("Yasaklı karakterler tespit edildi")
-        
-        try:
-            argv = shlex.split(cmd_str, posix=(self.platform_name != 'windows'))
-        except ValueError as e:
-            raise ValueError(f"Komut ayrıştırma hatası: {e}")
-        
-        if not argv:
-            raise ValueError("Boş komut")
-        
-        # Temel komut kontrolü
-        base_command = Path(argv[0]).name
-        if base_command in self.blocked_commands:
-            raise ValueError(f"Yasaklı komut: {base_command}")
-        
-        if self.allowed_commands and base_command not in self.allowed_commands:
-            raise ValueError(f"İzinli komutlar listesinde değil: {base_command}")
-        
-        # Flag kontrolü
-        allowed_flags_for_cmd = self.allowed_flags.get(base_command, [])
-        for arg in argv[1:]:
-            if arg.startswith('-') and arg not in allowed_flags_for_cmd:
-                raise ValueError(f"İzinli flag listesinde değil: {arg}")
-        
-        return [base_command] + argv[1:]
+        """Güvenli komut argümanları oluştur (girdi kontrolleri dahil, tek geçiş)"""
+        return self.validator.validate(cmd_str)
     
-    def _run_safe_command(self, argv: List[str]) -> Dict[str, Any]:
-        """Güvenli komut çalıştırma"""
-        # Güvenli çevre değişkenleri
-        safe_env = {
+    def _build_safe_env(self) -> Dict[str, str]:
+        """Güvenli çevre değişkenleri"""
+        return {
             'PATH': '/usr/bin:/bin:/usr/local/bin' if self.platform_name != 'windows' else os.environ.get('PATH', ''),
             'LANG': 'C.UTF-8',
             'HOME': '/tmp' if self.platform_name != 'windows' else os.environ.get('TEMP', 'C:\\temp')
         }
+    
+    def _resolve_executable(self, base_command: str) -> str:
+        """Komutun başlangıçta çözülmüş mutlak yolu"""
+        executable = self.executable_table.resolve(base_command)
+        if executable is None:
+            raise ValueError(f"Komut bulunamadı: {base_command}")
+        return executable
+    
+    def _run_safe_command(self, argv: List[str], cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Güvenli komut çalıştırma (cancel_token iptal edilirse süreç grubu öldürülür)"""
+        safe_env = self._build_safe_env()
+        executable = self._resolve_executable(argv[0])
+        # Geçmiş sürelerden öğrenilen zaman aşımı (ölçüm yoksa varsayılan)
+        timeout = self.adaptive_timeouts.get_timeout(argv[0], self.executor.default_timeout)
+        
+        def record_sample(future) -> None:
+            # Süreç başına tek örnek: aynı çalıştırmaya bağlanan çağıranlar kaydetmez.
+            # İptal edilen çalıştırma süre örneği değildir.
+            if future.cancelled():
+                return
+            error = future.exception()
+            if isinstance(error, subprocess.TimeoutExpired):
+                self.adaptive_timeouts.record(argv[0], timeout, timed_out=True)
+            elif error is None:
+                self.adaptive_timeouts.record(argv[0], future.result()['execution_time'])
         
         try:
-            result = subprocess.run(
+            # asyncio motoru üzerinden çalıştır (shell yok, çözülmüş yol doğrudan exec edilir)
+            return self.executor.run(
                 argv,
-                shell=False,  # Kritik güvenlik: shell=False
-                capture_output=True,
-                text=True,
-                timeout=15,  # Kısa timeout
                 env=safe_env,
-                cwd=self.execution_root
+                cwd=self.execution_root,
+                timeout=timeout,
+                executable=executable,
+                cancel_token=cancel_token,
+                on_complete=record_sample
             )
-            
-            return {
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode
-            }
         except subprocess.TimeoutExpired:
-            raise RuntimeError("Komut timeout")
+            raise RuntimeError(f"Komut timeout ({timeout:.2f}s)")
+        except CancelledError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Komut çalıştırma hatası: {e}")
     
+    def _output_refs(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Diske taşan çıktılar için handle ve boyut bilgileri"""
+        return {
+            'output_bytes': result.get('stdout_bytes', 0),
+            'output_truncated': result.get('stdout_truncated', False),
+            'output_handle': result.get('stdout_handle'),
+            'error_bytes': result.get('stderr_bytes', 0),
+            'error_truncated': result.get('stderr_truncated', False),
+            'error_handle': result.get('stderr_handle')
+        }
+    
     def is_command_safe(self, command: str) -> Tuple[bool, str]:
         """Komutun güvenli olup olmadığını kontrol et"""
         try:
-            self._validate_user_input(command)
-            self._build_safe_argv(command)
-            return True, "Güvenli komut"
-        except ValueError as e:
-            return False, str(e)
+            _, error = self.validator.verdict(command)
         except Exception as e:
             return False, f"Güvenlik kontrolü hatası: {e}"
+        if error is not None:
+            return False, error
+        return True, "Güvenli komut"
     
     def _execute_gui_command(self, gui_command: str, start_time: datetime.datetime) -> Dict[str, Any]:
         """GUI komutunu çalıştır"""
@@ -341,18 +346,9 @@ class REBELAIManager:
                 'is_admin': False
             }
             
-            # Başarılı GUI komutlarını geçmişe ekle
+            # Başarılı GUI komutlarını geçmişe ekle (kuyruğa bırakılır, toplu yazılır)
             if success:
-                self.command_history.append({
-                    'command': f"GUI:{gui_command}",
-                    'timestamp': start_time.isoformat(),
-                    'platform': self.platform_name
-                })
-                
-                # Geçmiş limitini kontrol et
-                history_limit = self.config.get('ui', {}).get('command_history_limit', 100)
-                if len(self.command_history) > history_limit:
-                    self.command_history = self.command_history[-history_limit:]
+                self.history_store.append(f"GUI:{gui_command}", start_time.isoformat(), self.platform_name)
             
             self._write_json_log(command_result)
             return command_result
@@ -373,8 +369,14 @@ class REBELAIManager:
             self._write_json_log(error_result)
             return error_result
     
-    def execute_command(self, command: str, is_admin: bool = False) -> Dict[str, Any]:
-        """Güvenli komut çalıştırma"""
+    def execute_command(self, command: str, is_admin: bool = False,
+                        cancel_token: Optional[CancellationToken] = None,
+                        user_input: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Güvenli komut çalıştırma (cancel_token: istemci ayrılınca / iş iptalinde süreci durdurur)
+        
+        user_input: komutu üreten doğal dil girdisi (geçmişe ve önerilere komutla birlikte yazılır)
+        """
         start_time = datetime.datetime.now()
         
         try:
@@ -383,30 +385,19 @@ class REBELAIManager:
                 gui_command = command[4:]  # "GUI:" prefix'ini kaldır
                 return self._execute_gui_command(gui_command, start_time)
             
-            # Input validation
-            self._validate_user_input(command)
-            
-            # Güvenli argv oluştur
+            # Tek geçişte doğrulama ve güvenli argv (admin için de aynı kurallar)
             argv = self._build_safe_argv(command)
             
-            # Admin değilse ekstra güvenlik kontrolü
-            if not is_admin:
-                is_safe, safety_message = self.is_command_safe(command)
-                if not is_safe:
-                    error_result = {
-                        'success': False,
-                        'output': '',
-                        'error': f"🚫 Güvenlik: {safety_message}",
-                        'command': command,
-                        'platform': self.platform_name,
-                        'execution_time': 0,
-                        'timestamp': start_time.isoformat()
-                    }
-                    self._write_json_log(error_result)
-                    return error_result
-            
-            # Güvenli komut çalıştırma
-            result = self._run_safe_command(argv)
+            # Önce süreç içi işleyici, sonra önbellek, en son alt süreç
+            result = self.native_commands.run(argv, self.execution_root)
+            native = result is not None
+            cached = False
+            if not native:
+                result = self.result_cache.get(argv, self.execution_root, self.platform_name)
+                cached = result is not None
+                if not cached:
+                    result = self._run_safe_command(argv, cancel_token)
+                    self.result_cache.put(argv, self.execution_root, self.platform_name, result)
             
             # Sonucu hazırla
             end_time = datetime.datetime.now()
@@ -422,21 +413,21 @@ class REBELAIManager:
                 'returncode': result['returncode'],
                 'execution_time': execution_time,
                 'timestamp': start_time.isoformat(),
-                'is_admin': is_admin
+                'is_admin': is_admin,
+                'cached': cached,
+                'native': native,
+                'structured': result.get('structured'),
+                # Önbellekten gelen sonuç yeni süreç çalıştırmadı
+                'resources': None if cached else result.get('resources'),
+                **self._output_refs(result)
             }
             
-            # Başarılı komutları geçmişe ekle
+            if not cached:
+                self.scheduler.record_execution(command, execution_time, result.get('resources'))
+            
+            # Başarılı komutları geçmişe ekle (kuyruğa bırakılır, toplu yazılır)
             if command_result['success']:
-                self.command_history.append({
-                    'command': command,
-                    'timestamp': start_time.isoformat(),
-                    'platform': self.platform_name
-                })
-                
-                # Geçmiş limitini kontrol et
-                history_limit = self.config.get('ui', {}).get('command_history_limit', 100)
-                if len(self.command_history) > history_limit:
-                    self.command_history = self.command_history[-history_limit:]
+                self.history_store.append(command, start_time.isoformat(), self.platform_name, user_input)
             
             # JSON log yaz (token'ları loglamayın)
             log_data = command_result.copy()
@@ -446,6 +437,21 @@ class REBELAIManager:
             
             return command_result
             
+        except CancelledError as e:
+            cancelled_result = {
+                'success': False,
+                'output': '',
+                'error': f"🛑 İptal edildi: {str(e) or 'İptal edildi'}",
+                'command': command,
+                'platform': self.platform_name,
+                'execution_time': (datetime.datetime.now() - start_time).total_seconds(),
+                'timestamp': start_time.isoformat(),
+                'is_admin': is_admin,
+                'cancelled': True
+            }
+            self._write_json_log(cancelled_result)
+            return cancelled_result
+            
         except Exception as e:
             error_result = {
                 'success': False,
@@ -460,6 +466,87 @@ class REBELAIManager:
             self._write_json_log(error_result)
             return error_result
     
+    def stream_command(self, command: str, is_admin: bool = False,
+                       user_input: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Komutu çalıştır ve çıktıyı satır satır olay olarak üret
+        
+        Olaylar: {'event': 'stdout'|'stderr', 'line': ...} ve son olarak
+        execute_command sonucu ile aynı alanları taşıyan {'event': 'exit', ...}
+        user_input: komutu üreten doğal dil girdisi (geçmişe komutla birlikte yazılır)
+        """
+        start_time = datetime.datetime.now()
+        
+        try:
+            # GUI komutları tek seferde sonuçlanır
+            if command.startswith("GUI:"):
+                yield {'event': 'exit', **self._execute_gui_command(command[4:], start_time)}
+                return
+            
+            # Tek geçişte doğrulama ve güvenli argv (admin için de aynı kurallar)
+            argv = self._build_safe_argv(command)
+            
+            executable = self._resolve_executable(argv[0])
+        except Exception as e:
+            error_result = {
+                'success': False,
+                'output': '',
+                'error': f"❌ Execution error: {str(e)}",
+                'command': command,
+                'platform': self.platform_name,
+                'execution_time': 0,
+                'timestamp': start_time.isoformat(),
+                'is_admin': is_admin
+            }
+            self._write_json_log(error_result)
+            yield {'event': 'exit', **error_result}
+            return
+        
+        command_result = {
+            'success': False,
+            'output': '',
+            'error': '',
+            'command': command,
+            'platform': self.platform_name,
+            'shell': self.platform_config['shell'],
+            'returncode': None,
+            'timestamp': start_time.isoformat(),
+            'is_admin': is_admin
+        }
+        
+        # Satırlar geldikçe iletilir; tam çıktı bellekte biriktirilmez
+        for event, payload in self.executor.stream(argv, env=self._build_safe_env(), cwd=self.execution_root,
+                                                   executable=executable):
+            if event in ('stdout', 'stderr'):
+                yield {'event': event, 'line': payload}
+            elif event == 'exit':
+                command_result['returncode'] = payload['returncode']
+                command_result['success'] = payload['returncode'] == 0 and not payload['timed_out']
+                command_result['output'] = payload['stdout']
+                command_result['error'] = payload['stderr']
+                command_result['resources'] = payload.get('resources')
+                command_result.update(self._output_refs(payload))
+                if payload['timed_out']:
+                    command_result['error'] += "Komut timeout"
+                    yield {'event': 'stderr', 'line': "Komut timeout"}
+            elif event == 'error':
+                command_result['error'] = payload
+                yield {'event': 'stderr', 'line': payload}
+        
+        command_result['execution_time'] = (datetime.datetime.now() - start_time).total_seconds()
+        
+        # Başarılı komutları geçmişe ekle (kuyruğa bırakılır, toplu yazılır)
+        if command_result['success']:
+            self.history_store.append(command, start_time.isoformat(), self.platform_name, user_input)
+        
+        self._write_json_log(command_result)
+        
+        # Son çerçeve: çıktı zaten akıtıldı, tekrar gönderme
+        yield {
+            'event': 'exit',
+            **{key: value for key, value in command_result.items() if key not in ('output', 'error')}
+        }
+    
     def _execute_windows_command(self, command: str) -> Dict[str, Any]:
         """Windows komut çalıştırma"""
         shell_executable = self.platform_config['shell_executable']
@@ -510,8 +597,15 @@ class REBELAIManager:
             'returncode': result.returncode
         }
     
-    def process_user_input(self, user_input: str, use_ai: bool = True, use_scheduler: bool = True) -> Dict[str, Any]:
-        """Kullanıcı girdisini güvenli şekilde işle"""
+    def process_user_input(self, user_input: str, use_ai: bool = True, use_scheduler: bool = True,
+                           progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """
+        Kullanıcı girdisini güvenli şekilde işle
+        
+        progress_callback: her komut bittiğinde çağrılır
+        cancel_token: iptal edilince çalışan komut durdurulur, kalan düğümler çalıştırılmaz
+        """
         processing_start = datetime.datetime.now()
         
         try:
@@ -552,26 +646,48 @@ class REBELAIManager:
         # Scheduler ile optimizasyon
         optimized_commands = [interpreted_command]
         optimization_info = {}
+        plan_nodes = self.scheduler.build_command_graph(optimized_commands)
         
         if use_scheduler and self.config.get('scheduler', {}).get('enabled', True):
             try:
-                optimized_commands, optimization_info = self.scheduler.optimize_command_sequence(interpreted_command)
+                plan_nodes, optimization_info = self.scheduler.build_execution_plan(interpreted_command)
+                optimized_commands = [node.command for node in plan_nodes]
             except Exception as e:
                 print(f"⚠️ Scheduler hatası: {e}")
         
-        # Komutları çalıştır
-        results = []
-        for cmd in optimized_commands:
-            result = self.execute_command(cmd)
-            results.append(result)
+        # Komutları çalıştır (bağımsız düğümler paralel, sonuçlar plan sırasında)
+        def run_plan_node(node: CommandNode) -> Dict[str, Any]:
+            if cancel_token is not None and cancel_token.cancelled:
+                result = {
+                    'success': False,
+                    'output': '',
+                    'error': f"🛑 İptal edildi: {cancel_token.reason}",
+                    'command': node.command,
+                    'platform': self.platform_name,
+                    'execution_time': 0,
+                    'timestamp': datetime.datetime.now().isoformat(),
+                    'cancelled': True
+                }
+            else:
+                result = self.execute_command(
+                    node.command, cancel_token=cancel_token,
+                    user_input=user_input if user_input != node.command else None
+                )
             
-            # Eğer bir komut başarısız olursa ve AI varsa, hata analizi yap
-            if not result['success'] and use_ai and self.ai_engine.openai_client:
+            # Eğer bir komut başarısız olursa ve AI varsa, hata analizi yap (iptalde gereksiz)
+            if not result['success'] and not result.get('cancelled') and use_ai and self.ai_engine.openai_client:
                 try:
-                    error_analysis = self.ai_engine.analyze_error(cmd, result['error'])
+                    error_analysis = self.ai_engine.analyze_error(node.command, result['error'])
                     result['ai_error_analysis'] = error_analysis
                 except Exception as e:
                     result['ai_error_analysis'] = f"Hata analizi yapılamadı: {str(e)}"
+            
+            if progress_callback:
+                progress_callback(result)
+            
+            return result
+        
+        results = self.dag_executor.execute(plan_nodes, run_plan_node)
         
         # Sonuç paketi
         processing_end = datetime.datetime.now()
@@ -589,24 +705,156 @@ class REBELAIManager:
             'processing_time': processing_time,
             'timestamp': processing_start.isoformat()
         }
+    
+    def parse_batch_items(self, data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Toplu istek gövdesini ayrıştır ve tüm girdileri çalıştırmadan önce doğrula
+        
+        Öğe: "komut" ya da {'command', 'use_ai', 'use_scheduler'}; eksik seçenekler
+        gövdedeki varsayılanlardan gelir.
+        
+        Returns:
+            Tuple[öğeler, hatalar] - hatalar: [{'index', 'error'}, ...]
+        """
+        raw_items = data.get('commands')
+        if not isinstance(raw_items, list) or not raw_items:
+            return [], [{'index': None, 'error': "'commands' boş olmayan bir liste olmalı"}]
+        if len(raw_items) > self.batch_max_items:
+            return [], [{'index': None, 'error': f"En fazla {self.batch_max_items} komut gönderilebilir"}]
+        
+        default_use_ai = data.get('use_ai', True)
+        default_use_scheduler = data.get('use_scheduler', True)
+        items: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        
+        for index, raw_item in enumerate(raw_items):
+            if isinstance(raw_item, str):
+                raw_item = {'command': raw_item}
+            if not isinstance(raw_item, dict):
+                errors.append({'index': index, 'error': "Öğe metin ya da nesne olmalı"})
+                continue
+            
+            command = str(raw_item.get('command', '')).strip()
+            try:
+                if not command:
+                    raise ValueError("Command required")
+                self._validate_user_input(command)
+            except ValueError as e:
+                errors.append({'index': index, 'error': f"Geçersiz girdi: {str(e)}"})
+                continue
+            
+            items.append({
+                'command': command,
+                'use_ai': bool(raw_item.get('use_ai', default_use_ai)),
+                'use_scheduler': bool(raw_item.get('use_scheduler', default_use_scheduler))
+            })
+        
+        return items, errors
+    
+    def process_batch(self, items: List[Dict[str, Any]],
+                      cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Doğrulanmış öğeleri eşzamanlı çalıştır, sonuçları istek sırasıyla döndür"""
+        batch_start = datetime.datetime.now()
+        
+        futures = [
+            self.batch_pool.submit(self.process_user_input, item['command'], item['use_ai'], item['use_scheduler'],
+                                   cancel_token=cancel_token)
+            for item in items
+        ]
+        
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({
+                    'user_input': item['command'],
+                    'error': f"Toplu çalıştırma hatası: {str(e)}",
+                    'success': False
+                })
+        
+        succeeded = sum(1 for result in results if result.get('success'))
+        return {
+            'results': results,
+            'count': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'success': succeeded == len(results),
+            'total_time': (datetime.datetime.now() - batch_start).total_seconds(),
+            'timestamp': batch_start.isoformat()
+        }
 
 
 # Flask web uygulaması
 rebel_manager = REBELAIManager()
 
 # Güvenlik middleware ve decorator'ları
-def require_auth(admin=False):
-    """Decorator for authentication requirement"""
+def require_auth(admin=False, rate_limited=True):
+    """
+    Decorator for authentication requirement
+    
+    rate_limited=False: geçerli token'lar hız bütçesi harcamaz (tuş başına çağrılan
+    bellek içi okumalar); bilinmeyen token denemeleri yine sınırlanır.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             token = request.headers.get('X-Auth-Token', '')
-            if not rebel_manager.validate_token(token, is_admin=admin):
+            policy = rebel_manager.token_registry.lookup(token)
+            
+            # Hız sınırı doğrulamadan önce: bilinmeyen token'lar IP başına tek kovayı
+            # paylaşır, her tahmin yeni bir dolu kova almaz
+            if policy is None:
+                allowed, retry_after = rebel_manager.rate_limiter.check_unauthenticated(request.remote_addr)
+            elif rate_limited:
+                allowed, retry_after = rebel_manager.rate_limiter.check(
+                    token, request.remote_addr, policy.requests_per_minute, policy.burst_size
+                )
+            else:
+                allowed, retry_after = True, 0
+            if not allowed:
+                return too_many_requests_response(retry_after)
+            if policy is None or not policy.allows(admin):
                 return jsonify({'error': 'Unauthorized'}), 401
-            return func(*args, **kwargs)
+            
+            # Token başına eşzamanlılık bütçesi: slot yanıt kapanınca (akış bitince) bırakılır
+            if not rebel_manager.token_registry.acquire(policy):
+                return too_many_requests_response(1)
+            try:
+                response = make_response(func(*args, **kwargs))
+            except BaseException:
+                rebel_manager.token_registry.release(policy)
+                raise
+            response.call_on_close(lambda: rebel_manager.token_registry.release(policy))
+            return response
         return wrapper
     return decorator
 
+def too_many_requests_response(retry_after: int):
+    """Hız / eşzamanlılık sınırı aşıldı: 429 + Retry-After"""
+    response = jsonify({'error': 'Too Many Requests', 'retry_after': retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+def overloaded_response(retry_after: int):
+    """Kabul kontrolü reddi: hızlı 503 + Retry-After"""
+    response = jsonify({'error': 'Service Overloaded', 'retry_after': retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+def require_admission(func):
+    """Decorator: isteği kabul kontrolünden geçir, yanıt dönünce slotu bırak"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        ticket, retry_after = rebel_manager.admission.acquire()
+        if ticket is None:
+            return overloaded_response(retry_after)
+        with ticket:
+            return func(*args, **kwargs)
+    return wrapper
+
 @app.after_request
 def add_security_headers(response):
     """Güvenlik başlıklarını ekle"""
@@ -647,6 +895,7 @@ def home():
 
 @app.route("/api/execute", methods=["POST"])
 @require_auth(admin=False)
+@require_admission
 def api_execute():
     """Komut çalıştırma API"""
     try:
@@ -661,8 +910,10 @@ def api_execute():
         if not user_input:
             return jsonify({"error": "Command required"}), 400
         
-        # Komutu işle
-        result = rebel_manager.process_user_input(user_input, use_ai, use_scheduler)
+        # Komutu işle (istemci bağlantıyı kapatırsa çalışan süreç öldürülür)
+        token = CancellationToken()
+        with DisconnectWatcher(request.environ, token):
+            result = rebel_manager.process_user_input(user_input, use_ai, use_scheduler, cancel_token=token)
         
         return jsonify(result)
         
@@ -670,8 +921,185 @@ def api_execute():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/execute/batch", methods=["POST"])
+@require_auth(admin=False)
+@require_admission
+def api_execute_batch():
+    """Birden çok bağımsız komutu tek istekte çalıştıran API"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "JSON data required"}), 400
+    
+    # Herhangi bir öğe geçersizse hiçbiri çalıştırılmaz
+    items, errors = rebel_manager.parse_batch_items(data)
+    if errors:
+        return jsonify({"error": "Geçersiz toplu istek", "errors": errors}), 400
+    
+    try:
+        token = CancellationToken()
+        with DisconnectWatcher(request.environ, token):
+            result = rebel_manager.process_batch(items, cancel_token=token)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/execute/stream", methods=["POST"])
+@require_auth(admin=False)
+def api_execute_stream():
+    """Komut çıktısını Server-Sent Events olarak akıtan API"""
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "JSON data required"}), 400
+    
+    user_input = data.get("command", "").strip()
+    use_ai = data.get("use_ai", True)
+    
+    if not user_input:
+        return jsonify({"error": "Command required"}), 400
+    
+    try:
+        rebel_manager._validate_user_input(user_input)
+    except ValueError as e:
+        return jsonify({"error": f"Geçersiz girdi: {str(e)}"}), 400
+    
+    # Slot akış kapanana kadar tutulur; akış süresi yük ölçüsü değildir
+    ticket, retry_after = rebel_manager.admission.acquire()
+    if ticket is None:
+        return overloaded_response(retry_after)
+    
+    # AI ile komut yorumlama (tek komut)
+    command = user_input
+    ai_explanation = "AI kullanılmadı"
+    if use_ai:
+        try:
+            command, ai_explanation, ai_confident = rebel_manager.ai_engine.interpret_command(user_input)
+        except Exception as e:
+            ticket.release(record_latency=False)
+            return jsonify({"error": str(e)}), 500
+        if not ai_confident:
+            ticket.release(record_latency=False)
+            return jsonify({
+                'user_input': user_input,
+                'interpreted_command': command,
+                'ai_explanation': ai_explanation,
+                'error': 'AI yorumlama güven seviyesi düşük',
+                'success': False
+            }), 422
+    
+    def sse(event: str, payload: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    
+    def generate():
+        yield sse('start', {
+            'user_input': user_input,
+            'interpreted_command': command,
+            'ai_explanation': ai_explanation
+        })
+        for frame in rebel_manager.stream_command(command, user_input=user_input if user_input != command else None):
+            event = frame.pop('event')
+            yield sse(event, frame)
+    
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    response.call_on_close(lambda: ticket.release(record_latency=False))
+    return response
+
+
+@app.route("/api/output/<handle>", methods=["GET"])
+@require_auth(admin=False)
+def api_get_output_range(handle):
+    """Diske taşan çıktının bayt aralığını döndür (?offset=&length=)"""
+    try:
+        offset = request.args.get('offset', 0, type=int)
+        length = request.args.get('length', 65536, type=int)
+        data, total = rebel_manager.executor.output_store.read_range(handle, offset, length)
+        
+        response = Response(data, mimetype='text/plain; charset=utf-8')
+        response.headers['X-Output-Size'] = str(total)
+        response.headers['X-Output-Offset'] = str(max(0, offset))
+        response.headers['X-Next-Offset'] = str(max(0, offset) + len(data))
+        return response
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except FileNotFoundError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@app.route("/api/output/<handle>/lines", methods=["GET"])
+@require_auth(admin=False)
+def api_get_output_lines(handle):
+    """Diske taşan çıktının satır sayfasını döndür (?start=&count=)"""
+    try:
+        start = request.args.get('start', 0, type=int)
+        count = request.args.get('count', 500, type=int)
+        return jsonify(rebel_manager.executor.output_store.read_lines(handle, start, count))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except FileNotFoundError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@app.route("/api/jobs", methods=["POST"])
+@require_auth(admin=False)
+def api_submit_job():
+    """Komutu arka plan işi olarak kuyruğa ekle"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "JSON data required"}), 400
+        
+        user_input = data.get("command", "").strip()
+        use_ai = data.get("use_ai", True)
+        use_scheduler = data.get("use_scheduler", True)
+        
+        if not user_input:
+            return jsonify({"error": "Command required"}), 400
+        
+        try:
+            rebel_manager._validate_user_input(user_input)
+        except ValueError as e:
+            return jsonify({"error": f"Geçersiz girdi: {str(e)}"}), 400
+        
+        job = rebel_manager.job_manager.submit(user_input, use_ai, use_scheduler)
+        
+        response = jsonify(job)
+        response.status_code = 202
+        response.headers['Location'] = f"/api/jobs/{job['job_id']}"
+        return response
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+@require_auth(admin=False)
+def api_get_job(job_id):
+    """İş durumu ve (ara) sonuçları"""
+    job = rebel_manager.job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
+
+
+@app.route("/api/jobs/<job_id>", methods=["DELETE"])
+@require_auth(admin=False)
+def api_cancel_job(job_id):
+    """İşi iptal et"""
+    job = rebel_manager.job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    if job['status'] != 'cancelled':
+        return jsonify({"error": f"Job already {job['status']}", "job": job}), 409
+    return jsonify(job)
+
+
 @app.route("/api/admin/execute", methods=["POST"])
 @require_auth(admin=True)
+@require_admission
 def api_admin_execute():
     """Admin komut çalıştırma API"""
     try:
@@ -684,8 +1112,10 @@ def api_admin_execute():
         if not command:
             return jsonify({"error": "Command required"}), 400
         
-        # Admin komutu çalıştır (güvenlik kısıtlaması yok)
-        result = rebel_manager.execute_command(command, is_admin=True)
+        # Admin komutu çalıştır (istemci bağlantıyı kapatırsa çalışan süreç öldürülür)
+        token = CancellationToken()
+        with DisconnectWatcher(request.environ, token):
+            result = rebel_manager.execute_command(command, is_admin=True, cancel_token=token)
         
         return jsonify(result)
         
@@ -696,8 +1126,37 @@ def api_admin_execute():
 @app.route("/api/history", methods=["GET"])
 @require_auth(admin=False)
 def api_get_history():
-    """Komut geçmişi"""
-    return jsonify(rebel_manager.command_history[-50:])  # Son 50 komut
+    """
+    Komut geçmişi, en yeniden eskiye imleçli sayfalama
+
+    ?limit=N&before=<önceki sayfanın next_before değeri>&command=<tam komut>
+    """
+    if 'q' in request.args:
+        return jsonify({"error": "Önek araması için /api/history/suggest?q= kullanın"}), 400
+    try:
+        before, limit = (
+            int(request.args[name]) if request.args.get(name) else None for name in ('before', 'limit')
+        )
+    except ValueError:
+        return jsonify({"error": "before ve limit tam sayı olmalı"}), 400
+    
+    return jsonify(rebel_manager.history_store.page(before, limit, request.args.get('command') or None))
+
+
+@app.route("/api/history/suggest", methods=["GET"])
+@require_auth(admin=False, rate_limited=False)
+def api_history_suggest():
+    """Geçmiş komut / doğal dil girdisi önerileri (?q=<önek>&limit=N)"""
+    try:
+        limit = int(request.args['limit']) if request.args.get('limit') else None
+    except ValueError:
+        return jsonify({"error": "limit tam sayı olmalı"}), 400
+    
+    query = request.args.get('q', '')
+    return jsonify({
+        'query': query,
+        'suggestions': rebel_manager.history_suggest.suggest(query, limit)
+    })
 
 
 @app.route("/api/favorites", methods=["GET"])
@@ -716,24 +1175,120 @@ def api_get_status():
         'shell': rebel_manager.platform_config['shell'],
         'ai_status': rebel_manager.ai_engine.get_ai_status(),
         'scheduler_enabled': rebel_manager.config.get('scheduler', {}).get('enabled', True),
-        'command_count': len(rebel_manager.command_history),
+        'command_count': rebel_manager.history_store.count(),
+        'history': rebel_manager.history_store.get_status(),
+        'history_suggest': rebel_manager.history_suggest.get_status(),
+        'executor': rebel_manager.executor.get_status(),
+        'jobs': rebel_manager.job_manager.get_status(),
+        'result_cache': rebel_manager.result_cache.get_status(),
+        'executables': rebel_manager.executable_table.get_status(),
+        'native_commands': rebel_manager.native_commands.get_status(),
+        'timeouts': rebel_manager.adaptive_timeouts.get_status(),
+        'validator': rebel_manager.validator.get_status(),
+        'rate_limit': rebel_manager.rate_limiter.get_status(),
+        'admission': rebel_manager.admission.get_status(),
+        'tokens': rebel_manager.token_registry.get_status(),
+        'log_writer': rebel_manager.log_writer.get_status() if hasattr(rebel_manager, 'log_writer') else None,
+        'command_resources': rebel_manager.scheduler.get_observed_stats(),
         'uptime': datetime.datetime.now().isoformat()
     })
 
 
+def _gzip_file_stream(path: str, size: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Dosyanın ilk size baytını gzip olarak akıt (büyüyen log tamamlanmış kesitle sınırlı)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip başlığı
+    with open(path, 'rb') as f:
+        remaining = size
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+    yield compressor.flush()
+
+
 @app.route("/api/logs", methods=["GET"])
 @require_auth(admin=True)
 def api_get_logs():
-    """Log dosyasını döndür"""
+    """
+    Ham log indirme
+    
+    Etkin dosya: HTTP Range desteklenir; Range yoksa ve istemci kabul ediyorsa
+    gzip ile sıkıştırılarak akıtılır. ?segment=<ad>: döndürülmüş segmenti
+    sıkıştırılmış haliyle indirir (Range destekli).
+    """
     try:
-        if os.path.exists(rebel_manager.log_file):
-            return send_file(rebel_manager.log_file, as_attachment=True, download_name="rebel_ai_logs.txt")
-        else:
+        segment = request.args.get('segment')
+        if segment:
+            path = rebel_manager.log_store.segment_path(segment)
+            if path is None or not os.path.exists(path):
+                return jsonify({"error": "Segment not found"}), 404
+            return send_file(path, as_attachment=True, download_name=segment,
+                             mimetype='application/octet-stream', conditional=True)
+        
+        if not os.path.exists(rebel_manager.log_file):
             return jsonify({"error": "Log file not found"}), 404
+        
+        accepts_gzip = 'gzip' in request.headers.get('Accept-Encoding', '')
+        if accepts_gzip and 'Range' not in request.headers:
+            size = os.path.getsize(rebel_manager.log_file)
+            response = Response(
+                _gzip_file_stream(rebel_manager.log_file, size),
+                mimetype='application/x-ndjson'
+            )
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['Content-Disposition'] = 'attachment; filename=rebel_ai_logs.jsonl'
+            return response
+        
+        # conditional=True: Range / If-Range / 206 Partial Content
+        return send_file(rebel_manager.log_file, as_attachment=True, download_name="rebel_ai_logs.jsonl",
+                         mimetype='application/x-ndjson', conditional=True)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/logs/query", methods=["GET"])
+@require_auth(admin=True)
+def api_query_logs():
+    """Zaman indeksli log sorgusu (?since=&until=&command=&success=&limit=)"""
+    try:
+        since = parse_time(request.args.get('since'))
+        until = parse_time(request.args.get('until'))
+        limit = request.args.get('limit', type=int)
+        success_arg = request.args.get('success')
+        if success_arg in (None, ''):
+            success = None
+        elif success_arg.lower() in ('true', '1'):
+            success = True
+        elif success_arg.lower() in ('false', '0'):
+            success = False
+        else:
+            raise ValueError("success true ya da false olmalı")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    # Henüz kuyrukta bekleyen kayıtlar da sonuçta görünsün
+    rebel_manager.log_writer.flush(timeout=1.0)
+    return jsonify(rebel_manager.log_store.query(
+        since=since,
+        until=until,
+        command=request.args.get('command') or None,
+        success=success,
+        limit=limit
+    ))
+
+
+@app.route("/api/logs/segments", methods=["GET"])
+@require_auth(admin=True)
+def api_list_log_segments():
+    """Döndürülmüş log segmentleri ve zaman aralıkları"""
+    return jsonify({'segments': rebel_manager.log_store.list_segments()})
+
+
 @app.route("/healthz", methods=["GET"])
 def health_check():
     """Sağlık kontrolü"""
@@ -0,0 +1,371 @@
+# ==========================================
+# 📊 REBEL AI Log Stats - Komut Gecikme Yüzdelikleri
+# ==========================================
+# Log dosyalarını (NDJSON kayıtları, sıkıştırılmış segmentler ve eski
+# köşeli parantezli metin biçimi) satır satır akıtır; kayıtları sabit
+# boyutlu parçalar halinde NumPy sütunlarına alır ve grup başına sayaç +
+# logaritmik kovalı gecikme histogramına ekler. Bellek kullanımı log
+# boyutuna değil grup sayısına bağlıdır; yüzdelikler histogramdan
+# (kova genişliği kadar göreli hatayla) hesaplanır.
+#
+# Kullanım:
+#   python -m rebel_logstats                              # config'teki log + segmentler
+#   python -m rebel_logstats --group-by hour --since 7d
+#   python -m rebel_logstats --group-by platform --json eski_log.txt
+
+import os
+import re
+import sys
+import json
+import argparse
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional
+import numpy as np
+import yaml
+
+from json_log_writer import load_manifest, open_segment
+from log_store import parse_time
+
+
+GROUP_BY = ('command', 'hour', 'platform')
+PERCENTILES = (50.0, 90.0, 99.0)
+
+# Eski metin biçimi: "[2025-09-14 20:20:31.215773] CMD: ls" ve ardından OUTPUT:/ERROR: blokları
+LEGACY_LINE = re.compile(rb"^\[(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?)\] (.*)$")
+LEGACY_COMMAND = "CMD: "
+LEGACY_ERROR = b"ERROR:"
+DECODER = json.JSONDecoder()
+
+
+class _GroupStats:
+    """Tek grubun birikmiş sayaçları ve gecikme histogramı"""
+
+    __slots__ = ('count', 'errors', 'timed', 'total_time', 'min_time', 'max_time', 'histogram')
+
+    def __init__(self, bins: int):
+        self.count = 0
+        self.errors = 0
+        self.timed = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+        self.histogram = np.zeros(bins, dtype=np.int64)
+
+
+class REBELLogStats:
+    """Parça parça NumPy toplama ile log istatistikleri"""
+
+    def __init__(self, group_by: str = 'command', config_path: str = "rebel_config.yaml"):
+        """
+        Log stats başlatıcı
+
+        group_by: 'command' (temel komut), 'hour' (YYYY-MM-DDTHH) ya da 'platform'
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Geçersiz gruplama: {group_by} ({', '.join(GROUP_BY)})")
+        self.config = self._load_config(config_path)
+        self.log_config = self.config.get('logging', {})
+        self.stats_config = self.log_config.get('stats', {})
+        self.chunk_size = self.stats_config.get('chunk_size', 65536)
+        self.bins = self.stats_config.get('histogram_bins', 2000)
+        min_seconds = self.stats_config.get('histogram_min_seconds', 0.0001)
+        max_seconds = self.stats_config.get('histogram_max_seconds', 3600)
+        self.group_by = group_by
+
+        # Logaritmik kova sınırları: her kova bir öncekinden sabit oranda geniş
+        self.edges = np.logspace(np.log10(min_seconds), np.log10(max_seconds), self.bins + 1)
+        self.relative_error = float(self.edges[1] / self.edges[0] - 1)
+
+        self._groups: Dict[str, _GroupStats] = {}
+        self._keys: List[str] = []
+        self._times: List[float] = []
+        self._successes: List[bool] = []
+        self.records = 0
+        self.skipped_lines = 0
+        self.sources: List[str] = []
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}", file=sys.stderr)
+            return {}
+
+    def default_log_path(self) -> str:
+        """Sunucunun bu platformda yazdığı log dosyası"""
+        if sys.platform.startswith('win'):
+            return self.log_config.get('windows_log_path', 'D:\\rebel_logs\\cmd_manager_log.txt')
+        if sys.platform == 'darwin':
+            return self.log_config.get('macos_log_path', 'rebel_log.txt')
+        return self.log_config.get('linux_log_path', 'rebel_log.txt')
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+
+    def _group_key(self, record: Dict[str, Any]) -> str:
+        if self.group_by == 'command':
+            words = str(record.get('command') or '').split()
+            return words[0] if words else '-'
+        if self.group_by == 'hour':
+            return str(record.get('timestamp') or '-')[:13]
+        return str(record.get('platform') or 'unknown')
+
+    def _iter_lines(self, f: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """
+        Satırlardan komut kayıtları üret (iki biçim aynı dosyada karışık olabilir)
+
+        Eski biçimde süre yazılmaz: çalışma süresi CMD satırıyla bir önceki
+        zaman damgalı satır (komuttan hemen önceki plan satırı) arasındaki
+        fark olarak tahmin edilir. OUTPUT bloğundan sonra ERROR: satırı
+        gelirse komut başarısız sayılır.
+        """
+        pending: Optional[Dict[str, Any]] = None
+        previous_timestamp: Optional[str] = None
+
+        for line in f:
+            line = line.rstrip(b'\r\n')
+            if line.startswith(b'{'):
+                if pending is not None:
+                    yield pending
+                    pending = None
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Eski yazıcı kaydın ardına kaçışlı '\\n' ve metin log satırı ekliyordu
+                    try:
+                        record, _ = DECODER.raw_decode(line.decode('utf-8', errors='replace'))
+                    except ValueError:
+                        self.skipped_lines += 1
+                        continue
+                # Başlangıç, LOG_DROPPED gibi olay kayıtları komut değildir
+                if isinstance(record, dict) and record.get('command') and 'success' in record:
+                    yield record
+                continue
+
+            match = LEGACY_LINE.match(line)
+            if match is None:
+                if pending is not None and line.startswith(LEGACY_ERROR):
+                    pending['success'] = False
+                continue
+
+            if pending is not None:
+                yield pending
+                pending = None
+            timestamp = match.group(1).decode('ascii').replace(' ', 'T')
+            message = match.group(2).decode('utf-8', errors='replace')
+            if message.startswith(LEGACY_COMMAND):
+                elapsed = None
+                if previous_timestamp is not None:
+                    elapsed = (np.datetime64(timestamp) - np.datetime64(previous_timestamp)) / np.timedelta64(1, 'us') / 1e6
+                pending = {
+                    'timestamp': timestamp,
+                    'command': message[len(LEGACY_COMMAND):],
+                    'success': True,
+                    'execution_time': elapsed,
+                    'platform': None
+                }
+            previous_timestamp = timestamp
+
+        if pending is not None:
+            yield pending
+
+    def add_file(self, path: str, since: Optional[str] = None, until: Optional[str] = None,
+                 command: Optional[str] = None, compression: Optional[str] = None) -> None:
+        """Tek dosyayı akıt (compression: 'gzip' / 'zstd' segmentler için)"""
+        opener = open_segment(path, compression) if compression else open(path, 'rb')
+        with opener as f:
+            for record in self._iter_lines(f):
+                timestamp = record.get('timestamp')
+                if (since or until) and not isinstance(timestamp, str):
+                    continue
+                if since and timestamp < since:
+                    continue
+                if until and timestamp > until:
+                    continue
+                if command and command not in str(record.get('command')):
+                    continue
+                elapsed = record.get('execution_time')
+                self._keys.append(self._group_key(record))
+                self._times.append(elapsed if isinstance(elapsed, (int, float)) and elapsed >= 0 else np.nan)
+                self._successes.append(bool(record.get('success')))
+                if len(self._keys) >= self.chunk_size:
+                    self._flush_chunk()
+        self.sources.append(path)
+
+    def add_log(self, log_path: str, since: Optional[str] = None, until: Optional[str] = None,
+                command: Optional[str] = None, include_segments: bool = True) -> None:
+        """Etkin log ve (manifestteki) sıkıştırılmış segmentleri, eskiden yeniye"""
+        if include_segments:
+            directory = os.path.dirname(log_path)
+            for segment in load_manifest(log_path)['segments']:
+                if since and segment.get('last_timestamp') and segment['last_timestamp'] < since:
+                    continue
+                if until and segment.get('first_timestamp') and segment['first_timestamp'] > until:
+                    continue
+                try:
+                    self.add_file(os.path.join(directory, segment['file']), since, until, command,
+                                  compression=segment['compression'])
+                except (OSError, EOFError, ValueError) as e:
+                    print(f"⚠️ Log segmenti okunamadı ({segment['file']}): {e}", file=sys.stderr)
+        self.add_file(log_path, since, until, command)
+
+    # ------------------------------------------------------------------
+    # Toplama
+    # ------------------------------------------------------------------
+
+    def _flush_chunk(self) -> None:
+        """Bekleyen parçayı sütunlara çevir ve grup histogramlarına ekle"""
+        if not self._keys:
+            return
+        keys = np.array(self._keys, dtype=object)
+        times = np.array(self._times, dtype=np.float64)
+        failures = ~np.array(self._successes, dtype=bool)
+        self.records += len(keys)
+        self._keys, self._times, self._successes = [], [], []
+
+        groups, inverse = np.unique(keys, return_inverse=True)
+        size = len(groups)
+        counts = np.bincount(inverse, minlength=size)
+        errors = np.bincount(inverse, weights=failures, minlength=size)
+
+        timed = ~np.isnan(times)
+        timed_inverse = inverse[timed]
+        timed_values = times[timed]
+        timed_counts = np.bincount(timed_inverse, minlength=size)
+        sums = np.bincount(timed_inverse, weights=timed_values, minlength=size)
+        minimums = np.full(size, np.inf)
+        maximums = np.zeros(size)
+        np.minimum.at(minimums, timed_inverse, timed_values)
+        np.maximum.at(maximums, timed_inverse, timed_values)
+
+        # Aralık dışı süreler uç kovalara sıkıştırılır; kesin min/max ayrıca tutulur
+        buckets = np.clip(np.searchsorted(self.edges, timed_values, side='right') - 1, 0, self.bins - 1)
+        histograms = np.bincount(timed_inverse * self.bins + buckets, minlength=size * self.bins)
+        histograms = histograms.reshape(size, self.bins)
+
+        for i, key in enumerate(groups):
+            stats = self._groups.get(key)
+            if stats is None:
+                stats = self._groups[key] = _GroupStats(self.bins)
+            stats.count += int(counts[i])
+            stats.errors += int(errors[i])
+            stats.timed += int(timed_counts[i])
+            stats.total_time += float(sums[i])
+            stats.min_time = min(stats.min_time, float(minimums[i]))
+            stats.max_time = max(stats.max_time, float(maximums[i]))
+            stats.histogram += histograms[i]
+
+    def _percentiles(self, stats: _GroupStats) -> List[Optional[float]]:
+        """Histogramdan yüzdelikler: kova içinde logaritmik ara değer, kesin min/max ile sınırlı"""
+        if stats.timed == 0:
+            return [None] * len(PERCENTILES)
+        cumulative = np.cumsum(stats.histogram)
+        ranks = np.array(PERCENTILES) / 100.0 * stats.timed
+        indexes = np.minimum(np.searchsorted(cumulative, ranks, side='left'), self.bins - 1)
+        before = np.where(indexes > 0, cumulative[indexes - 1], 0)
+        fractions = (ranks - before) / np.maximum(stats.histogram[indexes], 1)
+        lower = self.edges[indexes]
+        values = lower * (self.edges[indexes + 1] / lower) ** np.clip(fractions, 0.0, 1.0)
+        return [float(v) for v in np.clip(values, stats.min_time, stats.max_time)]
+
+    def summary(self) -> Dict[str, Any]:
+        """Grup başına sayı, hata oranı, ortalama ve p50/p90/p99 (kayıt sayısına göre azalan)"""
+        self._flush_chunk()
+        rows = []
+        for key, stats in self._groups.items():
+            p50, p90, p99 = self._percentiles(stats)
+            rows.append({
+                self.group_by: key,
+                'count': stats.count,
+                'errors': stats.errors,
+                'error_rate': stats.errors / stats.count if stats.count else 0.0,
+                'timed': stats.timed,
+                'mean': stats.total_time / stats.timed if stats.timed else None,
+                'min': stats.min_time if stats.timed else None,
+                'p50': p50,
+                'p90': p90,
+                'p99': p99,
+                'max': stats.max_time if stats.timed else None
+            })
+        rows.sort(key=lambda row: (-row['count'], row[self.group_by]))
+        return {
+            'group_by': self.group_by,
+            'records': self.records,
+            'skipped_lines': self.skipped_lines,
+            'relative_error': self.relative_error,
+            'sources': self.sources,
+            'groups': rows
+        }
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return '-'
+    if value < 1:
+        return f"{value * 1000:.1f}ms"
+    return f"{value:.2f}s"
+
+
+def format_table(summary: Dict[str, Any], top: Optional[int] = None) -> str:
+    """Özeti hizalı metin tablosu olarak biçimlendir"""
+    group_by = summary['group_by']
+    rows = summary['groups'][:top] if top else summary['groups']
+    header = (group_by, 'count', 'errors', 'err%', 'mean', 'p50', 'p90', 'p99', 'max')
+    table = [header] + [(
+        str(row[group_by]), str(row['count']), str(row['errors']), f"{row['error_rate'] * 100:.1f}",
+        _format_seconds(row['mean']), _format_seconds(row['p50']), _format_seconds(row['p90']),
+        _format_seconds(row['p99']), _format_seconds(row['max'])
+    ) for row in rows]
+    widths = [max(len(line[i]) for line in table) for i in range(len(header))]
+    lines = ['  '.join(cell.ljust(widths[0]) if i == 0 else cell.rjust(widths[i]) for i, cell in enumerate(line))
+             for line in table]
+    lines.insert(1, '-' * len(lines[0]))
+    lines.append(f"\n{summary['records']} kayıt, {len(summary['sources'])} dosya, "
+                 f"yüzdelik hatası ≤ %{summary['relative_error'] * 100:.1f}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m rebel_logstats',
+        description='Komut başına kayıt sayısı, hata oranı ve p50/p90/p99 çalışma süresi'
+    )
+    parser.add_argument('paths', nargs='*',
+                        help='Log dosyaları (varsayılan: config\'teki log ve segmentleri)')
+    parser.add_argument('--group-by', choices=GROUP_BY, default='command')
+    parser.add_argument('--since', help="ISO 8601 ya da şimdiden geriye süre (10m, 2h, 7d)")
+    parser.add_argument('--until', help="ISO 8601 ya da şimdiden geriye süre")
+    parser.add_argument('--command', help='Komut alt metni filtresi')
+    parser.add_argument('--top', type=int, help='Yalnızca en çok kayıtlı N grup')
+    parser.add_argument('--no-segments', action='store_true', help='Sıkıştırılmış segmentleri okuma')
+    parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yaz')
+    parser.add_argument('--config', default='rebel_config.yaml')
+    args = parser.parse_args(argv)
+
+    try:
+        since, until = parse_time(args.since), parse_time(args.until)
+    except ValueError as e:
+        parser.error(str(e))
+
+    stats = REBELLogStats(args.group_by, args.config)
+    try:
+        for path in args.paths or [stats.default_log_path()]:
+            stats.add_log(path, since, until, args.command, include_segments=not args.no_segments)
+    except OSError as e:
+        print(f"❌ Log okunamadı: {e}", file=sys.stderr)
+        return 1
+
+    summary = stats.summary()
+    if args.json:
+        summary['groups'] = summary['groups'][:args.top] if args.top else summary['groups']
+        json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(format_table(summary, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# ==========================================
+# 🗃️ REBEL AI Result Cache - Komut Sonuç Önbelleği
+# ==========================================
+# Salt-okunur komutların sonuçlarını komut başına TTL ile saklar (LRU)
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import yaml
+
+
+class REBELResultCache:
+    """Yalnızca açıkça işaretlenmiş komutlar için TTL + LRU sonuç önbelleği"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Result cache başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.cache_config = self.config.get('scheduler', {}).get('result_cache', {})
+        self.enabled = self.cache_config.get('enabled', True)
+        self.max_entries = self.cache_config.get('max_entries', 512)
+
+        # Temel komut -> TTL (saniye); listede olmayan komut asla önbelleğe alınmaz
+        self.ttl_seconds: Dict[str, float] = {
+            str(command): float(ttl)
+            for command, ttl in (self.cache_config.get('ttl_seconds') or {}).items()
+            if ttl and float(ttl) > 0
+        }
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        print(f"🗃️ REBEL Result Cache initialized ({len(self.ttl_seconds)} cacheable commands)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def is_cacheable(self, argv: List[str]) -> bool:
+        """Komut önbelleğe alınabilir mi?"""
+        return self.enabled and bool(argv) and argv[0] in self.ttl_seconds
+
+    def _key(self, argv: List[str], cwd: str, platform_name: str) -> Tuple:
+        return (tuple(argv), cwd, platform_name)
+
+    def get(self, argv: List[str], cwd: str, platform_name: str) -> Optional[Dict[str, Any]]:
+        """Geçerli bir önbellek kaydı varsa sonucun kopyasını döndür"""
+        if not self.is_cacheable(argv):
+            return None
+
+        key = self._key(argv, cwd, platform_name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, argv: List[str], cwd: str, platform_name: str, result: Dict[str, Any]) -> None:
+        """Başarılı ve tamamı bellekte olan sonucu sakla"""
+        if not self.is_cacheable(argv):
+            return
+        if result.get('returncode') != 0 or result.get('stdout_truncated') or result.get('stderr_truncated'):
+            return
+
+        key = self._key(argv, cwd, platform_name)
+        expires_at = time.monotonic() + self.ttl_seconds[argv[0]]
+        with self._lock:
+            self._entries[key] = (expires_at, dict(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Önbellek istatistikleri"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    cache = REBELResultCache()
+
+    print("🗃️ REBEL Result Cache Test")
+    print("=" * 40)
+
+    argv = ["whoami"]
+    print(f"İlk okuma: {cache.get(argv, '/tmp', 'linux')}")
+    cache.put(argv, '/tmp', 'linux', {'stdout': 'rebel\n', 'stderr': '', 'returncode': 0})
+    print(f"İkinci okuma: {cache.get(argv, '/tmp', 'linux')}")
+    print(f"ls önbelleğe alınabilir mi: {cache.is_cacheable(['ls', '-la'])}")
+    print(f"\n📊 Durum: {cache.get_status()}")
@@ -0,0 +1,176 @@
+# ==========================================
+# 🔗 REBEL AI Single Flight - Eşzamanlı İstek Birleştirme
+# ==========================================
+# Aynı anahtarla zaten çalışan bir iş varsa yeni çağıranlar ona bağlanır:
+# tek süreç çalışır, sonuç (veya canlı çıktı) tüm bekleyenlere dağıtılır.
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class StreamBroadcast:
+    """Tek bir akışın olaylarını birden çok aboneye dağıtan yayın"""
+
+    def __init__(self, replay_limit: int = 1000):
+        self._lock = threading.Lock()
+        self._subscribers: List[queue.Queue] = []
+        # Geç bağlanan aboneler için son satırlar (sınırsız büyümesin)
+        self._history: deque = deque(maxlen=replay_limit)
+        self._final: Optional[Tuple[str, Any]] = None
+        self.future: Optional[Future] = None
+
+    def put(self, item: Tuple[str, Any]) -> None:
+        """Olayı tüm abonelere ilet (queue.Queue.put ile aynı imza)"""
+        with self._lock:
+            if item[0] in ('exit', 'error'):
+                self._final = item
+            else:
+                self._history.append(item)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.put(item)
+
+    def subscribe(self) -> Optional[queue.Queue]:
+        """Yeni abone ekle; akış zaten bittiyse None döner"""
+        with self._lock:
+            if self._final is not None:
+                return None
+            subscriber: queue.Queue = queue.Queue()
+            for item in self._history:
+                subscriber.put(item)
+            self._subscribers.append(subscriber)
+            return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> int:
+        """Aboneyi çıkar, kalan abone sayısını döndür"""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            return len(self._subscribers)
+
+
+class SingleFlight:
+    """Anahtar başına en fazla bir çalışan iş; sonraki çağıranlar aynı Future'ı paylaşır"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._waiters: Dict[Hashable, int] = {}  # Future başına bekleyen çağıran sayısı
+        self._streams: Dict[Hashable, StreamBroadcast] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def submit(self, key: Hashable, start: Callable[[], Future]) -> Tuple[Future, bool]:
+        """
+        Anahtar için çalışan Future varsa onu, yoksa start() ile yenisini döndür
+
+        Returns:
+            Tuple[Future, paylaşıldı_mı]
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                self._waiters[key] += 1
+                return future, True
+            future = start()
+            self._calls[key] = future
+            self._waiters[key] = 1
+            self.leaders += 1
+
+        future.add_done_callback(lambda done: self._forget_call(key, done))
+        return future, False
+
+    def release(self, key: Hashable, future: Future) -> None:
+        """Çağıran vazgeçti; başka bekleyen kalmadıysa işi iptal et"""
+        with self._lock:
+            if self._calls.get(key) is not future:
+                return
+            self._waiters[key] -= 1
+            if self._waiters[key] > 0:
+                return
+            # Kimse beklemiyor: yeni gelenler bu işe bağlanmasın
+            del self._calls[key]
+            del self._waiters[key]
+        future.cancel()
+
+    def subscribe(self, key: Hashable, start: Callable[[StreamBroadcast], Future],
+                  replay_limit: int = 1000) -> Tuple[StreamBroadcast, queue.Queue, bool]:
+        """
+        Anahtar için süren akışa abone ol; yoksa start(yayın) ile yeni akış başlat
+
+        Returns:
+            Tuple[yayın, abone kuyruğu, paylaşıldı_mı]
+        """
+        with self._lock:
+            broadcast = self._streams.get(key)
+            subscriber = broadcast.subscribe() if broadcast is not None else None
+            if subscriber is not None:
+                self.coalesced += 1
+                return broadcast, subscriber, True
+
+            broadcast = StreamBroadcast(replay_limit)
+            subscriber = broadcast.subscribe()
+            broadcast.future = start(broadcast)
+            self._streams[key] = broadcast
+            self.leaders += 1
+
+        broadcast.future.add_done_callback(lambda done: self._forget(self._streams, key, broadcast))
+        return broadcast, subscriber, False
+
+    def unsubscribe(self, key: Hashable, broadcast: StreamBroadcast, subscriber: queue.Queue) -> None:
+        """Aboneliği bitir; son abone de ayrıldıysa akışı iptal et"""
+        with self._lock:
+            if broadcast.unsubscribe(subscriber) > 0:
+                return
+            # Kimse dinlemiyor: yeni gelenler bu akışa bağlanmasın
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
+        if broadcast.future is not None and not broadcast.future.done():
+            broadcast.future.cancel()
+
+    def _forget_call(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+                del self._waiters[key]
+
+    def _forget(self, table: Dict[Hashable, Any], key: Hashable, value: Any) -> None:
+        with self._lock:
+            if table.get(key) is value:
+                del table[key]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Birleştirme istatistikleri"""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'in_flight_streams': len(self._streams),
+                'leaders': self.leaders,
+                'coalesced': self.coalesced
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    flight = SingleFlight()
+    pool = ThreadPoolExecutor(max_workers=4)
+
+    print("🔗 REBEL Single Flight Test")
+    print("=" * 40)
+
+    def slow_ps():
+        time.sleep(0.5)
+        return {'stdout': 'ps çıktısı', 'returncode': 0}
+
+    futures = [flight.submit(('ps', 'aux'), lambda: pool.submit(slow_ps)) for _ in range(30)]
+    shared = sum(1 for _, was_shared in futures if was_shared)
+    print(f"30 çağrı, paylaşılan: {shared}, aynı sonuç: {len({id(f.result()) for f, _ in futures}) == 1}")
+    print(f"\n📊 Durum: {flight.get_status()}")
+    pool.shutdown()
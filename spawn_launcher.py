@@ -0,0 +1,176 @@
+# ==========================================
+# 🚀 REBEL AI Spawn Launcher - Küçük Süreç Başlatıcı
+# ==========================================
+# Web sürecinden ayrı, önceden başlatılmış hafif bir süreç.
+# Soket üzerinden gelen argv/env/cwd isteklerini posix_spawn ile çalıştırır,
+# çıktı pipe'larının okuma uçlarını SCM_RIGHTS ile geri gönderir ve
+# çocukları wait4 ile toplayıp çıkış durumunu bildirir. Her çocuk kendi
+# oturumunda (pgid == pid) başlar; sinyaller tüm gruba gönderilir.
+#
+# Bilinçli olarak yalnızca standart kütüphane kullanır: sürecin RSS'i küçük
+# kalmalı ki spawn maliyeti web sürecinin belleğinden bağımsız olsun.
+
+import os
+import sys
+import json
+import shutil
+import socket
+import signal
+import threading
+from typing import Dict, Any, List, Optional
+
+MAX_MESSAGE_SIZE = 256 * 1024
+
+
+def rusage_to_dict(rusage) -> Dict[str, Any]:
+    """wait4 rusage yapısını JSON uyumlu sözlüğe çevir"""
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    max_rss_kb = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+    return {
+        'user_time': rusage.ru_utime,
+        'system_time': rusage.ru_stime,
+        'max_rss_kb': max_rss_kb,
+        'voluntary_ctx_switches': rusage.ru_nvcsw,
+        'involuntary_ctx_switches': rusage.ru_nivcsw
+    }
+
+
+class SpawnLauncher:
+    """posix_spawn tabanlı başlatıcı döngüsü"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._lock = threading.Lock()  # spawn + yanıt gönderimi ve çıkış bildirimi sırası
+        self._children: Dict[int, str] = {}  # pid -> istek id
+        self._child_added = threading.Event()
+        self._devnull = os.open(os.devnull, os.O_RDONLY)
+
+    def _send(self, message: Dict[str, Any], fds: Optional[List[int]] = None) -> None:
+        data = json.dumps(message).encode('utf-8')
+        if fds:
+            socket.send_fds(self.sock, [data], fds)
+        else:
+            self.sock.send(data)
+
+    def _spawn(self, request: Dict[str, Any]) -> None:
+        """İsteği çalıştır, pid ve pipe okuma uçlarını gönder"""
+        request_id = request['id']
+        argv = request['argv']
+        env = request.get('env') or {}
+
+        executable = request.get('executable') or argv[0]
+        if os.sep not in executable:
+            executable = shutil.which(executable, path=env.get('PATH', os.defpath))
+        if not executable:
+            self._send({'op': 'spawned', 'id': request_id, 'error': f"Komut bulunamadı: {argv[0]}"})
+            return
+
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        try:
+            with self._lock:
+                try:
+                    # posix_spawn chdir desteklemez; istekler kilit altında sıralı olduğu için güvenli
+                    if request.get('cwd'):
+                        os.chdir(request['cwd'])
+                    pid = os.posix_spawn(
+                        executable,
+                        argv,
+                        env,
+                        file_actions=[
+                            (os.POSIX_SPAWN_DUP2, self._devnull, 0),
+                            (os.POSIX_SPAWN_DUP2, out_write, 1),
+                            (os.POSIX_SPAWN_DUP2, err_write, 2),
+                        ],
+                        setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+                        setsid=True
+                    )
+                except OSError as e:
+                    self._send({'op': 'spawned', 'id': request_id, 'error': f"Komut çalıştırma hatası: {e}"})
+                    return
+
+                self._children[pid] = request_id
+                self._send({'op': 'spawned', 'id': request_id, 'pid': pid}, [out_read, err_read])
+                self._child_added.set()
+        finally:
+            for fd in (out_read, out_write, err_read, err_write):
+                os.close(fd)
+
+    def _kill_group(self, pid: int, sig: Optional[int] = None) -> None:
+        if sig is None:
+            sig = signal.SIGKILL
+        try:
+            os.killpg(pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _kill(self, request: Dict[str, Any]) -> None:
+        """Hâlâ yaşayan çocuğun süreç grubuna sinyal gönder (pid yeniden kullanımına karşı kontrol edilir)"""
+        with self._lock:
+            for pid, request_id in self._children.items():
+                if request_id == request['id']:
+                    self._kill_group(pid, request.get('signal', signal.SIGKILL))
+                    break
+
+    def _reap_loop(self) -> None:
+        """Biten çocukları wait4 ile topla ve çıkış durumunu bildir"""
+        while True:
+            self._child_added.clear()
+            try:
+                pid, status, rusage = os.wait4(-1, 0)
+            except ChildProcessError:
+                self._child_added.wait()
+                continue
+
+            with self._lock:
+                request_id = self._children.pop(pid, None)
+                if request_id is None:
+                    continue
+                # Lider çıktı: geride kalan torunları da sonlandır
+                self._kill_group(pid)
+                try:
+                    self._send({
+                        'op': 'exited',
+                        'id': request_id,
+                        'returncode': os.waitstatus_to_exitcode(status),
+                        'rusage': rusage_to_dict(rusage)
+                    })
+                except OSError:
+                    return
+
+    def serve(self) -> None:
+        """Ana döngü: soket kapanana kadar istekleri işle"""
+        threading.Thread(target=self._reap_loop, name="rebel-launcher-reaper", daemon=True).start()
+
+        # Datagram soketlerde karşı taraf kapanınca EOF gelmez; ebeveyni ayrıca izle
+        parent_pid = os.getppid()
+        self.sock.settimeout(2.0)
+
+        while True:
+            try:
+                data = self.sock.recv(MAX_MESSAGE_SIZE)
+            except socket.timeout:
+                if os.getppid() != parent_pid:
+                    break
+                continue
+            except OSError:
+                break
+            if not data:
+                break
+
+            request = json.loads(data)
+            if request.get('op') == 'spawn':
+                self._spawn(request)
+            elif request.get('op') == 'kill':
+                self._kill(request)
+
+        # Web süreci gitti: kalan çocukları sonlandır
+        with self._lock:
+            for pid in list(self._children):
+                self._kill_group(pid)
+
+
+if __name__ == "__main__":
+    launcher_fd = int(sys.argv[1])
+    os.set_inheritable(launcher_fd, False)
+    SpawnLauncher(socket.socket(fileno=launcher_fd)).serve()
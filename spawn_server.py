@@ -0,0 +1,214 @@
+# ==========================================
+# 🚀 REBEL AI Spawn Server - Başlatıcı İstemcisi
+# ==========================================
+# spawn_launcher.py sürecini başlatır ve komut isteklerini ona iletir.
+# Web süreci fork etmez; pipe'lar launcher'dan SCM_RIGHTS ile gelir.
+
+import os
+import sys
+import json
+import signal
+import socket
+import subprocess
+import threading
+import itertools
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+import yaml
+
+from spawn_launcher import MAX_MESSAGE_SIZE
+
+
+class REBELSpawnServer:
+    """Önceden başlatılmış launcher sürecine argv/env/cwd gönderen istemci"""
+
+    def __init__(self, config_path: str = "rebel_config.yaml"):
+        """Spawn server istemcisi başlatıcı"""
+        self.config = self._load_config(config_path)
+        self.launcher_config = self.config.get('execution', {}).get('launcher', {})
+        self.supported = (
+            os.name == 'posix'
+            and hasattr(os, 'posix_spawn')
+            and hasattr(socket, 'send_fds')
+        )
+        self.enabled = self.launcher_config.get('enabled', False) and self.supported
+        self.available = False
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._exits: Dict[str, Future] = {}
+        self._sock: Optional[socket.socket] = None
+        self._process: Optional[subprocess.Popen] = None
+
+        if self.enabled:
+            try:
+                self.start()
+            except Exception as e:
+                print(f"⚠️ Spawn launcher başlatılamadı, doğrudan çalıştırma kullanılacak: {e}")
+
+        print(f"🚀 REBEL Spawn Server {'active' if self.available else 'disabled'}")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def start(self) -> None:
+        """Launcher sürecini başlat"""
+        try:
+            parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        except (AttributeError, OSError):
+            # macOS vb.: SEQPACKET yok, mesaj sınırlarını koruyan DGRAM kullan
+            parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+        launcher_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spawn_launcher.py')
+        try:
+            # -S: site modülü yüklenmez, launcher olabildiğince küçük kalır
+            self._process = subprocess.Popen(
+                [sys.executable, '-S', launcher_path, str(child_sock.fileno())],
+                pass_fds=[child_sock.fileno()],
+                stdin=subprocess.DEVNULL,
+                close_fds=True
+            )
+        finally:
+            child_sock.close()
+
+        self._sock = parent_sock
+        self.available = True
+        threading.Thread(target=self._reader_loop, name="rebel-spawn-reader", daemon=True).start()
+
+    def _reader_loop(self) -> None:
+        """Launcher'dan gelen 'spawned' ve 'exited' mesajlarını ilgili Future'lara dağıt"""
+        while True:
+            try:
+                data, fds, _, _ = socket.recv_fds(self._sock, MAX_MESSAGE_SIZE, 2)
+            except OSError:
+                data, fds = b'', []
+            if not data:
+                break
+
+            message = json.loads(data)
+            request_id = message['id']
+
+            with self._lock:
+                if message['op'] == 'spawned':
+                    future = self._pending.pop(request_id, None)
+                    if 'error' in message:
+                        exit_future = self._exits.pop(request_id, None)
+                    else:
+                        exit_future = self._exits.get(request_id)
+                else:
+                    future = self._exits.pop(request_id, None)
+                    exit_future = None
+
+            if message['op'] == 'spawned':
+                if 'error' in message:
+                    for fd in fds:
+                        os.close(fd)
+                    if future and not future.cancelled():
+                        future.set_exception(OSError(message['error']))
+                elif future and not future.cancelled():
+                    future.set_result({
+                        'request_id': request_id,
+                        'pid': message['pid'],
+                        'stdout_fd': fds[0],
+                        'stderr_fd': fds[1],
+                        'exit': exit_future
+                    })
+                else:
+                    # Bekleyen taraf vazgeçti: pipe'ları kapat, süreci durdur
+                    for fd in fds:
+                        os.close(fd)
+                    self.kill(request_id)
+            elif future and not future.cancelled():
+                future.set_result({
+                    'returncode': message['returncode'],
+                    'rusage': message.get('rusage', {})
+                })
+
+        # Launcher gitti: bekleyen herkesi bilgilendir
+        self.available = False
+        with self._lock:
+            waiting = list(self._pending.values()) + list(self._exits.values())
+            self._pending.clear()
+            self._exits.clear()
+        for future in waiting:
+            if not future.done():
+                future.set_exception(RuntimeError("Spawn launcher bağlantısı koptu"))
+
+    def spawn(self, argv: List[str], env: Dict[str, str], cwd: Optional[str],
+              executable: Optional[str] = None) -> Future:
+        """
+        Komutu launcher üzerinden başlat (executable: PATH araması yapılmadan çalıştırılacak dosya)
+
+        Future sonucu: {'request_id', 'pid', 'stdout_fd', 'stderr_fd', 'exit': Future}
+        'exit' Future'ı {'returncode', 'rusage'} ile tamamlanır.
+        """
+        if not self.available:
+            raise RuntimeError("Spawn launcher kullanılamıyor")
+
+        request_id = str(next(self._ids))
+        future: Future = Future()
+        with self._lock:
+            self._pending[request_id] = future
+            self._exits[request_id] = Future()
+
+        message = json.dumps({
+            'op': 'spawn',
+            'id': request_id,
+            'argv': list(argv),
+            'executable': executable,
+            'env': env,
+            'cwd': cwd
+        }).encode('utf-8')
+
+        try:
+            self._sock.send(message)
+        except OSError as e:
+            with self._lock:
+                self._pending.pop(request_id, None)
+                self._exits.pop(request_id, None)
+            raise RuntimeError(f"Spawn launcher'a istek gönderilemedi: {e}")
+
+        return future
+
+    def kill(self, request_id: str, sig: Optional[int] = None) -> None:
+        """Launcher'dan çocuğa sinyal göndermesini iste (varsayılan SIGKILL)"""
+        if not self.available:
+            return
+        if sig is None:
+            # signal.SIGKILL Windows'ta yok: import anında değil burada çözülür
+            sig = signal.SIGKILL
+        try:
+            self._sock.send(json.dumps({'op': 'kill', 'id': request_id, 'signal': int(sig)}).encode('utf-8'))
+        except OSError:
+            pass
+
+    def get_status(self) -> Dict[str, Any]:
+        """Launcher durumunu döndür"""
+        with self._lock:
+            in_flight = len(self._exits)
+        return {
+            'enabled': self.enabled,
+            'available': self.available,
+            'launcher_pid': self._process.pid if self._process else None,
+            'in_flight': in_flight
+        }
+
+    def shutdown(self) -> None:
+        """Launcher'ı kapat"""
+        self.available = False
+        if self._sock:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+        if self._process:
+            self._process.terminate()
+            self._process.wait(timeout=5)
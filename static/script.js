@@ -9,6 +9,7 @@ class REBELTerminal {
         this.currentCommand = '';
         this.commandHistory = [];
         this.historyIndex = -1;
+        this.suggestTimer = null;
         this.isExecuting = false;
         
         // DOM Elements
@@ -39,6 +40,12 @@ class REBELTerminal {
             }
         });
         
+        // History autocomplete (debounced)
+        this.commandInput.addEventListener('input', () => {
+            clearTimeout(this.suggestTimer);
+            this.suggestTimer = setTimeout(() => this.loadSuggestions(), 150);
+        });
+        
         // Command history navigation
         this.commandInput.addEventListener('keydown', (e) => {
             if (e.key === 'ArrowUp') {
@@ -217,6 +224,12 @@ class REBELTerminal {
         try {
             const useAI = document.getElementById('useAI').checked;
             const useScheduler = document.getElementById('useScheduler').checked;
+            const useStream = document.getElementById('useStream').checked;
+            
+            if (useStream) {
+                await this.executeCommandStream(command, useAI);
+                return;
+            }
             
             const response = await fetch('/api/execute', {
                 method: 'POST',
@@ -248,6 +261,104 @@ class REBELTerminal {
         }
     }
     
+    async executeCommandStream(command, useAI) {
+        const response = await fetch('/api/execute/stream', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Auth-Token': this.authToken
+            },
+            body: JSON.stringify({
+                command: command,
+                use_ai: useAI
+            })
+        });
+        
+        if (!response.ok) {
+            const error = await response.json();
+            this.addToOutput(`❌ Hata: ${error.error}`, 'error');
+            return;
+        }
+        
+        // Output is rendered as it arrives, so the overlay must not cover it
+        this.hideLoading();
+        
+        const entry = this.terminalOutput.lastElementChild;
+        const outputDiv = document.createElement('div');
+        outputDiv.className = 'command-output';
+        entry.appendChild(outputDiv);
+        
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            
+            buffer += decoder.decode(value, { stream: true });
+            
+            // SSE frames are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+                const frame = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                this.handleStreamFrame(frame, entry, outputDiv);
+            }
+        }
+    }
+    
+    handleStreamFrame(frame, entry, outputDiv) {
+        let event = 'message';
+        let data = '';
+        frame.split('\n').forEach(line => {
+            if (line.startsWith('event: ')) {
+                event = line.slice(7);
+            } else if (line.startsWith('data: ')) {
+                data += line.slice(6);
+            }
+        });
+        
+        if (!data) return;
+        const payload = JSON.parse(data);
+        
+        if (event === 'start') {
+            if (payload.ai_explanation && payload.ai_explanation !== 'AI kullanılmadı') {
+                const aiDiv = document.createElement('div');
+                aiDiv.className = 'ai-explanation';
+                aiDiv.textContent = `🤖 AI: ${payload.ai_explanation}`;
+                entry.insertBefore(aiDiv, outputDiv);
+            }
+        } else if (event === 'stdout') {
+            outputDiv.appendChild(document.createTextNode(payload.line));
+        } else if (event === 'stderr') {
+            const errorSpan = document.createElement('span');
+            errorSpan.className = 'command-error';
+            errorSpan.textContent = payload.line;
+            outputDiv.appendChild(errorSpan);
+        } else if (event === 'exit') {
+            outputDiv.classList.add(payload.success ? 'command-success' : 'command-error');
+            if (payload.error) {
+                outputDiv.appendChild(document.createTextNode(payload.error));
+            }
+            if (!outputDiv.textContent) {
+                outputDiv.textContent = payload.success ? '✅ Komut başarıyla çalıştırıldı' : '❌ Komut çalıştırma hatası';
+            }
+            
+            if (payload.output_truncated) {
+                this.appendTruncationNotice(entry, payload);
+            }
+            
+            const timingDiv = document.createElement('div');
+            timingDiv.className = 'timestamp';
+            const seconds = payload.execution_time !== undefined ? payload.execution_time.toFixed(3) : '-';
+            timingDiv.textContent = `⏱️ ${seconds}s | returncode: ${payload.returncode ?? '-'}`;
+            entry.appendChild(timingDiv);
+        }
+        
+        this.scrollToBottom();
+    }
+    
     addCommandToOutput(command) {
         const timestamp = new Date().toLocaleTimeString();
         const prompt = this.terminalPrompt.textContent;
@@ -315,6 +426,10 @@ class REBELTerminal {
             outputDiv.textContent = outputText;
             entry.appendChild(outputDiv);
             
+            if (cmdResult.output_truncated) {
+                this.appendTruncationNotice(entry, cmdResult);
+            }
+            
             // AI error analysis
             if (cmdResult.ai_error_analysis) {
                 const errorAnalysisDiv = document.createElement('div');
@@ -327,6 +442,14 @@ class REBELTerminal {
         this.scrollToBottom();
     }
     
+    appendTruncationNotice(entry, result) {
+        // Large outputs are spilled to disk server-side; only head/tail are inline
+        const noticeDiv = document.createElement('div');
+        noticeDiv.className = 'ai-explanation';
+        noticeDiv.textContent = `📦 Çıktı kısaltıldı (${result.output_bytes} bayt). Tam çıktı: /api/output/${result.output_handle}/lines`;
+        entry.appendChild(noticeDiv);
+    }
+    
     addToOutput(message, type = 'info') {
         const timestamp = new Date().toLocaleTimeString();
         const entry = document.createElement('div');
@@ -405,19 +528,55 @@ class REBELTerminal {
     
     async loadHistory() {
         try {
-            const response = await fetch('/api/history', {
+            const response = await fetch('/api/history?limit=10', {
                 headers: { 'X-Auth-Token': this.authToken }
             });
             
             if (response.ok) {
-                const history = await response.json();
-                this.displayHistory(history);
+                const page = await response.json();
+                this.displayHistory(page.items);
             }
         } catch (error) {
             console.error('History loading error:', error);
         }
     }
     
+    async loadSuggestions() {
+        const query = this.commandInput.value;
+        if (!this.authToken || !query.trim()) return;
+        
+        try {
+            const response = await fetch(`/api/history/suggest?limit=8&q=${encodeURIComponent(query)}`, {
+                headers: { 'X-Auth-Token': this.authToken }
+            });
+            
+            if (response.ok) {
+                const result = await response.json();
+                // Yanıt gelene kadar girdi değiştiyse eski önerileri gösterme
+                if (result.query === this.commandInput.value) {
+                    this.displaySuggestions(result.suggestions);
+                }
+            }
+        } catch (error) {
+            console.error('Suggestion loading error:', error);
+        }
+    }
+    
+    displaySuggestions(suggestions) {
+        const datalist = document.getElementById('commandSuggestions');
+        
+        // Clear existing content securely
+        while (datalist.firstChild) {
+            datalist.removeChild(datalist.firstChild);
+        }
+        
+        suggestions.forEach(item => {
+            const option = document.createElement('option');
+            option.value = item.text;
+            datalist.appendChild(option);
+        });
+    }
+    
     displayHistory(history) {
         const historyList = document.getElementById('historyList');
         
@@ -434,7 +593,8 @@ class REBELTerminal {
             return;
         }
         
-        history.slice(-10).reverse().forEach(item => {
+        // Sunucu en yeniden eskiye sıralı döndürür
+        history.forEach(item => {
             const itemDiv = document.createElement('div');
             itemDiv.className = 'history-item';
             itemDiv.onclick = () => this.insertCommand(item.command);
@@ -575,13 +735,14 @@ class REBELTerminal {
         content.textContent = 'Loglar yükleniyor...';
         
         try {
-            const response = await fetch('/api/logs', {
-                headers: { 'X-Admin-Token': this.authToken }
+            // Yalnızca son bir saatin kayıtları (tüm dosya indirilmez)
+            const response = await fetch('/api/logs/query?since=1h&limit=200', {
+                headers: { 'X-Auth-Token': this.authToken }
             });
             
             if (response.ok) {
-                const logs = await response.text();
-                content.textContent = logs;
+                const result = await response.json();
+                content.textContent = result.records.map(record => JSON.stringify(record)).join('\n') || 'Son bir saatte kayıt yok.';
             } else {
                 content.textContent = 'Loglar yüklenemedi. Admin yetkisi gerekebilir.';
             }
@@ -593,7 +754,7 @@ class REBELTerminal {
     async downloadLogs() {
         try {
             const response = await fetch('/api/logs', {
-                headers: { 'X-Admin-Token': this.authToken }
+                headers: { 'X-Auth-Token': this.authToken }
             });
             
             if (response.ok) {
@@ -601,7 +762,7 @@ class REBELTerminal {
                 const url = URL.createObjectURL(blob);
                 const a = document.createElement('a');
                 a.href = url;
-                a.download = `rebel-ai-logs-${new Date().toISOString().slice(0,10)}.txt`;
+                a.download = `rebel-ai-logs-${new Date().toISOString().slice(0,10)}.jsonl`;
                 document.body.appendChild(a);
                 a.click();
                 document.body.removeChild(a);
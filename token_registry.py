@@ -0,0 +1,228 @@
+# ==========================================
+# 🔑 REBEL AI Token Registry - Çoklu Servis Token'ları
+# ==========================================
+# Token'lar yalnızca SHA-256 özetleri olarak tutulur: özet -> politika
+# sözlüğünde O(1) arama, ardından hmac.compare_digest ile sabit zamanlı
+# doğrulama. Her token'ın rolü, hız sınırı ve eşzamanlılık bütçesi vardır.
+# Token dosyası değişince (mtime) yeniden yüklenir.
+#
+# rebel_tokens.yaml:
+#   tokens:
+#     - name: "ci-runner"
+#       sha256: "<hex özet>"   # python token_registry.py <token>
+#       role: "user"           # user | admin
+#       requests_per_minute: 120
+#       burst_size: 20
+#       max_concurrency: 4
+
+import os
+import hmac
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+import yaml
+
+
+ROLE_USER = 'user'
+ROLE_ADMIN = 'admin'
+ROLES = (ROLE_USER, ROLE_ADMIN)
+
+
+def token_digest(token: str) -> bytes:
+    """Token'ın SHA-256 özeti"""
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+@dataclass(frozen=True)
+class TokenPolicy:
+    """Tek bir token'ın kimliği ve bütçeleri (None: global ayar)"""
+    name: str
+    digest: bytes
+    role: str = ROLE_USER
+    requests_per_minute: Optional[float] = None
+    burst_size: Optional[float] = None
+    max_concurrency: Optional[int] = None
+
+    def allows(self, admin: bool) -> bool:
+        """Admin rotaları yalnızca admin rolüne, diğerleri tüm rollere açık"""
+        return self.role == ROLE_ADMIN or not admin
+
+
+class REBELTokenRegistry:
+    """Özet anahtarlı token politikası kayıt defteri"""
+
+    def __init__(self, auth_token: str, admin_token: str, config_path: str = "rebel_config.yaml"):
+        """
+        Token registry başlatıcı
+
+        auth_token / admin_token: ortam değişkenlerinden gelen token'lar
+        ('default' ve 'admin' adlarıyla her zaman kayıtlıdır)
+        """
+        self.config = self._load_config(config_path)
+        self.security_config = self.config.get('security', {})
+        self.token_file = self.security_config.get('token_file', 'rebel_tokens.yaml')
+        self.reload_interval = self.security_config.get('token_reload_seconds', 5)
+
+        self._builtin = [
+            TokenPolicy('default', token_digest(auth_token), ROLE_USER),
+            TokenPolicy('admin', token_digest(admin_token), ROLE_ADMIN)
+        ]
+
+        self._lock = threading.Lock()
+        self._policies: Dict[bytes, TokenPolicy] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._file_mtime: Optional[int] = None
+        self._last_check = 0.0
+        self.load_errors = 0
+
+        self.reload()
+        print(f"🔑 REBEL Token Registry initialized ({len(self._policies)} tokens)")
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """YAML yapılandırma dosyasını yükle"""
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
+        except Exception as e:
+            print(f"⚠️ Config yükleme hatası: {e}")
+            return {}
+
+    def _file_mtime_ns(self) -> Optional[int]:
+        try:
+            return os.stat(self.token_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _parse_entry(self, entry: Dict[str, Any]) -> TokenPolicy:
+        """Dosyadaki tek kaydı doğrula"""
+        name = str(entry.get('name', '')).strip()
+        if not name:
+            raise ValueError("'name' gerekli")
+        digest = bytes.fromhex(str(entry.get('sha256', '')))
+        if len(digest) != hashlib.sha256().digest_size:
+            raise ValueError(f"{name}: 'sha256' 64 karakterlik hex özet olmalı")
+        role = entry.get('role', ROLE_USER)
+        if role not in ROLES:
+            raise ValueError(f"{name}: bilinmeyen rol '{role}'")
+        return TokenPolicy(
+            name=name,
+            digest=digest,
+            role=role,
+            requests_per_minute=entry.get('requests_per_minute'),
+            burst_size=entry.get('burst_size'),
+            max_concurrency=entry.get('max_concurrency')
+        )
+
+    def reload(self) -> None:
+        """Token dosyasını (varsa) yeniden yükle; hatalı kayıtlar atlanır"""
+        mtime = self._file_mtime_ns()
+        policies = {policy.digest: policy for policy in self._builtin}
+
+        if mtime is not None:
+            try:
+                with open(self.token_file, 'r', encoding='utf-8') as f:
+                    entries = (yaml.safe_load(f) or {}).get('tokens', []) or []
+            except Exception as e:
+                entries = []
+                self.load_errors += 1
+                print(f"⚠️ Token dosyası okunamadı: {e}")
+
+            for entry in entries:
+                try:
+                    policy = self._parse_entry(entry)
+                except (ValueError, TypeError, AttributeError) as e:
+                    self.load_errors += 1
+                    print(f"⚠️ Geçersiz token kaydı atlandı: {e}")
+                    continue
+                # Ortam değişkeni token'ları dosyadaki aynı özetle ezilmez
+                policies.setdefault(policy.digest, policy)
+
+        with self._lock:
+            self._policies = policies
+            self._file_mtime = mtime
+            self._last_check = time.monotonic()
+
+    def _check_stale(self) -> None:
+        """En fazla reload_interval'da bir dosya mtime'ını kontrol et"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_check < self.reload_interval:
+                return
+            self._last_check = now
+            known_mtime = self._file_mtime
+
+        if self._file_mtime_ns() != known_mtime:
+            self.reload()
+
+    def lookup(self, token: str) -> Optional[TokenPolicy]:
+        """Token'ın politikası; bilinmeyen token için None"""
+        if not token:
+            return None
+        self._check_stale()
+        digest = token_digest(str(token))
+        policy = self._policies.get(digest)
+        # Sözlük araması bulur, sabit zamanlı karşılaştırma doğrular
+        if policy is None or not hmac.compare_digest(policy.digest, digest):
+            return None
+        return policy
+
+    def acquire(self, policy: TokenPolicy) -> bool:
+        """Token'ın eşzamanlılık bütçesinden bir slot al; bütçe doluysa False"""
+        with self._lock:
+            in_flight = self._in_flight.get(policy.name, 0)
+            if policy.max_concurrency is not None and in_flight >= policy.max_concurrency:
+                return False
+            self._in_flight[policy.name] = in_flight + 1
+            return True
+
+    def release(self, policy: TokenPolicy) -> None:
+        """acquire ile alınan slotu bırak"""
+        with self._lock:
+            remaining = self._in_flight.get(policy.name, 0) - 1
+            if remaining > 0:
+                self._in_flight[policy.name] = remaining
+            else:
+                self._in_flight.pop(policy.name, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Kayıtlı token sayısı ve anlık kullanım (özetler gösterilmez)"""
+        with self._lock:
+            roles: Dict[str, int] = {}
+            for policy in self._policies.values():
+                roles[policy.role] = roles.get(policy.role, 0) + 1
+            return {
+                'token_file': self.token_file,
+                'tokens': len(self._policies),
+                'roles': roles,
+                'in_flight': dict(self._in_flight),
+                'load_errors': self.load_errors
+            }
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        # Token dosyası için özet üret
+        print(token_digest(sys.argv[1]).hex())
+        sys.exit(0)
+
+    registry = REBELTokenRegistry("kullanici-token", "admin-token")
+
+    print("🔑 REBEL Token Registry Test")
+    print("=" * 40)
+
+    for token, admin in [("kullanici-token", False), ("kullanici-token", True),
+                         ("admin-token", True), ("bilinmeyen", False)]:
+        policy = registry.lookup(token)
+        allowed = policy is not None and policy.allows(admin)
+        print(f"{token:16} admin={admin!s:5} -> {policy.name if policy else None} izin={allowed}")
+
+    start = time.perf_counter()
+    for _ in range(100000):
+        registry.lookup("kullanici-token")
+    print(f"100000 arama: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"\n📊 Durum: {registry.get_status()}")